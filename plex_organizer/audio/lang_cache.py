@@ -0,0 +1,172 @@
+"""Persistent cache for audio language detection results.
+
+Whisper inference is the most expensive part of audio tagging. Detection
+results are stored in a small SQLite database in the data directory so that
+re-runs over unchanged files skip sampling entirely.
+
+Entries are keyed by the file's size, modification time and audio stream
+index rather than its path, so results survive the rename/move step. Files
+whose tagging finished are recorded by size and modification time as well, so
+unchanged files skip the ffprobe call on later runs. Both keys also include the
+configured Whisper model size, so switching to a larger model re-detects
+streams that a smaller one left untagged.
+"""
+
+from __future__ import annotations
+
+from contextlib import closing
+from os import stat, stat_result
+from os.path import join
+from sqlite3 import Connection, Error as SqliteError, connect
+from typing import Optional, Tuple
+
+from ..config import get_whisper_model_size
+from ..log import log_error
+from ..paths import data_dir
+
+CACHE_FILENAME = "audio_languages.db"
+
+
+def _cache_key(
+    video_path: str, audio_index: int, st: Optional[stat_result] = None
+) -> Optional[str]:
+    """Return the cache key for one audio stream, or None if *video_path* is gone."""
+    if st is None:
+        try:
+            st = stat(video_path)
+        except OSError:
+            return None
+    return f"{st.st_size}:{int(st.st_mtime)}:{audio_index}:{get_whisper_model_size()}"
+
+
+def _connect() -> Connection:
+    """Open the cache database, creating the schema on first use."""
+    conn = connect(join(data_dir(), CACHE_FILENAME), timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS languages ("
+        "key TEXT PRIMARY KEY, language TEXT, confidence REAL NOT NULL)"
+    )
+    conn.execute("CREATE TABLE IF NOT EXISTS tagged_files (key TEXT PRIMARY KEY)")
+    return conn
+
+
+def get_cached_language(
+    video_path: str, audio_index: int, st: Optional[stat_result] = None
+) -> Optional[Tuple[Optional[str], float]]:
+    """Return a cached ``(language, confidence)`` for a stream, if present.
+
+    Args:
+        video_path: Path to the media file.
+        audio_index: Zero-based audio stream index.
+        st: Pre-fetched ``os.stat`` result for *video_path*, if available.
+
+    Returns:
+        The cached detection result, or None on a cache miss or read error.
+    """
+    key = _cache_key(video_path, audio_index, st)
+    if key is None:
+        return None
+
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT language, confidence FROM languages WHERE key = ?", (key,)
+            ).fetchone()
+    except SqliteError as e:
+        log_error(f"Error reading audio language cache: {e}")
+        return None
+
+    if row is None:
+        return None
+    return (row[0], float(row[1]))
+
+
+def store_language(
+    video_path: str,
+    audio_index: int,
+    language: Optional[str],
+    confidence: float,
+    st: Optional[stat_result] = None,
+) -> None:
+    """Record a detection result for a stream (best-effort).
+
+    Args:
+        video_path: Path to the media file.
+        audio_index: Zero-based audio stream index.
+        language: Detected ISO 639-2 code, or None when detection was inconclusive.
+        confidence: Confidence reported for the decision.
+        st: Pre-fetched ``os.stat`` result for *video_path*, if available.
+    """
+    key = _cache_key(video_path, audio_index, st)
+    if key is None:
+        return
+
+    try:
+        with closing(_connect()) as conn:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO languages (key, language, confidence) "
+                    "VALUES (?, ?, ?)",
+                    (key, language, confidence),
+                )
+    except SqliteError as e:
+        log_error(f"Error writing audio language cache: {e}")
+
+
+def _file_key(video_path: str, st: Optional[stat_result] = None) -> Optional[str]:
+    """Return the tagged-file key for *video_path*, or None if it is gone."""
+    if st is None:
+        try:
+            st = stat(video_path)
+        except OSError:
+            return None
+    return f"{st.st_size}:{st.st_mtime_ns}:{get_whisper_model_size()}"
+
+
+def was_tagged(video_path: str, st: Optional[stat_result] = None) -> bool:
+    """Return True if *video_path* was fully tagged and has not changed since.
+
+    Args:
+        video_path: Path to the media file.
+        st: Pre-fetched ``os.stat`` result for *video_path*, if available.
+
+    Returns:
+        True on a cache hit; False on a miss or read error.
+    """
+    key = _file_key(video_path, st)
+    if key is None:
+        return False
+
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT 1 FROM tagged_files WHERE key = ?", (key,)
+            ).fetchone()
+    except SqliteError as e:
+        log_error(f"Error reading audio language cache: {e}")
+        return False
+    return row is not None
+
+
+def mark_tagged(video_path: str) -> None:
+    """Record that *video_path* needs no further tagging (best-effort).
+
+    The file is stat'ed again so the entry matches it after any metadata
+    rewrite.
+
+    Args:
+        video_path: Path to the media file.
+    """
+    key = _file_key(video_path)
+    if key is None:
+        return
+
+    try:
+        with closing(_connect()) as conn:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO tagged_files (key) VALUES (?)", (key,)
+                )
+    except SqliteError as e:
+        log_error(f"Error writing audio language cache: {e}")
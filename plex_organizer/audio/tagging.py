@@ -8,28 +8,60 @@ written back into the container as ISO 639-2 language tags.
 
 from __future__ import annotations
 
-from os.path import isfile, join, splitext, dirname
-from tempfile import TemporaryDirectory
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from os import stat, stat_result, utime
+from os.path import splitext, dirname
+from stat import S_ISREG
+from threading import Lock
 from typing import Any, Dict, List, Optional, Tuple
 
+from numpy import float32, frombuffer, ndarray
+
 from ..config import get_cpu_threads
-from ..const import ISO639_1_TO_2
+from ..const import NORMALIZE_LANG
 from ..dataclass import AudioStream
 from ..ffmpeg_utils import (
-    WAV_OUTPUT_ARGS,
+    PCM_SAMPLE_RATE,
     build_ffmpeg_base_cmd,
     ffmpeg_input_cmd,
     get_ffmpeg,
     get_ffprobe,
-    probe_duration_seconds,
-    probe_streams_json,
+    probe_streams_and_duration,
     replace_and_restore_timestamps,
     run_cmd,
+    run_cmd_bytes,
+    which_cached,
 )
 from ..log import log_error, log_debug
 from ..utils import is_plex_folder
+from .lang_cache import get_cached_language, mark_tagged, store_language, was_tagged
 from .whisper import WhisperDetector
 
+SAMPLE_SECONDS = 20
+EARLY_STOP_CONFIDENCE = 0.90
+
+_detectors: Dict[int, WhisperDetector] = {}
+_detector_lock = Lock()
+
+
+def _get_detector(cpu_threads: int) -> WhisperDetector:
+    """Return a process-wide WhisperDetector for *cpu_threads*.
+
+    Loading the Whisper model is the most expensive part of detection, so the
+    detector is created once and reused across streams and files. Creation is
+    done under a lock, so workers that start together wait for a single model
+    load instead of each loading their own.
+    """
+    detector = _detectors.get(cpu_threads)
+    if detector is None:
+        with _detector_lock:
+            detector = _detectors.get(cpu_threads)
+            if detector is None:
+                detector = WhisperDetector(cpu_threads=cpu_threads)
+                _detectors[cpu_threads] = detector
+    return detector
+
 
 def _audio_stream_from_ffprobe(audio_index: int, stream: Dict[str, Any]) -> AudioStream:
     """Convert an ffprobe stream payload into an AudioStream.
@@ -65,27 +97,34 @@ def _audio_stream_from_ffprobe(audio_index: int, stream: Dict[str, Any]) -> Audi
     )
 
 
-def _probe_audio_streams(video_path: str) -> List[AudioStream]:
-    """Probe audio streams from a container using ffprobe.
+def _probe_audio_streams(
+    video_path: str,
+    st: Optional[stat_result] = None,
+) -> Tuple[List[AudioStream], Optional[float]]:
+    """Probe audio streams and container duration with a single ffprobe call.
 
     Args:
         video_path: Path to a local media file.
+        st: Pre-fetched ``os.stat`` result for *video_path*, if available.
 
     Returns:
-        A list of AudioStream objects in stream order (audio_index).
+        (streams, duration_seconds): AudioStream objects in stream order
+        (audio_index) and the container duration, or None if unavailable.
 
     Raises:
         FileNotFoundError: If video_path does not exist.
         RuntimeError: If ffprobe is missing or fails.
     """
-    if not isfile(video_path):
+    if st is None:
+        st = stat(video_path)
+    if not S_ISREG(st.st_mode):
         raise FileNotFoundError(video_path)
 
-    streams = probe_streams_json(video_path, "a")
+    streams, duration = probe_streams_and_duration(video_path, "a")
     if not streams:
         get_ffprobe()
 
-    return [_audio_stream_from_ffprobe(i, s) for i, s in enumerate(streams)]
+    return [_audio_stream_from_ffprobe(i, s) for i, s in enumerate(streams)], duration
 
 
 def _sampling_params_for_duration(dur_seconds: float) -> Tuple[int, List[float]]:
@@ -103,19 +142,20 @@ def _pick_offsets(
     max_start: int,
     fracs: List[float],
 ) -> List[int]:
-    """Pick up to three clamped and de-duplicated offsets."""
-    offsets = [
-        max(min_start, min(int(usable_end_seconds * f), max_start)) for f in fracs[:3]
-    ]
-    dedup: List[int] = list(dict.fromkeys(offsets))
+    """Pick up to three clamped, de-duplicated and sorted offsets.
 
-    while len(dedup) < 3:
-        nxt = min(max_start, (dedup[-1] + 60) if dedup else min_start)
-        if nxt in dedup:
+    Offsets that collapse onto each other after clamping are backfilled from a
+    60 second grid starting at *min_start*.
+    """
+    picked = {
+        max(min_start, min(int(usable_end_seconds * f), max_start)) for f in fracs[:3]
+    }
+    for candidate in range(min_start, max_start + 1, 60):
+        if len(picked) >= 3:
             break
-        dedup.append(nxt)
+        picked.add(candidate)
 
-    return dedup[:3]
+    return sorted(picked)[:3]
 
 
 def _get_content_aware_offsets(
@@ -163,32 +203,37 @@ def _sample_track_languages(
     video_path: str,
     stream: AudioStream,
     offsets: List[int],
-    tmpdir: str,
 ) -> List[Tuple[Optional[str], float]]:
     """Extract and detect language for several samples from one audio stream.
 
+    Sampling stops early once a sample is detected with at least
+    ``EARLY_STOP_CONFIDENCE``, which alone is enough for a decision in
+    `_choose_language_from_samples`.
+
     Args:
         video_path: Path to the media file.
         stream: Audio stream descriptor.
         offsets: Start offsets (seconds) for samples.
-        tmpdir: Temporary directory to write WAV samples into.
 
     Returns:
         List of (iso639_2_language_or_none, confidence) tuples per sample.
     """
     samples: List[Tuple[Optional[str], float]] = []
-    detector = WhisperDetector(cpu_threads=get_cpu_threads())
-    wav_path = join(tmpdir, f"a{stream.audio_index}.wav")
-
-    for offset in offsets:
-        _extract_audio_sample(
-            video_path,
-            stream.audio_index,
-            wav_path,
-            start_seconds=offset,
+    detector = _get_detector(get_cpu_threads())
+    pcm_samples = _extract_audio_samples_pcm(
+        video_path,
+        stream.audio_index,
+        offsets,
+    )
+
+    for pcm in pcm_samples:
+        lang_code, confidence = detector.detect_language_from_array(
+            pcm, PCM_SAMPLE_RATE
         )
-        lang_code, confidence = detector.detect_language(wav_path)
-        samples.append((_normalize_language_to_iso639_2(lang_code), confidence))
+        lang = _normalize_language_to_iso639_2(lang_code)
+        samples.append((lang, confidence))
+        if lang and confidence >= EARLY_STOP_CONFIDENCE:
+            break
 
     return samples
 
@@ -208,29 +253,24 @@ def _choose_language_from_samples(
     Returns:
         (chosen_language_or_none, best_observed_confidence).
     """
-    by_lang: Dict[str, List[float]] = {}
+    counts: Counter[str] = Counter()
+    sums: Dict[str, float] = defaultdict(float)
+    maxes: Dict[str, float] = defaultdict(float)
     for lang, conf in samples:
         if not lang:
             continue
-        by_lang.setdefault(lang, []).append(conf)
+        counts[lang] += 1
+        sums[lang] += conf
+        maxes[lang] = max(maxes[lang], conf)
 
-    if not by_lang:
+    if not counts:
         best_conf = max((conf for _l, conf in samples), default=0.0)
         return (None, best_conf)
 
-    best_lang = ""
-    best_count = -1
-    best_sum = -1.0
-    best_max = 0.0
-    for lang, confs in by_lang.items():
-        count = len(confs)
-        total = float(sum(confs))
-        m = float(max(confs))
-        if (count > best_count) or (count == best_count and total > best_sum):
-            best_lang = lang
-            best_count = count
-            best_sum = total
-            best_max = m
+    best_lang, best_count = max(
+        counts.items(), key=lambda item: (item[1], sums[item[0]])
+    )
+    best_max = float(maxes[best_lang])
 
     if best_count >= 2 and best_max >= 0.40:
         return (best_lang, best_max)
@@ -239,72 +279,165 @@ def _choose_language_from_samples(
     return (None, best_max)
 
 
+def _detect_stream_language(
+    video_path: str,
+    stream: AudioStream,
+    offsets: List[int],
+    st: Optional[stat_result] = None,
+) -> Tuple[AudioStream, Optional[str], float]:
+    """Detect (or reuse) the language tag for a single audio stream.
+
+    Args:
+        video_path: Path to the media file.
+        stream: Audio stream descriptor.
+        offsets: Start offsets (seconds) for samples.
+        st: Pre-fetched ``os.stat`` result used for the cache key.
+
+    Returns:
+        (stream, language_or_none, confidence) for the stream.
+    """
+    if not _should_update_language(stream.language):
+        return (stream, _normalize_language_to_iso639_2(stream.language), 1.0)
+
+    cached = get_cached_language(video_path, stream.audio_index, st)
+    if cached is not None:
+        return (stream, cached[0], cached[1])
+
+    samples = _sample_track_languages(video_path, stream, offsets)
+    chosen_lang, chosen_conf = _choose_language_from_samples(samples)
+    store_language(video_path, stream.audio_index, chosen_lang, chosen_conf, st)
+    return (stream, chosen_lang, chosen_conf)
+
+
 def _detect_languages_for_streams(
     video_path: str,
     streams: List[AudioStream],
+    duration_seconds: Optional[float] = None,
+    st: Optional[stat_result] = None,
+    stream_workers: int = 0,
 ) -> List[Tuple[AudioStream, Optional[str], float]]:
     """Detect (or reuse) language tags for each audio stream.
 
+    Streams are processed concurrently, bounded by *stream_workers* (or the
+    configured CPU thread count when it is 0); results keep the input stream
+    order.
+
     Args:
         video_path: Path to the media file.
         streams: Probed audio streams.
+        duration_seconds: Container duration used to pick sample offsets.
+        st: Pre-fetched ``os.stat`` result for *video_path*, if available.
+        stream_workers: How many streams to sample at once; 1 processes them
+            one after another.
 
     Returns:
         A list of (stream, language_or_none, confidence) for each stream.
     """
-    detections: List[Tuple[AudioStream, Optional[str], float]] = []
+    if not any(_should_update_language(s.language) for s in streams):
+        return [(s, _normalize_language_to_iso639_2(s.language), 1.0) for s in streams]
+
+    offsets = _get_content_aware_offsets(duration_seconds)
+    if offsets is None:
+        offsets = [30 + (120 * i) for i in range(3)]
+
+    max_workers = max(1, min(len(streams), stream_workers or get_cpu_threads()))
+    if max_workers == 1:
+        return [_detect_stream_language(video_path, s, offsets, st) for s in streams]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(
+            pool.map(
+                lambda stream: _detect_stream_language(video_path, stream, offsets, st),
+                streams,
+            )
+        )
 
-    with TemporaryDirectory(prefix="plex_audio_lang_") as tmpdir:
-        for stream in streams:
-            if not _should_update_language(stream.language):
-                detections.append(
-                    (stream, _normalize_language_to_iso639_2(stream.language), 1.0)
-                )
-                continue
 
-            offsets = _get_content_aware_offsets(probe_duration_seconds(video_path))
-            if offsets is None:
-                offsets = [30 + (120 * i) for i in range(3)]
+def _apply_language_metadata_mkvpropedit(
+    video_path: str,
+    updates: List[Tuple[AudioStream, str]],
+    st: Optional[stat_result] = None,
+) -> bool:
+    """Edit MKV audio track language tags in place with mkvpropedit.
 
-            samples = _sample_track_languages(
-                video_path,
-                stream,
-                offsets,
-                tmpdir,
-            )
-            chosen_lang, chosen_conf = _choose_language_from_samples(samples)
-            detections.append((stream, chosen_lang, chosen_conf))
-    return detections
+    Only the track headers are rewritten, so this avoids remuxing the whole
+    container. Original timestamps are restored afterwards.
+
+    Args:
+        video_path: Path to a Matroska file (modified in-place).
+        updates: (stream, language) pairs to write.
+        st: Pre-fetched ``os.stat`` result holding the timestamps to restore.
+
+    Returns:
+        True if the tags were written, False if mkvpropedit is unavailable,
+        the file is not Matroska, or the edit failed.
+    """
+    if splitext(video_path)[1].lower() != ".mkv":
+        return False
+
+    mkvpropedit = which_cached("mkvpropedit")
+    if not mkvpropedit:
+        return False
+
+    cmd = [mkvpropedit, "--quiet", video_path]
+    for stream, lang in updates:
+        cmd.extend(
+            ["--edit", f"track:a{stream.audio_index + 1}", "--set", f"language={lang}"]
+        )
+
+    if st is None:
+        st = stat(video_path)
+    proc = run_cmd(cmd)
+    if proc.returncode != 0:
+        log_debug(
+            f"mkvpropedit failed for '{video_path}', falling back to ffmpeg: "
+            f"{proc.stderr.strip() or proc.stdout.strip()}"
+        )
+        return False
+
+    utime(video_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    return True
 
 
 def _apply_language_metadata(
-    video_path: str, detections: List[Tuple[AudioStream, Optional[str], float]]
+    video_path: str,
+    detections: List[Tuple[AudioStream, Optional[str], float]],
+    st: Optional[stat_result] = None,
 ) -> None:
-    """Write language metadata to the container (stream-level) using ffmpeg.
+    """Write language metadata to the container (stream-level).
+
+    Only streams whose tag actually changes are written, so files that are
+    already tagged are left untouched. Matroska files are edited in place with
+    mkvpropedit when it is installed; other containers (or a failed in-place
+    edit) are remuxed with ffmpeg.
 
     Args:
         video_path: Path to the media file (modified in-place).
         detections: Per-stream detection results.
+        st: Pre-fetched ``os.stat`` result holding the timestamps to restore.
 
     Raises:
         RuntimeError: If ffmpeg fails to rewrite the file.
     """
-    updates = [(s, lang) for (s, lang, _conf) in detections if lang]
+    updates = [
+        (s, lang) for (s, lang, _conf) in detections if lang and lang != s.language
+    ]
     if not updates:
         return
 
+    if _apply_language_metadata_mkvpropedit(video_path, updates, st):
+        return
+
     ffmpeg = get_ffmpeg()
     base, ext = splitext(video_path)
     tmp_out = f"{base}.langtag.tmp{ext}"
 
     cmd = build_ffmpeg_base_cmd(ffmpeg, video_path, [])
 
-    for stream, lang, _conf in detections:
-        if not lang:
-            continue
+    for stream, lang in updates:
         cmd.extend(["-metadata:s:a:" + str(stream.audio_index), "language=" + lang])
 
-    cmd.append(tmp_out)
+    cmd.extend(["-threads", "1", tmp_out])
 
     proc = run_cmd(cmd)
     if proc.returncode != 0:
@@ -312,7 +445,7 @@ def _apply_language_metadata(
             f"ffmpeg failed while writing language tags to '{video_path}':\n{proc.stderr.strip()}"
         )
 
-    replace_and_restore_timestamps(tmp_out, video_path)
+    replace_and_restore_timestamps(tmp_out, video_path, st)
 
 
 def _normalize_language_to_iso639_2(code: Optional[str]) -> Optional[str]:
@@ -327,52 +460,81 @@ def _normalize_language_to_iso639_2(code: Optional[str]) -> Optional[str]:
     if not code:
         return None
     code = code.strip().lower()
-    if not code or code in {"und", "unknown"}:
-        return None
-    if len(code) == 3:
-        return code
-    if len(code) == 2:
-        return ISO639_1_TO_2.get(code)
-    return None
+    return NORMALIZE_LANG.get(code, code if len(code) == 3 else None)
 
 
-def _extract_audio_sample(
+def _extract_audio_samples_pcm(
     video_path: str,
     audio_index: int,
-    wav_path: str,
-    start_seconds: int = 0,
-) -> None:
-    """Extract a short mono 16kHz WAV sample from an audio stream.
+    offsets: List[int],
+) -> List[ndarray]:
+    """Decode several short mono 16 kHz samples into memory with one ffmpeg call.
+
+    Every offset is opened as its own fast-seeking, single-threaded input
+    (``-threads 1 -ss``/``-t`` before ``-i``); parallelism comes from the
+    per-stream or per-file worker pool instead. Each sample is trimmed/padded to exactly
+    ``SAMPLE_SECONDS`` and the samples are concatenated into a single raw PCM
+    stream on stdout, so no temporary WAV files are written.
 
     Args:
         video_path: Path to the media file.
         audio_index: Zero-based audio stream index as used by ffmpeg (0:a:N).
-        wav_path: Output WAV path.
-        start_seconds: Start offset in seconds for the sample.
+        offsets: Start offsets (seconds) for the samples.
+
+    Returns:
+        Float32 sample arrays in the same order as *offsets*.
 
     Raises:
-        RuntimeError: If ffmpeg fails to extract the sample.
+        RuntimeError: If ffmpeg fails to extract the samples.
     """
+    if not offsets:
+        return []
+
     ffmpeg = get_ffmpeg()
+    sample_len = SAMPLE_SECONDS * PCM_SAMPLE_RATE
 
-    cmd = [
-        *ffmpeg_input_cmd(ffmpeg, video_path, ["-ss", str(start_seconds)]),
-        "-map",
-        f"0:a:{audio_index}",
-        "-t",
-        "20",
-        *WAV_OUTPUT_ARGS,
-        wav_path,
+    cmd = ffmpeg_input_cmd(
+        ffmpeg,
+        video_path,
+        ["-threads", "1", "-ss", str(offsets[0]), "-t", str(SAMPLE_SECONDS)],
+    )
+    for offset in offsets[1:]:
+        cmd.extend(
+            [
+                "-threads",
+                "1",
+                "-ss",
+                str(offset),
+                "-t",
+                str(SAMPLE_SECONDS),
+                "-i",
+                video_path,
+            ]
+        )
+
+    chains = [
+        f"[{k}:a:{audio_index}]aresample={PCM_SAMPLE_RATE},"
+        "aformat=sample_fmts=s16:channel_layouts=mono,"
+        f"atrim=end_sample={sample_len},apad=whole_len={sample_len}[s{k}]"
+        for k in range(len(offsets))
     ]
-    proc = run_cmd(cmd)
+    labels = "".join(f"[s{k}]" for k in range(len(offsets)))
+    graph = ";".join(chains) + f";{labels}concat=n={len(offsets)}:v=0:a=1[pcm]"
+    cmd.extend(["-filter_complex", graph, "-map", "[pcm]", "-f", "s16le", "-"])
+
+    proc = run_cmd_bytes(cmd)
     if proc.returncode != 0:
         raise RuntimeError(
             (
                 f"ffmpeg failed extracting audio stream 0:a:{audio_index} "
-                f"from '{video_path}':\n{proc.stderr.strip()}"
+                f"from '{video_path}':\n"
+                f"{proc.stderr.decode('utf-8', errors='replace').strip()}"
             )
         )
 
+    pcm = frombuffer(proc.stdout, dtype="<i2").astype(float32) / 32768.0
+    return [pcm[k * sample_len : (k + 1) * sample_len] for k in range(len(offsets))]
+
 
 def _should_update_language(existing: Optional[str]) -> bool:
     """Return True when a stream language tag is missing/unknown."""
@@ -380,13 +542,17 @@ def _should_update_language(existing: Optional[str]) -> bool:
     return normalized is None
 
 
-def tag_audio_track_languages(video_path: str) -> None:
+def tag_audio_track_languages(video_path: str, stream_workers: int = 0) -> None:
     """Detect and tag missing audio track language metadata for a video.
 
     This is the public entrypoint for this module.
 
     Args:
         video_path: Path to a local media file.
+        stream_workers: How many audio streams to sample at once (0 follows
+            ``cpu_threads``). Callers that already tag several files
+            concurrently pass 1 so the ffmpeg decodes and Whisper runs stay
+            bounded by their own pool.
 
     Notes:
         Errors are logged via log_error() and do not raise.
@@ -397,11 +563,20 @@ def tag_audio_track_languages(video_path: str) -> None:
     log_debug(f"Tagging audio languages for video: {video_path}")
 
     try:
-        streams = _probe_audio_streams(video_path)
+        st = stat(video_path)
+        if was_tagged(video_path, st):
+            log_debug(f"Audio languages already tagged, skipping: {video_path}")
+            return
+
+        streams, duration = _probe_audio_streams(video_path, st)
         if not streams:
+            # An empty result also covers a failed or too-short ffprobe run,
+            # so the file is not recorded and is probed again next time.
             return
 
-        detections = _detect_languages_for_streams(video_path, streams)
+        detections = _detect_languages_for_streams(
+            video_path, streams, duration, st, stream_workers
+        )
 
         log_debug(
             f"Detected audio languages for '{video_path}': "
@@ -412,7 +587,8 @@ def tag_audio_track_languages(video_path: str) -> None:
                 for s, lang, conf in detections
             )
         )
-        _apply_language_metadata(video_path, detections)
+        _apply_language_metadata(video_path, detections, st)
+        mark_tagged(video_path)
     except (RuntimeError, OSError, ValueError) as e:
         log_error(str(e))
         return
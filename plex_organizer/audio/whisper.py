@@ -10,8 +10,9 @@ Notes:
     - Requires the `faster-whisper` package.
 """
 
-from typing import Any, Dict, Optional, Tuple
-from faster_whisper import WhisperModel
+from typing import Any, Dict, Optional, Tuple, Union
+from faster_whisper import WhisperModel, decode_audio
+from numpy import ndarray
 
 from ..config import get_whisper_model_size
 
@@ -89,29 +90,43 @@ class WhisperDetector:
               estimated language probability.
 
         Notes:
-            - This uses a low beam size and VAD filtering to keep detection
-              fast.
+            - Only the Whisper encoder and language head run (no decoding),
+              on VAD-filtered speech, to keep detection fast.
             - The probability is not guaranteed to be calibrated; treat it as
               a relative confidence signal.
         """
+        return self._detect(wav_path)
+
+    def detect_language_from_array(
+        self, pcm: ndarray, sample_rate: int = 16000
+    ) -> Tuple[Optional[str], float]:
+        """Detect the most likely language for in-memory audio samples.
+
+        Args:
+            pcm: Mono float32 samples in the range $[-1, 1]$.
+            sample_rate: Sample rate of *pcm*; Whisper expects 16 kHz.
+
+        Returns:
+            Same as `detect_language()`.
+
+        Raises:
+            ValueError: If *sample_rate* is not 16 kHz.
+        """
+        if sample_rate != 16000:
+            raise ValueError(f"Whisper expects 16 kHz audio, got {sample_rate} Hz.")
+        return self._detect(pcm)
+
+    def _detect(self, audio: Union[str, ndarray]) -> Tuple[Optional[str], float]:
+        """Run Whisper language identification on a file path or 16 kHz samples."""
         model = self._model
         if model is None:
             raise RuntimeError(
                 "WhisperDetector backend is unavailable (model initialization failed)."
             )
 
-        segments, info = model.transcribe(
-            wav_path,
-            beam_size=1,
-            vad_filter=True,
-            temperature=0,
-        )
-
-        try:
-            next(iter(segments))
-        except StopIteration:
-            pass
+        if isinstance(audio, str):
+            audio = decode_audio(audio, sampling_rate=16000)
 
-        lang = getattr(info, "language", None)
-        prob = float(getattr(info, "language_probability", 0.0) or 0.0)
+        lang, prob_any, _all_probs = model.detect_language(audio, vad_filter=True)
+        prob = float(prob_any or 0.0)
         return (lang, prob)
@@ -2,8 +2,10 @@
 This module provides functions to access settings from the config.ini file.
 """
 
+from os import stat
 from os.path import join, exists
 from configparser import ConfigParser
+from functools import lru_cache
 
 from .paths import data_dir
 
@@ -26,6 +28,7 @@ def ensure_config_exists():
             "include_quality": "true",
             "capitalize": "true",
             "cpu_threads": "2",
+            "sample_max_size_mb": "300",
         },
         "Logging": {
             "enable_logging": "true",
@@ -37,6 +40,7 @@ def ensure_config_exists():
         "Audio": {
             "enable_audio_tagging": "true",
             "whisper_model_size": "tiny",
+            "tagging_workers": "0",
         },
         "Subtitles": {
             "enable_subtitle_embedding": "true",
@@ -44,6 +48,8 @@ def ensure_config_exists():
             "fetch_subtitles": "eng",
             "subtitle_providers": "opensubtitles, podnapisi, gestdown, tvsubtitles",
             "sync_subtitles": "true",
+            "detection_languages": "",
+            "parallel_workers": "0",
         },
     }
 
@@ -61,7 +67,7 @@ def _check_config(default_config: dict):
     Args:
         default_config (dict): The default configuration with required sections and options.
     """
-    config = _get_config()
+    config = _read_config(CONFIG_PATH)
     changed = False
     for section, options in default_config.items():
         if not config.has_section(section):
@@ -81,6 +87,7 @@ def _check_config(default_config: dict):
     if changed:
         with open(CONFIG_PATH, "w", encoding="utf-8") as configfile:
             config.write(configfile)
+        _load_config.cache_clear()
 
 
 def _create_config(default_config: dict):
@@ -96,15 +103,39 @@ def _create_config(default_config: dict):
             for key, value in options.items():
                 f.write(f"{key} = {value}\n")
             f.write("\n")
+    _load_config.cache_clear()
 
 
-def _get_config():
-    """Return a ConfigParser object loaded with config.ini."""
+def _read_config(path: str) -> ConfigParser:
+    """Parse *path* into a fresh ConfigParser."""
     config = ConfigParser()
-    config.read(CONFIG_PATH)
+    config.read(path)
     return config
 
 
+@lru_cache(maxsize=1)
+def _load_config(path: str, _mtime_ns: int, _size: int) -> ConfigParser:
+    """Return the parsed config for one on-disk version of *path*.
+
+    The mtime/size arguments only serve as cache key so that edits to
+    config.ini are picked up without re-parsing it on every getter call.
+    """
+    return _read_config(path)
+
+
+def _get_config():
+    """Return a ConfigParser object loaded with config.ini.
+
+    The parsed file is cached and shared between callers; treat it as
+    read-only.
+    """
+    try:
+        st = stat(CONFIG_PATH)
+    except OSError:
+        return _read_config(CONFIG_PATH)
+    return _load_config(CONFIG_PATH, st.st_mtime_ns, st.st_size)
+
+
 def get_host():
     """Return the qBittorrent host from the config file."""
     config = _get_config()
@@ -117,6 +148,12 @@ def get_delete_duplicates():
     return config.getboolean("Settings", "delete_duplicates", fallback=False)
 
 
+def get_sample_max_size_mb():
+    """Return the size in MB below which sample-named files are deleted (0: any size)."""
+    config = _get_config()
+    return config.getint("Settings", "sample_max_size_mb", fallback=300)
+
+
 def get_include_quality():
     """Return True if quality should be included in settings."""
     config = _get_config()
@@ -165,6 +202,12 @@ def get_enable_audio_tagging():
     return config.getboolean("Audio", "enable_audio_tagging", fallback=True)
 
 
+def get_tagging_workers():
+    """Return how many files are audio-tagged at once (0 follows cpu_threads)."""
+    config = _get_config()
+    return config.getint("Audio", "tagging_workers", fallback=0)
+
+
 def get_enable_subtitle_embedding():
     """Return True if subtitle embedding is enabled."""
     config = _get_config()
@@ -214,6 +257,26 @@ def get_fetch_subtitles() -> list[str]:
     return [code.strip().lower() for code in raw.split(",") if code.strip()]
 
 
+def get_detection_languages() -> list[str]:
+    """Return the langdetect profiles to load for subtitle language detection.
+
+    The config value is a comma-separated list of langdetect profile names
+    (ISO 639-1 codes such as ``en, et`` plus ``zh-cn``/``zh-tw``). An empty value
+    means the built-in common set; ``all`` loads every profile.
+    """
+    config = _get_config()
+    raw = config.get("Subtitles", "detection_languages", fallback="").strip()
+    if not raw:
+        return []
+    return [code.strip().lower() for code in raw.split(",") if code.strip()]
+
+
+def get_parallel_workers():
+    """Return how many videos get subtitle work at once (0 follows cpu_threads)."""
+    config = _get_config()
+    return config.getint("Subtitles", "parallel_workers", fallback=0)
+
+
 def get_sync_subtitles():
     """Return True if subtitle-to-audio synchronization is enabled."""
     config = _get_config()
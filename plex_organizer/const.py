@@ -4,19 +4,24 @@ This module defines file extensions and folder names used for filtering
 and organizing media files.
 """
 
-from typing import Dict
-from re import compile as re_compile
+from os.path import normcase
+from sys import intern
+from typing import Dict, Optional
 
 VIDEO_EXTENSIONS = (".mkv", ".mp4")
+VIDEO_EXT_SET = frozenset(VIDEO_EXTENSIONS)
 
 TEXT_SUBTITLE_EXTENSIONS = (".srt", ".vtt", ".ass", ".ssa")
+TEXT_SUBTITLE_EXT_SET = frozenset(TEXT_SUBTITLE_EXTENSIONS)
 
 SUBTITLE_EXTENSIONS = TEXT_SUBTITLE_EXTENSIONS + (
     ".sub",
     ".idx",
 )
+SUBTITLE_EXT_SET = frozenset(SUBTITLE_EXTENSIONS)
 
 EXT_FILTER = VIDEO_EXTENSIONS + (".!qB", ".index")
+EXT_FILTER_SET = frozenset(ext.lower() for ext in EXT_FILTER)
 
 UNWANTED_FOLDERS = {
     "Plex Versions",
@@ -32,85 +37,119 @@ UNWANTED_FOLDERS = {
     "Covers",
     "Poster",
 }
+UNWANTED_FOLDERS_NORMCASE = frozenset(map(normcase, UNWANTED_FOLDERS))
 
 ISO639_1_TO_2: Dict[str, str] = {
-    "aa": "aar",
-    "ab": "abk",
-    "af": "afr",
-    "ar": "ara",
-    "az": "aze",
-    "be": "bel",
-    "bg": "bul",
-    "bn": "ben",
-    "bs": "bos",
-    "ca": "cat",
-    "cs": "ces",
-    "cy": "cym",
-    "da": "dan",
-    "de": "deu",
-    "el": "ell",
-    "en": "eng",
-    "es": "spa",
-    "et": "est",
-    "eu": "eus",
-    "fa": "fas",
-    "fi": "fin",
-    "fr": "fra",
-    "ga": "gle",
-    "gl": "glg",
-    "gu": "guj",
-    "he": "heb",
-    "hi": "hin",
-    "hr": "hrv",
-    "hu": "hun",
-    "hy": "hye",
-    "id": "ind",
-    "is": "isl",
-    "it": "ita",
-    "ja": "jpn",
-    "jv": "jav",
-    "ka": "kat",
-    "kk": "kaz",
-    "km": "khm",
-    "kn": "kan",
-    "ko": "kor",
-    "lt": "lit",
-    "lv": "lav",
-    "mk": "mkd",
-    "ml": "mal",
-    "mr": "mar",
-    "ms": "msa",
-    "my": "mya",
-    "ne": "nep",
-    "nl": "nld",
-    "no": "nor",
-    "pa": "pan",
-    "pl": "pol",
-    "pt": "por",
-    "ro": "ron",
-    "ru": "rus",
-    "sk": "slk",
-    "sl": "slv",
-    "sq": "sqi",
-    "sr": "srp",
-    "sv": "swe",
-    "sw": "swa",
-    "ta": "tam",
-    "te": "tel",
-    "th": "tha",
-    "tl": "tgl",
-    "tr": "tur",
-    "uk": "ukr",
-    "ur": "urd",
-    "vi": "vie",
-    "zh": "zho",
+    intern(k): intern(v)
+    for k, v in {
+        "aa": "aar",
+        "ab": "abk",
+        "af": "afr",
+        "ar": "ara",
+        "az": "aze",
+        "be": "bel",
+        "bg": "bul",
+        "bn": "ben",
+        "bs": "bos",
+        "ca": "cat",
+        "cs": "ces",
+        "cy": "cym",
+        "da": "dan",
+        "de": "deu",
+        "el": "ell",
+        "en": "eng",
+        "es": "spa",
+        "et": "est",
+        "eu": "eus",
+        "fa": "fas",
+        "fi": "fin",
+        "fr": "fra",
+        "ga": "gle",
+        "gl": "glg",
+        "gu": "guj",
+        "he": "heb",
+        "hi": "hin",
+        "hr": "hrv",
+        "hu": "hun",
+        "hy": "hye",
+        "id": "ind",
+        "is": "isl",
+        "it": "ita",
+        "ja": "jpn",
+        "jv": "jav",
+        "ka": "kat",
+        "kk": "kaz",
+        "km": "khm",
+        "kn": "kan",
+        "ko": "kor",
+        "lt": "lit",
+        "lv": "lav",
+        "mk": "mkd",
+        "ml": "mal",
+        "mr": "mar",
+        "ms": "msa",
+        "my": "mya",
+        "ne": "nep",
+        "nl": "nld",
+        "no": "nor",
+        "pa": "pan",
+        "pl": "pol",
+        "pt": "por",
+        "ro": "ron",
+        "ru": "rus",
+        "sk": "slk",
+        "sl": "slv",
+        "sq": "sqi",
+        "sr": "srp",
+        "sv": "swe",
+        "sw": "swa",
+        "ta": "tam",
+        "te": "tel",
+        "th": "tha",
+        "tl": "tgl",
+        "tr": "tur",
+        "uk": "ukr",
+        "ur": "urd",
+        "vi": "vie",
+        "zh": "zho",
+    }.items()
 }
 
-INDEX_FILENAME = ".plex_organizer.index"
+# Lookup table for normalizing any supported tag to ISO 639-2 in one step.
+# Three-letter codes missing from this table are passed through as-is.
+NORMALIZE_LANG: Dict[str, Optional[str]] = {
+    **ISO639_1_TO_2,
+    **{code: code for code in ISO639_1_TO_2.values()},
+    "und": None,
+    "unknown": None,
+}
 
-MOVIE_CORRECT_NAME_RE = re_compile(r"^.+ \(\d{4}\)(?: \d{3,4}p)?\.[\w]+$", flags=0)
-TV_CORRECT_NAME_RE = re_compile(r"^.+ S(\d{2})E(\d{2})(?: \d{3,4}p)?\.[\w]+$", flags=0)
-TV_CORRECT_SEASON_RE = re_compile(r"^Season (\d+)$", flags=0)
+# langdetect profiles loaded for subtitle language detection by default. Fewer
+# profiles mean less resident memory and a shorter scoring loop per detection.
+LANGDETECT_PROFILES = (
+    "en",
+    "es",
+    "ar",
+    "fr",
+    "de",
+    "it",
+    "pt",
+    "ru",
+    "ja",
+    "ko",
+    "zh-cn",
+    "zh-tw",
+    "hi",
+    "bn",
+    "id",
+    "nl",
+    "sv",
+    "fi",
+    "pl",
+    "tr",
+)
+
+INDEX_FILENAME = ".plex_organizer.index"
 
 TEXT_SUB_CODECS = frozenset(
     {"subrip", "srt", "ass", "ssa", "mov_text", "webvtt", "text"}
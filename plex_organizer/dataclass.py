@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import Optional, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AudioStream:
     """Represents a single audio stream in a media file.
 
@@ -33,7 +33,7 @@ class AudioStream:
     title: Optional[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SubtitleMergePlan:
     """A plan describing which subtitle files to embed into a single video.
 
@@ -46,10 +46,13 @@ class SubtitleMergePlan:
     subtitle_paths: Tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IndexEntry:
     """Metadata recorded when a media file is marked as processed.
 
+    Describes the shape of each entry in an index file; the indexer writes the
+    equivalent plain dict directly.
+
     Attributes:
         processed_at: UTC timestamp (ISO 8601) when the file was processed.
     """
@@ -57,7 +60,7 @@ class IndexEntry:
     processed_at: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IndexSummary:
     """Summary of an indexing run.
 
@@ -10,14 +10,19 @@ pre-built static binaries for ffmpeg and ffprobe — no system install required.
 from __future__ import annotations
 
 from functools import lru_cache
-from json import JSONDecodeError, loads as json_loads
-from os import remove, replace, stat, utime
+from os import remove, replace, stat, stat_result, utime
 from os.path import dirname, exists, splitext
+from shutil import which as shutil_which
 from subprocess import run, CompletedProcess
 from tempfile import NamedTemporaryFile
 from typing import Any, Dict, List, Sequence, Tuple
 from static_ffmpeg import add_paths, run as ffmpeg_run
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    from json import loads as json_loads
+
 from .log import log_error
 
 COPY_STREAM_ARGS: List[str] = [
@@ -31,6 +36,11 @@ COPY_STREAM_ARGS: List[str] = [
     "0",
 ]
 
+PCM_SAMPLE_RATE = 16000
+
+# Metadata-only probes do not need ffprobe's default 5 MB / 5 s analysis window.
+FAST_PROBE_ARGS: List[str] = ["-probesize", "1M", "-analyzeduration", "500000"]
+
 WAV_OUTPUT_ARGS: List[str] = [
     "-vn",
     "-sn",
@@ -57,6 +67,15 @@ def _resolve_binaries() -> Tuple[str, str]:
     return ffmpeg_path, ffprobe_path
 
 
+@lru_cache(maxsize=None)
+def which_cached(executable: str) -> str | None:
+    """Return the PATH location of an optional external tool (cached).
+
+    The PATH is searched once per executable per process.
+    """
+    return shutil_which(executable)
+
+
 def get_ffmpeg() -> str:
     """Return the absolute path to the ffmpeg binary."""
     return _resolve_binaries()[0]
@@ -79,6 +98,11 @@ def run_cmd(cmd: List[str]) -> CompletedProcess[str]:
     )
 
 
+def run_cmd_bytes(cmd: List[str]) -> CompletedProcess[bytes]:
+    """Run a subprocess command and capture raw stdout/stderr bytes without raising."""
+    return run(cmd, capture_output=True, check=False)
+
+
 def probe_json(
     video_path: str,
     extra_args: Sequence[str] = (),
@@ -97,7 +121,7 @@ def probe_json(
         return {}
     try:
         return json_loads(proc.stdout or "{}") or {}
-    except (JSONDecodeError, TypeError):
+    except (ValueError, TypeError):
         return {}
 
 
@@ -112,12 +136,54 @@ def probe_streams_json(
     payload = probe_json(
         video_path, ["-show_streams", "-select_streams", stream_selector]
     )
+    return _streams_from_payload(payload)
+
+
+def probe_streams_and_duration(
+    video_path: str,
+    stream_selector: str = "a",
+) -> Tuple[List[Dict[str, Any]], float | None]:
+    """Probe streams and container duration with a single ffprobe call.
+
+    Uses a reduced probe window (``FAST_PROBE_ARGS``) since only stream
+    metadata and the container duration are needed.
+
+    Returns ``([], None)`` when ffprobe fails.
+    """
+    payload = probe_json(
+        video_path,
+        [
+            *FAST_PROBE_ARGS,
+            "-show_streams",
+            "-select_streams",
+            stream_selector,
+            "-show_entries",
+            "format=duration",
+        ],
+    )
+    return _streams_from_payload(payload), _duration_from_payload(payload)
+
+
+def _streams_from_payload(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return the stream dicts from an ffprobe JSON payload."""
     streams = payload.get("streams") or []
     if not isinstance(streams, list):
         return []
     return [s for s in streams if isinstance(s, dict)]
 
 
+def _duration_from_payload(payload: Dict[str, Any]) -> float | None:
+    """Return the container duration from an ffprobe JSON payload."""
+    fmt = payload.get("format") or {}
+    dur = fmt.get("duration")
+    if dur is None:
+        return None
+    try:
+        return float(dur)
+    except (ValueError, TypeError):
+        return None
+
+
 def probe_subtitle_languages(video_path: str) -> set[str]:
     """Return ISO 639-2 language codes for subtitle streams already present."""
     streams = probe_streams_json(video_path, "s")
@@ -136,14 +202,7 @@ def probe_duration_seconds(video_path: str) -> float | None:
     Returns ``None`` when ffprobe fails or the value is unavailable.
     """
     payload = probe_json(video_path, ["-show_entries", "format=duration"])
-    fmt = payload.get("format") or {}
-    dur = fmt.get("duration")
-    if dur is None:
-        return None
-    try:
-        return float(dur)
-    except (ValueError, TypeError):
-        return None
+    return _duration_from_payload(payload)
 
 
 def probe_subtitle_stream_count(video_path: str) -> int:
@@ -291,8 +350,13 @@ def probe_video_quality(video_path: str) -> str | None:
 def replace_and_restore_timestamps(
     tmp_path: str,
     video_path: str,
+    st: stat_result | None = None,
 ) -> None:
-    """Replace *video_path* with *tmp_path* and restore original timestamps."""
-    st = stat(video_path)
+    """Replace *video_path* with *tmp_path* and restore original timestamps.
+
+    Pass *st* when the caller already holds the original ``os.stat`` result.
+    """
+    if st is None:
+        st = stat(video_path)
     replace(tmp_path, video_path)
     utime(video_path, ns=(st.st_atime_ns, st.st_mtime_ns))
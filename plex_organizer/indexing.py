@@ -14,59 +14,161 @@ invalidate entries if a file changes.
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from json import JSONDecodeError, dump, load
-from os import makedirs, remove, replace, walk
-from os.path import basename, dirname, exists, normpath, relpath, join, splitext
-from re import sub
+from functools import lru_cache
+from os import makedirs, remove, replace, stat, walk
+from os.path import basename, dirname, exists, normpath, relpath, join
 from tempfile import NamedTemporaryFile
-from typing import Any, Dict
-
-from .const import (
-    INDEX_FILENAME,
-    MOVIE_CORRECT_NAME_RE,
-    TV_CORRECT_NAME_RE,
-    TV_CORRECT_SEASON_RE,
-    VIDEO_EXTENSIONS,
-)
-from .dataclass import IndexEntry
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from orjson import OPT_INDENT_2, OPT_SORT_KEYS, dumps, loads as json_loads
+
+    def _encode_index(payload: Dict[str, Any]) -> bytes:
+        """Serialize *payload* as sorted, two-space indented JSON."""
+        return dumps(payload, option=OPT_INDENT_2 | OPT_SORT_KEYS)
+
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    from json import dumps, loads as json_loads
+
+    def _encode_index(payload: Dict[str, Any]) -> bytes:
+        """Serialize *payload* as sorted, two-space indented JSON."""
+        return dumps(payload, indent=2, sort_keys=True).encode("utf-8")
+
+
+from .const import INDEX_FILENAME
 from .log import log_error
 from .utils import (
     capitalize,
     find_corrected_directory,
-    is_plex_folder,
-    is_script_temp_file,
+    has_video_extension,
     is_tv_dir,
+    iter_tree,
 )
 
+# Parsed index files keyed by path, validated against (st_mtime_ns, st_size).
+_INDEX_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _strip_quality(stem: str) -> str:
+    """Return *stem* without a trailing `` 720p``/`` 1080p`` quality suffix."""
+    if stem.endswith("p"):
+        for width in (4, 3):
+            if (
+                len(stem) >= width + 2
+                and stem[-width - 2] == " "
+                and stem[-width - 1 : -1].isdecimal()
+            ):
+                return stem[: -width - 2]
+    return stem
+
+
+def _layout_stem(name: str) -> str | None:
+    """Return the quality-stripped stem of *name*, or None without a word extension."""
+    stem, dot, ext = name.rpartition(".")
+    if not dot or not ext.replace("_", "a").isalnum():
+        return None
+    return _strip_quality(stem)
+
+
+def _match_movie(name: str) -> str | None:
+    """Return the ``Name (Year)`` title of a ``Name (Year)[ Quality].ext`` filename.
+
+    Implemented with plain string operations rather than a regex, which is
+    considerably faster on large libraries. The returned title is the
+    quality-stripped stem, i.e. the expected movie folder name; None is
+    returned when *name* does not match.
+    """
+    stem = _layout_stem(name)
+    if (
+        stem is None
+        or len(stem) <= 7
+        or stem[-7:-5] != " ("
+        or not stem[-5:-1].isdecimal()
+        or stem[-1] != ")"
+    ):
+        return None
+    return stem
+
+
+def _match_tv(name: str) -> str | None:
+    """Return the season digits of a ``Show SxxEyy[ Quality].ext`` filename.
+
+    Season and episode must be exactly two digits; returns None when *name*
+    does not match.
+    """
+    stem = _layout_stem(name)
+    if (
+        stem is None
+        or len(stem) <= 7
+        or stem[-7:-5] != " S"
+        or stem[-3] != "E"
+        or not stem[-2:].isdecimal()
+    ):
+        return None
+    season = stem[-5:-3]
+    return season if season.isdecimal() else None
+
+
+def _match_season(dir_name: str) -> str | None:
+    """Return the number of a ``Season <N>`` folder name, or None."""
+    if not dir_name.startswith("Season "):
+        return None
+    number = dir_name[7:]
+    return number if number.isdecimal() else None
+
 
 def _index_file_path(index_root: str) -> str:
     return join(index_root, INDEX_FILENAME)
 
 
 def _rel_key(index_root: str, file_path: str) -> str:
-    rel = relpath(file_path, index_root)
-    return normpath(rel)
+    return relpath(file_path, index_root)
 
 
-def _read_index(path: str) -> Dict[str, Any]:
+def _parse_index(path: str) -> Dict[str, Any]:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            payload = load(f)
+        with open(path, "rb") as f:
+            payload = json_loads(f.read())
     except FileNotFoundError:
-        return {"files": {}}
-    except (OSError, JSONDecodeError):
+        return {}
+    except (OSError, ValueError):
         log_error(f"Error reading index file at path: {path}")
-        return {"files": {}}
+        return {}
 
     if not isinstance(payload, dict):
         log_error(f"Invalid index format in file at path: {path}")
-        return {"files": {}}
+        return {}
 
     files = payload.get("files")
     if isinstance(files, dict):
-        return {"files": files}
+        return files
+
+    return payload
+
 
-    return {"files": payload}
+def _index_files(path: str) -> Dict[str, Any]:
+    """Return the parsed ``files`` mapping of *path*, memoized on its stat.
+
+    The returned dict is shared with the cache and must not be mutated.
+    """
+    try:
+        st = stat(path)
+    except OSError:
+        _INDEX_CACHE.pop(path, None)
+        return _parse_index(path)
+
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _INDEX_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    files = _parse_index(path)
+    _INDEX_CACHE[path] = (signature, files)
+    return files
+
+
+def _read_index(path: str) -> Dict[str, Any]:
+    return {"files": dict(_index_files(path))}
 
 
 def _write_index(path: str, payload: Dict[str, Any]) -> None:
@@ -74,50 +176,69 @@ def _write_index(path: str, payload: Dict[str, Any]) -> None:
     if os_path_dir and not exists(os_path_dir):
         makedirs(os_path_dir, exist_ok=True)
 
-    with NamedTemporaryFile("w", delete=False, dir=os_path_dir, encoding="utf-8") as f:
-        dump(payload, f, indent=2, sort_keys=True)
+    with NamedTemporaryFile("wb", delete=False, dir=os_path_dir) as f:
+        f.write(_encode_index(payload))
         tmp_path = f.name
 
     replace(tmp_path, path)
+    _INDEX_CACHE.pop(path, None)
 
 
 def _is_indexed(index_root: str, file_path: str) -> bool:
-    idx_path = _index_file_path(index_root)
-    payload = _read_index(idx_path)
-    files: Dict[str, Any] = payload.get("files", {})
-
-    key = _rel_key(index_root, file_path)
-    entry = files.get(key)
-
-    return entry is not None
+    files = _index_files(_index_file_path(index_root))
+    return _rel_key(index_root, file_path) in files
 
 
 def mark_indexed(index_root: str, file_path: str) -> None:
     """Record *file_path* as processed under *index_root* (best-effort)."""
+    mark_indexed_bulk(index_root, [file_path])
+
+
+def processed_timestamp() -> str:
+    """Return the current UTC time in the format stored in index entries."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def mark_indexed_bulk(
+    index_root: str, file_paths: Iterable[str], processed_at: str | None = None
+) -> None:
+    """Record every path in *file_paths* under *index_root* with a single write.
+
+    The index is read once, all entries are added, and the file is rewritten
+    only when there was something to add. *processed_at* lets callers share one
+    timestamp across several batches; it defaults to the current time.
+    """
     idx_path = _index_file_path(index_root)
     payload = _read_index(idx_path)
     files: Dict[str, Any] = payload.get("files", {})
     payload = {"files": files}
 
-    key = _rel_key(index_root, file_path)
-    files[key] = IndexEntry(
-        processed_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
-    ).__dict__
+    if processed_at is None:
+        processed_at = processed_timestamp()
+    added = False
+    for file_path in file_paths:
+        files[_rel_key(index_root, file_path)] = {"processed_at": processed_at}
+        added = True
 
-    _write_index(idx_path, payload)
+    if added:
+        _write_index(idx_path, payload)
 
 
-def _valid_tv_directory_structure(index_root: str, file_path: str) -> bool:
-    """Return True if the directory hierarchy matches tv/<Show>/Season X/<file>."""
-    tv_root = find_corrected_directory(index_root)
-    if normpath(tv_root) != normpath(index_root):
-        return False
+@lru_cache(maxsize=64)
+def _library_root(index_root: str) -> str | None:
+    """Return the normalized *index_root* if it is a library root, else None."""
+    root = normpath(index_root)
+    if normpath(find_corrected_directory(index_root)) != root:
+        return None
+    return root
 
-    season_dir = dirname(file_path)
-    show_dir = dirname(season_dir)
-    parent_of_show = dirname(show_dir)
 
-    if normpath(parent_of_show) != normpath(index_root):
+def _valid_tv_directory_structure(
+    index_root: str, season_dir: str, show_dir: str
+) -> bool:
+    """Return True if the directory hierarchy matches tv/<Show>/Season X/<file>."""
+    tv_root = _library_root(index_root)
+    if tv_root is None or normpath(dirname(show_dir)) != tv_root:
         return False
 
     return normpath(find_corrected_directory(season_dir)) == normpath(show_dir)
@@ -129,50 +250,39 @@ def _is_valid_tv_layout(index_root: str, file_path: str) -> bool:
     Expected structure: ``index_root/<Show>/Season <N>/<Show> SxxEyy[.ext]``.
     *index_root* is the TV library root (e.g. ``tv/``).
     """
-    if not _valid_tv_directory_structure(index_root, file_path):
-        return False
-
     season_dir = dirname(file_path)
     show_dir = dirname(season_dir)
+    if not _valid_tv_directory_structure(index_root, season_dir, show_dir):
+        return False
 
-    season_name = basename(season_dir)
-    season_match = TV_CORRECT_SEASON_RE.match(season_name)
-    if not season_match:
+    season_folder = _match_season(basename(season_dir))
+    if season_folder is None:
         return False
-    season_folder = season_match.group(1)
 
     file_name = basename(file_path)
     show_title = capitalize(basename(show_dir))
-    prefix = f"{show_title} "
-    if not file_name.startswith(prefix):
+    if not file_name.startswith(f"{show_title} "):
         return False
 
-    name_match = TV_CORRECT_NAME_RE.match(file_name)
-    if not name_match:
+    file_season = _match_tv(file_name)
+    if file_season is None:
         return False
 
-    return int(name_match.group(1)) == int(season_folder)
+    return int(file_season) == int(season_folder)
 
 
 def _is_valid_movie_layout(index_root: str, file_path: str) -> bool:
     """Return True if *file_path* matches the expected movie layout under *index_root*."""
-    movies_root = find_corrected_directory(index_root)
-    if normpath(movies_root) != normpath(index_root):
-        return False
-
-    file_name = basename(file_path)
-    if not MOVIE_CORRECT_NAME_RE.match(file_name):
+    movies_root = _library_root(index_root)
+    if movies_root is None:
         return False
 
-    movie_dir = basename(dirname(file_path))
-    expected_folder = sub(r" \d{3,4}p$", "", splitext(file_name)[0])
-    if movie_dir != expected_folder:
+    movie_dir = dirname(file_path)
+    title = _match_movie(basename(file_path))
+    if title is None or basename(movie_dir) != title:
         return False
 
-    if normpath(dirname(dirname(file_path))) != normpath(index_root):
-        return False
-
-    return True
+    return normpath(dirname(movie_dir)) == movies_root
 
 
 def should_index_video(index_root: str, file_path: str) -> bool:
@@ -188,7 +298,7 @@ def should_index_video(index_root: str, file_path: str) -> bool:
       `<Show>/Season X/` and filename must start with the show title and contain
       `SxxEyy`.
     """
-    if not file_path.lower().endswith(VIDEO_EXTENSIONS):
+    if not has_video_extension(file_path):
         return False
 
     if is_tv_dir(index_root):
@@ -197,31 +307,27 @@ def should_index_video(index_root: str, file_path: str) -> bool:
     return _is_valid_movie_layout(index_root, file_path)
 
 
-def _index_root_for_video_path(directory: str, _video_path: str) -> str:
-    return find_corrected_directory(directory)
-
-
-def collect_indexed_videos(directory: str) -> dict[str, bool]:
+def collect_indexed_videos(
+    directory: str, tree: Optional[List[Tuple[str, List[str]]]] = None
+) -> dict[str, bool]:
     """Return a mapping of discovered video paths to "already indexed" status.
 
     Walks *directory* recursively (skipping Plex-managed folders) and checks each
-    video file against the library index root (TV root or movies root).
+    video file against the library index root (TV root or movies root). A
+    listing of *directory* from :func:`iter_tree` can be passed as *tree* to
+    reuse it instead of walking again.
 
     Any index read errors are treated as "not indexed" (best-effort).
     """
     indexed_videos: dict[str, bool] = {}
-    for root, _, files in walk(directory):
-        if is_plex_folder(root):
-            continue
-
+    for root, files in iter_tree(directory) if tree is None else tree:
+        index_root = index_root_for_path(directory, root)
+        prefix = join(root, "")
         for file in files:
-            if is_script_temp_file(file):
-                continue
-            if not file.lower().endswith(VIDEO_EXTENSIONS):
+            if not has_video_extension(file):
                 continue
 
-            video_path = join(root, file)
-            index_root = _index_root_for_video_path(directory, video_path)
+            video_path = prefix + file
             try:
                 indexed_videos[video_path] = _is_indexed(index_root, video_path)
             except OSError:
@@ -4,9 +4,12 @@ Logging utilities for Plex Organizer.
 Provides functions to log messages, errors, and duplicate file events to a log file.
 """
 
+from atexit import register
 from os import makedirs
 from os.path import join, splitext, exists
 from datetime import datetime
+from functools import lru_cache
+from threading import Lock
 from .config import (
     get_clear_log,
     get_log_file,
@@ -18,37 +21,117 @@ from .paths import data_dir
 
 SCRIPT_DIR = data_dir()
 
+_log_handle = None  # pylint: disable=invalid-name
+_log_target = None  # pylint: disable=invalid-name
+_log_lock = Lock()
 
-def _log_message(level: str, message: str):
+
+def _open_log_file(log_filename: str, timestamped: bool):
     """
-    Writes a log message with a specified level to the log file.
+    Opens the log file in line-buffered append mode.
+
+    With timestamped log files enabled the file is created under ``logs/`` and
+    named after the time it was opened, so one process writes one file.
 
     Args:
-        level (str): The log level (e.g., "ERROR", "DUPLICATE").
-        message (str): The message to log.
+        log_filename (str): The configured log file name.
+        timestamped (bool): Whether to use a timestamped file under ``logs/``.
+
+    Returns:
+        TextIO: The open log file.
+    """
+    log_path = join(SCRIPT_DIR, log_filename)
+    if timestamped:
+        log_dir = join(SCRIPT_DIR, "logs")
+
+        if not exists(log_dir):
+            makedirs(log_dir, exist_ok=True)
+
+        base, ext = splitext(log_filename)
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        log_path = join(log_dir, f"{base}.{timestamp}{ext}")
+
+    return open(  # pylint: disable=consider-using-with
+        log_path, "a", encoding="utf-8", buffering=1
+    )
+
+
+def close_log():
+    """
+    Closes the persistent log file handle, if one is open.
 
     Returns:
         None
     """
-    if get_enable_logging():
-        log_filename = get_log_file()
+    global _log_handle, _log_target  # pylint: disable=global-statement
+    with _log_lock:
+        if _log_handle is not None:
+            _log_handle.close()
+        _log_handle = None
+        _log_target = None
+
 
-        log_path = join(SCRIPT_DIR, log_filename)
-        if get_timestamped_log_files():
-            log_dir = join(SCRIPT_DIR, "logs")
+register(close_log)
 
-            if not exists(log_dir):
-                makedirs(log_dir, exist_ok=True)
 
-            base, ext = splitext(log_filename)
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            log_filename = f"{base}.{timestamp}{ext}"
-            log_path = join(log_dir, log_filename)
+@lru_cache(maxsize=1)
+def _settings():
+    """
+    Returns a snapshot of the logging settings.
+
+    The values are read from the config once and reused for every message;
+    call ``reload_config`` after the config file changes.
+
+    Returns:
+        tuple: ``(enabled, log_file, timestamped, debug)``.
+    """
+    return (
+        get_enable_logging(),
+        get_log_file(),
+        get_timestamped_log_files(),
+        get_logging_level().upper() == "DEBUG",
+    )
 
-        with open(log_path, "a", encoding="utf-8") as log_file_obj:
-            log_file_obj.write(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - [{level}] - {message}\n"
-            )
+
+def reload_config():
+    """
+    Discards the logging settings snapshot so the next message re-reads them.
+
+    Returns:
+        None
+    """
+    _settings.cache_clear()
+
+
+def _log_message(level: str, message: str):
+    """
+    Writes a log message with a specified level to the log file.
+
+    The log file is opened on first use and kept open for the rest of the
+    process; it is reopened only when the configured target changes.
+
+    Args:
+        level (str): The log level (e.g., "ERROR", "DUPLICATE").
+        message (str): The message to log.
+
+    Returns:
+        None
+    """
+    global _log_handle, _log_target  # pylint: disable=global-statement
+    enabled, log_filename, timestamped, _ = _settings()
+    if not enabled:
+        return
+
+    target = (SCRIPT_DIR, log_filename, timestamped)
+    line = f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - [{level}] - {message}\n"
+    with _log_lock:
+        if _log_handle is None or target != _log_target:
+            if _log_handle is not None:
+                _log_handle.close()
+                _log_handle = None
+            _log_handle = _open_log_file(target[1], target[2])
+            _log_target = target
+        _log_handle.write(line)
 
 
 def log_error(message: str):
@@ -87,7 +170,7 @@ def log_debug(message: str):
     Returns:
         None
     """
-    if get_logging_level().upper() == "DEBUG":
+    if _settings()[3]:
         _log_message("DEBUG", message)
 
 
@@ -16,6 +16,7 @@ numbered menu with ``q`` to quit:
 from __future__ import annotations
 
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
 from contextlib import ExitStack
 from datetime import datetime
@@ -55,6 +56,7 @@ from subprocess import (
 )
 from sys import exit as sys_exit, modules as _modules
 from tempfile import NamedTemporaryFile
+from threading import Lock
 from typing import Dict, Set
 from unittest.mock import patch
 
@@ -62,12 +64,14 @@ from . import config as _config
 from .paths import data_dir
 from .audio.tagging import tag_audio_track_languages
 from .config import ensure_config_exists
-from .const import INDEX_FILENAME, VIDEO_EXTENSIONS
+from .const import INDEX_FILENAME
 from .dataclass import IndexSummary
+from .log import reload_config as reload_log_config
 from .indexing import (
     index_root_for_path,
-    mark_indexed,
+    mark_indexed_bulk,
     migrate_show_indexes_to_tv_root,
+    processed_timestamp,
     prune_index,
     should_index_video,
 )
@@ -75,13 +79,21 @@ from .subs.embedding import merge_subtitles_in_directory
 from .subs.fetching import fetch_subtitles_in_directory
 from .subs.syncing import sync_subtitles_in_directory
 from .pipeline import (
-    analyze_video_languages,
     delete_empty_directories,
     delete_unwanted_files,
-    get_video_files_to_process,
     move_directories,
+    process_root,
+    walk_library,
+)
+from .utils import (
+    clear_stat_cache,
+    has_video_extension,
+    is_main_folder,
+    is_plex_folder,
+    is_script_temp_file,
+    iter_tree,
+    scandir_walk,
 )
-from .utils import is_main_folder, is_plex_folder, is_script_temp_file
 
 __all__ = [
     "_expand_folder",
@@ -96,6 +108,10 @@ __all__ = [
 ]
 
 LOCK_FILENAME = ".plex_organizer.lock"
+INDEX_SCAN_WORKERS = 8
+
+# Serialises index-key cache loads and index writes across scan workers.
+_INDEX_LOCK = Lock()
 
 
 def _find_pids() -> list[int]:
@@ -168,8 +184,7 @@ def kill_run() -> None:
 
 def _rel_key(index_root: str, file_path: str) -> str:
     """Return the index key for *file_path* relative to *index_root*."""
-    rel = relpath(file_path, index_root)
-    return normpath(rel)
+    return relpath(file_path, index_root)
 
 
 def _read_index_keys(index_root: str) -> Set[str]:
@@ -208,14 +223,10 @@ def _directories_to_scan(start_dir: str) -> list[str]:
     if isdir(tv_dir) and isdir(movies_dir):
         return [tv_dir, movies_dir]
 
-    base = basename(normpath(start_dir)).lower()
-    if base == "tv":
-        return [start_dir]
-    if base == "movies":
-        return [start_dir]
-
-    parent = basename(dirname(normpath(start_dir))).lower()
-    if parent == "tv":
+    normalized = normpath(start_dir)
+    base = basename(normalized).lower()
+    parent = basename(dirname(normalized)).lower()
+    if base in ("tv", "movies") or parent == "tv":
         return [start_dir]
 
     raise ValueError(
@@ -236,9 +247,7 @@ def _add_summary(a: IndexSummary, b: IndexSummary) -> IndexSummary:
 
 def _is_video_candidate(file_name: str) -> bool:
     """Return True if *file_name* is a video file we should consider."""
-    if is_script_temp_file(file_name):
-        return False
-    return file_name.lower().endswith(VIDEO_EXTENSIONS)
+    return has_video_extension(file_name) and not is_script_temp_file(file_name)
 
 
 def _safe_should_index_video(index_root: str, video_path: str) -> bool:
@@ -249,10 +258,12 @@ def _safe_should_index_video(index_root: str, video_path: str) -> bool:
         return False
 
 
-def _safe_mark_indexed(index_root: str, video_path: str) -> bool:
-    """Best-effort wrapper for ``mark_indexed``."""
+def _safe_mark_indexed(
+    index_root: str, video_paths: list[str], processed_at: str | None = None
+) -> bool:
+    """Best-effort wrapper for ``mark_indexed_bulk``."""
     try:
-        mark_indexed(index_root, video_path)
+        mark_indexed_bulk(index_root, video_paths, processed_at)
         return True
     except OSError:
         return False
@@ -272,6 +283,7 @@ def _scan_and_index_root(
     root: str,
     files: list[str],
     cache: Dict[str, Set[str]],
+    processed_at: str | None = None,
 ) -> IndexSummary:
     """Scan a single filesystem *root* and update index files as needed."""
     total_videos = 0
@@ -282,14 +294,17 @@ def _scan_and_index_root(
         return IndexSummary(0, 0, 0)
 
     index_root = index_root_for_path(directory, root)
-    index_keys = _get_or_load_index_keys(cache, index_root)
+    with _INDEX_LOCK:
+        index_keys = _get_or_load_index_keys(cache, index_root)
+    pending: Dict[str, str] = {}
+    prefix = join(root, "")
 
     for file_name in files:
         if not _is_video_candidate(file_name):
             continue
 
         total_videos += 1
-        video_path = join(root, file_name)
+        video_path = prefix + file_name
         if not _safe_should_index_video(index_root, video_path):
             continue
 
@@ -298,11 +313,13 @@ def _scan_and_index_root(
         if key in index_keys:
             continue
 
-        if not _safe_mark_indexed(index_root, video_path):
-            continue
+        pending[key] = video_path
 
-        index_keys.add(key)
-        newly_indexed += 1
+    if pending:
+        with _INDEX_LOCK:
+            if _safe_mark_indexed(index_root, list(pending.values()), processed_at):
+                index_keys.update(pending)
+                newly_indexed = len(pending)
 
     return IndexSummary(
         total_videos=total_videos,
@@ -314,12 +331,22 @@ def _scan_and_index_root(
 def _scan_and_index_directory(
     directory: str, cache: Dict[str, Set[str]]
 ) -> IndexSummary:
-    """Walk *directory* recursively and update index files (best-effort)."""
+    """Walk *directory* recursively and update index files (best-effort).
+
+    Each folder is scanned on a worker thread so filesystem latency (e.g. on
+    network mounts) overlaps; index writes stay serialised by ``_INDEX_LOCK``.
+    """
     summary = IndexSummary(0, 0, 0)
-    for root, _, files in walk(directory):
-        summary = _add_summary(
-            summary, _scan_and_index_root(directory, root, files, cache)
-        )
+    processed_at = processed_timestamp()
+    with ThreadPoolExecutor(max_workers=INDEX_SCAN_WORKERS) as pool:
+        futures = [
+            pool.submit(
+                _scan_and_index_root, directory, root, files, cache, processed_at
+            )
+            for root, files in iter_tree(directory)
+        ]
+        for future in futures:
+            summary = _add_summary(summary, future.result())
     return summary
 
 
@@ -619,6 +646,8 @@ def migrate_config(old_path: str) -> int:
 
     with open(_config_path(), "w", encoding="utf-8") as f:
         current.write(f)
+    _config._load_config.cache_clear()  # pylint: disable=protected-access
+    reload_log_config()
 
     return added
 
@@ -733,12 +762,12 @@ def _expand_folder(folder: str) -> list[str]:
 
 def _index_root_videos(index_root: str, root: str, files: list[str]) -> None:
     """Mark un-indexed video files in a single *root* directory."""
-    for f in files:
-        if not _is_video_candidate(f):
-            continue
-        video_path = join(root, f)
-        if should_index_video(index_root, video_path):
-            mark_indexed(index_root, video_path)
+    prefix = join(root, "")
+    video_paths = [prefix + f for f in files if _is_video_candidate(f)]
+    mark_indexed_bulk(
+        index_root,
+        [path for path in video_paths if should_index_video(index_root, path)],
+    )
 
 
 def _index_directory_videos(directory: str) -> None:
@@ -762,17 +791,18 @@ def _update_index_after_custom_run(folder: str) -> None:
         _index_directory_videos(directory)
 
 
-def _find_all_videos(folder: str) -> list[str]:
-    """Return paths for every video file under *folder*, ignoring the index."""
+def _find_all_videos(
+    folder: str, tree: list[tuple[str, list[str]]] | None = None
+) -> list[str]:
+    """Return paths for every video file under *folder*, ignoring the index.
+
+    *tree* is an :func:`iter_tree` listing of *folder* to reuse, if the caller
+    already has one.
+    """
     videos: list[str] = []
-    for root, _, files in walk(folder):
-        if is_plex_folder(root):
-            continue
-        for f in files:
-            if is_script_temp_file(f):
-                continue
-            if f.lower().endswith(VIDEO_EXTENSIONS):
-                videos.append(join(root, f))
+    for root, files in iter_tree(folder) if tree is None else tree:
+        prefix = join(root, "")
+        videos.extend(prefix + f for f in files if has_video_extension(f))
     return videos
 
 
@@ -815,11 +845,6 @@ def _prompt_int(input_fn, prompt: str, default: int) -> int:
         return default
 
 
-def _no_index_video_map(folder: str) -> dict[str, bool]:
-    """Return a video map where nothing is marked as indexed."""
-    return dict.fromkeys(_find_all_videos(folder), False)
-
-
 def _collect_pipeline_settings(input_fn) -> dict:
     """Prompt the user for all pipeline toggles and return them as a dict."""
     print(f"\n  {_heading('Configure pipeline settings:')}\n")
@@ -872,21 +897,19 @@ def _run_full_pipeline(folder: str, input_fn=input) -> None:
     print()
 
     for directory in _expand_folder(folder):
-        all_videos = _find_all_videos(directory)
-        no_index = _no_index_video_map(directory)
+        clear_stat_cache()
+        tree = list(iter_tree(directory))
+        all_videos = _find_all_videos(directory, tree)
 
         with _pipeline_patches(settings):
-            merge_subtitles_in_directory(directory, video_paths=all_videos)
+            merge_subtitles_in_directory(directory, video_paths=all_videos, tree=tree)
             fetch_subtitles_in_directory(directory, video_paths=all_videos)
             sync_subtitles_in_directory(directory, video_paths=all_videos)
 
-            for root, _, files in walk(directory, topdown=False):
-                videos = get_video_files_to_process(root, files, no_index)
-                analyze_video_languages(root, videos)
-                delete_unwanted_files(root, files)
-                move_directories(directory, root, videos)
+            for root, dirs, files in walk_library(directory):
+                process_root(directory, root, dirs, files, set())
 
-            delete_empty_directories(directory)
+            delete_empty_directories(directory, already_swept=True)
 
     _update_index_after_custom_run(folder)
 
@@ -897,7 +920,8 @@ def _run_embed_subs(folder: str, input_fn=input) -> None:
     print()
 
     for directory in _expand_folder(folder):
-        vids = _find_all_videos(directory)
+        tree = list(iter_tree(directory))
+        vids = _find_all_videos(directory, tree)
         with (
             patch(
                 "plex_organizer.subs.embedding.get_enable_subtitle_embedding",
@@ -908,7 +932,7 @@ def _run_embed_subs(folder: str, input_fn=input) -> None:
                 return_value=analyze,
             ),
         ):
-            merge_subtitles_in_directory(directory, video_paths=vids)
+            merge_subtitles_in_directory(directory, video_paths=vids, tree=tree)
 
     _update_index_after_custom_run(folder)
 
@@ -964,7 +988,7 @@ def _run_tag_audio(folder: str, input_fn=input) -> None:
 
 def _run_cleanup(folder: str, **_kwargs) -> None:
     for directory in _expand_folder(folder):
-        for root, _, files in walk(directory, topdown=False):
+        for root, _, files in scandir_walk(directory):
             delete_unwanted_files(root, files)
 
     _update_index_after_custom_run(folder)
@@ -978,7 +1002,7 @@ def _run_rename_move(folder: str, input_fn=input) -> None:
     print()
 
     for directory in _expand_folder(folder):
-        no_index = _no_index_video_map(directory)
+        clear_stat_cache()
         with (
             patch(
                 "plex_organizer.utils.get_include_quality",
@@ -993,13 +1017,8 @@ def _run_rename_move(folder: str, input_fn=input) -> None:
                 return_value=del_dups,
             ),
         ):
-            for root, _, files in walk(directory, topdown=False):
-                videos = [
-                    f
-                    for f in files
-                    if f.lower().endswith(VIDEO_EXTENSIONS)
-                    and not no_index.get(join(root, f), False)
-                ]
+            for root, _, files in scandir_walk(directory):
+                videos = [f for f in files if has_video_extension(f)]
                 move_directories(directory, root, videos)
 
     _update_index_after_custom_run(folder)
@@ -1131,6 +1150,7 @@ _CONFIG_KEY_TYPES: dict[tuple[str, str], str] = {
     ("Settings", "include_quality"): "bool",
     ("Settings", "capitalize"): "bool",
     ("Settings", "cpu_threads"): "int",
+    ("Settings", "sample_max_size_mb"): "int",
     ("Logging", "enable_logging"): "bool",
     ("Logging", "log_file"): "str",
     ("Logging", "clear_log"): "bool",
@@ -1138,11 +1158,14 @@ _CONFIG_KEY_TYPES: dict[tuple[str, str], str] = {
     ("Logging", "level"): "str",
     ("Audio", "enable_audio_tagging"): "bool",
     ("Audio", "whisper_model_size"): "str",
+    ("Audio", "tagging_workers"): "int",
     ("Subtitles", "enable_subtitle_embedding"): "bool",
     ("Subtitles", "analyze_embedded_subtitles"): "bool",
     ("Subtitles", "fetch_subtitles"): "str",
     ("Subtitles", "subtitle_providers"): "str",
     ("Subtitles", "sync_subtitles"): "bool",
+    ("Subtitles", "detection_languages"): "str",
+    ("Subtitles", "parallel_workers"): "int",
 }
 
 
@@ -1245,6 +1268,8 @@ def _action_edit_config(input_fn=input) -> None:
         config.set(section, key, new_value)
         with open(_config_path(), "w", encoding="utf-8") as f:
             config.write(f)
+        _config._load_config.cache_clear()  # pylint: disable=protected-access
+        reload_log_config()
         print(f"    {_key('Saved.')}")
 
 
@@ -5,61 +5,185 @@ and logging errors or duplicates.
 """
 
 from os import makedirs
-from os.path import join, splitext, exists
-from re import findall as re_findall, match as re_match, sub
+from os.path import join
+from re import compile as re_compile
+from typing import List, Optional, Tuple
 from .log import log_error
 from .ffmpeg_utils import probe_video_quality
-from .utils import move_file, create_name, capitalize, find_corrected_directory
+from .utils import (
+    cached_exists,
+    capitalize,
+    create_name,
+    find_corrected_directory,
+    forget_paths,
+    move_file,
+    split_extension,
+)
+
+_MOVIE_NAME_RE = re_compile(
+    r"^(.*?)(?:[.\s])?((?:\(?\d{4}\)?[.\s)]+)+)(?:.*?(\d{3,4}p))?.*"
+)
+_YEAR_RE = re_compile(r"\d{4}")
+_QUALITY_RE = re_compile(r"\d{3,4}p")
+_QUALITY_SUFFIX_RE = re_compile(r" \d{3,4}p$")
+
+
+def _parse_final_name(file: str) -> Optional[Tuple[str, str, Optional[str]]]:
+    """
+    Parses a filename that is already in the ``Name (Year)[ Quality].ext`` layout.
 
+    Only names without digits before the year are accepted; for those the
+    general pattern is guaranteed to split the name the same way, so the
+    regex can be skipped.
 
-def _create_name(file: str, root: str) -> str:
+    Args:
+        file (str): The movie filename.
+
+    Returns:
+        tuple | None: ``(name, year, quality)``, or None when *file* needs the
+        general pattern.
     """
-    Creates a standardized movie file name based on its current name.
+    stem, dot, _ = file.rpartition(".")
+    if not dot:
+        return None
 
-    The new name format is: "Name (Year) [Quality].Extension".
-    Quality is only included when enabled via config and when it can be detected.
+    quality = None
+    head, space, tail = stem.rpartition(" ")
+    if space and tail[-1:] == "p" and 3 <= len(tail) - 1 <= 4 and tail[:-1].isdecimal():
+        stem, quality = head, tail
+
+    if (
+        len(stem) <= 7
+        or stem[-7:-5] != " ("
+        or stem[-1] != ")"
+        or not stem[-5:-1].isdecimal()
+    ):
+        return None
+
+    name = stem[:-7]
+    if any(char.isdigit() for char in name):
+        return None
+
+    return name.replace(".", " ").replace("(", "").strip(), stem[-5:-1], quality
+
+
+def _split_dotted_name(file: str) -> Optional[Tuple[str, List[str], int]]:
+    """
+    Splits a dot-separated release name (``Name.Of.Movie.2010.1080p...``) by hand.
+
+    Handles names without whitespace or parentheses whose first token ending in
+    four digits is exactly a four-digit year; for those the result is identical
+    to what ``_MOVIE_NAME_RE`` would capture. Anything else returns None so the
+    caller can fall back to the pattern.
 
     Args:
         file (str): The movie filename.
-        root (str): The current directory containing *file*, used for probing
-            video quality from the file when the filename lacks a quality tag.
 
     Returns:
-        str: The standardized file name (or the original name if no rename is possible).
+        tuple | None: ``(prefix, years, rest)`` where *prefix* is the raw text
+        before the first year, *years* the consecutive year tokens and *rest*
+        the offset where the text after the years starts.
     """
-    match = re_match(
-        r"^(.*?)(?:[.\s])?((?:\(?\d{4}\)?[.\s)]+)+)(?:.*?(\d{3,4}p))?.*", file
-    )
+    if "(" in file or ")" in file or len(file.split()) != 1:
+        return None
+
+    tokens = file.split(".")
+    last = len(tokens) - 1
+    for start in range(last):
+        token = tokens[start]
+        if len(token) >= 4 and token[-4:].isdecimal():
+            if len(token) != 4:
+                return None
+            break
+    else:
+        return None
 
-    if not match:
-        log_error(f"Filename does not match expected pattern: {file}. Skipping rename.")
-        return file
+    years = [tokens[start]]
+    end = start + 1
+    while True:
+        while end < last and not tokens[end]:
+            end += 1
+        token = tokens[end]
+        if end == last or len(token) != 4 or not token.isdecimal():
+            break
+        years.append(token)
+        end += 1
 
-    years = re_findall(r"\d{4}", match.group(2))
+    return ".".join(tokens[:start]), years, len(".".join(tokens[:end])) + 1
 
-    if not match.group(1):
+
+def _parse_name(file: str) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+    """
+    Parses a raw movie filename into its name, year and quality parts.
+
+    Dot-separated release names are split by hand; everything else goes
+    through the general movie-name pattern.
+
+    Args:
+        file (str): The movie filename.
+
+    Returns:
+        tuple | None: ``(name, year, quality)``, or None when *file* does not match.
+    """
+    parts = _split_dotted_name(file)
+    if parts:
+        prefix, years, rest = parts
+        quality_match = _QUALITY_RE.search(file, rest)
+        quality = quality_match.group(0) if quality_match else None
+    else:
+        match = _MOVIE_NAME_RE.match(file)
+        if not match:
+            return None
+        prefix = match.group(1)
+        years = _YEAR_RE.findall(match.group(2))
+        quality = match.group(3) if match.group(3) else None
+
+    if not prefix:
         name = " ".join(years[:-1]) if len(years) >= 2 else years[0]
         year = years[-1]
     else:
-        name = match.group(1).replace(".", " ").replace("(", "").strip()
+        name = prefix.replace(".", " ").replace("(", "").strip()
         year = years[0] if years else None
         if len(years) >= 2:
             year = years[1]
             name = f"{name} {years[0]}"
 
+    return name, year, quality
+
+
+def _create_name(file: str, root: str) -> str:
+    """
+    Creates a standardized movie file name based on its current name.
+
+    The new name format is: "Name (Year) [Quality].Extension".
+    Quality is only included when enabled via config and when it can be detected.
+
+    Args:
+        file (str): The movie filename.
+        root (str): The current directory containing *file*, used for probing
+            video quality from the file when the filename lacks a quality tag.
+
+    Returns:
+        str: The standardized file name (or the original name if no rename is possible).
+    """
+    parsed = _parse_final_name(file) or _parse_name(file)
+
+    if not parsed:
+        log_error(f"Filename does not match expected pattern: {file}. Skipping rename.")
+        return file
+
+    name, year, quality = parsed
     name_parts = [capitalize(name) if name else None]
 
     if year:
         name_parts.append(f"({year})")
 
-    quality = match.group(3) if match.group(3) else None
-
     if not quality and root:
         quality = probe_video_quality(join(root, file))
 
     return create_name(
         name_parts,
-        splitext(file)[1],
+        split_extension(file)[1],
         quality,
     )
 
@@ -80,7 +204,7 @@ def move(directory: str, root: str, file: str) -> str:
         None
     """
     new_name = _create_name(file, root)
-    movie_folder = sub(r" \d{3,4}p$", "", splitext(new_name)[0])
+    movie_folder = _QUALITY_SUFFIX_RE.sub("", split_extension(new_name)[0])
     movies_root = find_corrected_directory(directory)
     movie_dir = join(movies_root, movie_folder)
 
@@ -90,8 +214,9 @@ def move(directory: str, root: str, file: str) -> str:
     if source_path == destination_path:
         return destination_path
 
-    if not exists(movie_dir):
+    if not cached_exists(movie_dir):
         makedirs(movie_dir)
+        forget_paths(movie_dir)
 
     move_file(source_path, destination_path)
     return destination_path
@@ -15,18 +15,19 @@ folder containing ``tv/`` and/or ``movies/``), and performs these steps:
 It can also remove a completed torrent from qBittorrent when a torrent hash is provided.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from errno import EAGAIN, EWOULDBLOCK
-from os import walk
 from os.path import join
 from fcntl import flock, LOCK_EX, LOCK_NB
-from time import sleep
 
 from .log import log_error, check_clear_log, log_debug
 from .qb import remove_torrent
 from .utils import (
+    clear_stat_cache,
     is_tv_dir,
     is_main_folder,
     is_media_directory,
+    iter_tree,
 )
 from .config import ensure_config_exists
 from .paths import data_dir
@@ -37,13 +38,7 @@ from .indexing import (
     collect_indexed_videos,
     migrate_show_indexes_to_tv_root,
 )
-from .pipeline import (
-    analyze_video_languages,
-    delete_unwanted_files,
-    delete_empty_directories,
-    move_directories,
-    get_video_files_to_process,
-)
+from .pipeline import delete_empty_directories, process_root, walk_library
 
 _lock_handle = None  # pylint: disable=invalid-name
 
@@ -51,8 +46,10 @@ _lock_handle = None  # pylint: disable=invalid-name
 def _get_lock():
     """Best-effort single-instance lock.
 
-    Repeatedly attempts to acquire a non-blocking exclusive lock on a lock file.
-    If another process holds the lock, the function sleeps and retries.
+    Opens the lock file once and tries a non-blocking exclusive lock on it. If
+    another process holds the lock, it logs that and then blocks in ``flock``
+    until the lock is released, so the wait ends as soon as the other instance
+    exits instead of on the next polling interval.
 
     The file handle is kept open (in the module-level ``_lock_handle``) for the
     lifetime of the process so the advisory lock is not released prematurely.
@@ -60,30 +57,28 @@ def _get_lock():
     Note: the lock is advisory (``flock``).
     """
     global _lock_handle  # pylint: disable=global-statement
-    lock_file_path = join(data_dir(), ".plex_organizer.lock")
-    while True:
+    if _lock_handle is None:
+        _lock_handle = open(  # pylint: disable=consider-using-with
+            join(data_dir(), ".plex_organizer.lock"), "a", encoding="utf-8"
+        )
+    try:
         try:
-            _lock_handle = open(  # pylint: disable=consider-using-with
-                lock_file_path, "a", encoding="utf-8"
-            )
             flock(_lock_handle, LOCK_EX | LOCK_NB)
-            break
+            return
         except OSError as exc:
-            if _lock_handle is not None:
-                _lock_handle.close()
-                _lock_handle = None
-            if exc.errno in (EAGAIN, EWOULDBLOCK):
-                log_debug(
-                    "Another instance of Plex Organizer is already running. "
-                    "Waiting..."
-                )
-                sleep(10)
-            else:
+            if exc.errno not in (EAGAIN, EWOULDBLOCK):
                 raise
+        log_debug("Another instance of Plex Organizer is already running. Waiting...")
+        flock(_lock_handle, LOCK_EX)
+    except OSError:
+        _lock_handle.close()
+        _lock_handle = None
+        raise
 
 
 def _process_directory(directory: str):
     """Run the full organizer pipeline for a single directory tree."""
+    clear_stat_cache()
     if is_tv_dir(directory):
         migrated = migrate_show_indexes_to_tv_root(directory)
         if migrated:
@@ -91,27 +86,58 @@ def _process_directory(directory: str):
                 f"Auto-migrated {migrated} per-show index(es) to TV root: {directory}"
             )
 
-    indexed_videos = collect_indexed_videos(directory)
-    videos_to_process = [p for p, is_done in indexed_videos.items() if not is_done]
+    tree = list(iter_tree(directory))
+    indexed_videos: set[str] = set()
+    videos_to_process: list[str] = []
+    for path, is_done in collect_indexed_videos(directory, tree).items():
+        if is_done:
+            indexed_videos.add(path)
+        else:
+            videos_to_process.append(path)
 
-    merge_subtitles_in_directory(directory, video_paths=videos_to_process)
+    merge_subtitles_in_directory(directory, video_paths=videos_to_process, tree=tree)
     fetch_subtitles_in_directory(directory, video_paths=videos_to_process)
     sync_subtitles_in_directory(directory, video_paths=videos_to_process)
 
-    for root, _, files in walk(directory, topdown=False):
-        videos_to_process = get_video_files_to_process(root, files, indexed_videos)
-        analyze_video_languages(root, videos_to_process)
-        delete_unwanted_files(root, files)
-        move_directories(directory, root, videos_to_process)
+    for root, dirs, files in walk_library(directory):
+        process_root(directory, root, dirs, files, indexed_videos)
+
+    delete_empty_directories(directory, already_swept=True)
+
 
-    delete_empty_directories(directory)
+def _start_torrent_removal(torrent_hash: str | None) -> Future | None:
+    """Remove *torrent_hash* from qBittorrent on a background thread.
+
+    The Web API round trip then overlaps with the disk-bound directory
+    processing instead of delaying it.
+
+    Returns:
+        Future | None: The pending removal, or None when no hash was given.
+    """
+    if not torrent_hash:
+        return None
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="qb")
+    removal = executor.submit(remove_torrent, torrent_hash)
+    executor.shutdown(wait=False)
+    return removal
+
+
+def _wait_for_torrent_removal(removal: Future | None):
+    """Wait for a removal started by :func:`_start_torrent_removal`, logging errors."""
+    if removal is None:
+        return
+    try:
+        removal.result()
+    except (OSError, ValueError) as e:
+        log_error(f"Unhandled entrypoint error occurred: {e}")
 
 
 def main(start_dir: str, torrent_hash: str | None):
     """Organizer entrypoint.
 
-    Ensures config/logs exist, optionally removes a torrent from
-    qBittorrent, then processes either a main folder or a single directory.
+    Ensures config/logs exist, then processes either a main folder or a single
+    directory. When a torrent hash is given, the torrent is removed from
+    qBittorrent concurrently and waited for before returning.
     """
     ensure_config_exists()
     check_clear_log()
@@ -120,11 +146,10 @@ def main(start_dir: str, torrent_hash: str | None):
         f"Starting Plex Organizer with directory: {start_dir} and torrent hash: {torrent_hash}"
     )
 
+    removal = _start_torrent_removal(torrent_hash)
     try:
-        if torrent_hash:
-            remove_torrent(torrent_hash)
-
-        if not is_media_directory(start_dir):
+        main_folder = is_main_folder(start_dir)
+        if not main_folder and not is_media_directory(start_dir):
             log_debug(
                 f"Directory '{start_dir}' is not a recognised media folder. "
                 "Keeping files and exiting."
@@ -132,7 +157,7 @@ def main(start_dir: str, torrent_hash: str | None):
             return
 
         directories = []
-        if is_main_folder(start_dir):
+        if main_folder:
             directories = [
                 join(start_dir, "tv"),
                 join(start_dir, "movies"),
@@ -144,3 +169,5 @@ def main(start_dir: str, torrent_hash: str | None):
             _process_directory(directory)
     except (OSError, ValueError) as e:
         log_error(f"Unhandled entrypoint error occurred: {e}")
+    finally:
+        _wait_for_torrent_removal(removal)
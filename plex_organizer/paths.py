@@ -11,16 +11,20 @@ Resolution order:
    running directly from a repository clone.
 4. ``/root/.config/plex-organizer/`` (default).  Created automatically when no
    higher-priority location matches.
+
+Short-lived scratch files are placed in RAM-backed ``/dev/shm`` when it is
+available (see `scratch_dir`).
 """
 
 from __future__ import annotations
 
-from os import environ, makedirs, getcwd
-from os.path import dirname, abspath, isfile, join
+from os import W_OK, X_OK, access, environ, makedirs, getcwd
+from os.path import dirname, abspath, isdir, isfile, join
 from functools import lru_cache
 
 _PACKAGE_DIR = dirname(abspath(__file__))
 _PACKAGE_PARENT = dirname(_PACKAGE_DIR)
+_SHM_DIR = "/dev/shm"
 
 
 @lru_cache(maxsize=1)
@@ -43,3 +47,16 @@ def data_dir() -> str:
     default = "/root/.config/plex-organizer"
     makedirs(default, exist_ok=True)
     return default
+
+
+@lru_cache(maxsize=1)
+def scratch_dir() -> str | None:
+    """Return a tmpfs directory for short-lived scratch files, if available.
+
+    Returns ``/dev/shm`` when it exists and is writable so that scratch files
+    never touch disk, otherwise ``None`` (the system temp directory).  Pass
+    the result as ``dir=`` to the ``tempfile`` helpers.
+    """
+    if isdir(_SHM_DIR) and access(_SHM_DIR, W_OK | X_OK):
+        return _SHM_DIR
+    return None
@@ -1,91 +1,246 @@
 """Shared pipeline steps used by both the main entrypoint and the manage CLI."""
 
-from os import walk, remove, listdir, rmdir, sep
-from os.path import join, normcase
+from concurrent.futures import ThreadPoolExecutor
+from errno import EEXIST, ENOTDIR, ENOTEMPTY
+from functools import partial
+from os import remove, rmdir, scandir
+from os.path import dirname, getsize, join, normcase, normpath
+from re import compile as re_compile, IGNORECASE
 from shutil import rmtree
 
 from .audio.tagging import tag_audio_track_languages
-from .config import get_enable_audio_tagging
-from .const import UNWANTED_FOLDERS, VIDEO_EXTENSIONS, EXT_FILTER
+from .config import (
+    get_cpu_threads,
+    get_enable_audio_tagging,
+    get_sample_max_size_mb,
+    get_tagging_workers,
+)
+from .const import EXT_FILTER_SET, UNWANTED_FOLDERS_NORMCASE, VIDEO_EXT_SET
 from .indexing import mark_indexed, should_index_video, index_root_for_path
 from .log import log_error, log_debug
 from .movie import move as movie_move
 from .tv import move as tv_move
 from .utils import (
-    find_folders,
+    NORMCASE_FOLDS,
     find_corrected_directory,
+    forget_paths,
+    has_allowed_extension,
     is_plex_folder,
     is_script_temp_file,
     is_tv_dir,
+    scandir_walk,
 )
 
+_SAMPLE_RE = re_compile("sample", IGNORECASE)
+# rmdir errors meaning the folder is still there and not removable as empty.
+_NOT_EMPTY_ERRNOS = frozenset({EEXIST, ENOTDIR, ENOTEMPTY})
+
 
 def analyze_video_languages(root: str, video_files: list[str]):
     """Analyze and tag missing audio language metadata for video files.
 
     This step is enabled/disabled via config and skips Plex-managed folders and
-    temporary files created by this script.
+    temporary files created by this script. Files are tagged concurrently,
+    bounded by the ``tagging_workers`` setting (or the CPU thread count when it
+    is 0), so ffprobe/ffmpeg runs for different files overlap. While files run
+    concurrently, each file's audio streams are sampled one at a time, keeping
+    the number of simultaneous ffmpeg decodes at the pool size.
 
     Args:
         root: Current directory being walked.
         video_files: Filenames present in *root*.
     """
-    if not get_enable_audio_tagging():
+    if not get_enable_audio_tagging() or is_plex_folder(root):
         return
 
-    for file in video_files:
-        if is_plex_folder(root) or is_script_temp_file(file):
-            continue
+    prefix = join(root, "")
+    video_paths = [prefix + f for f in video_files if not is_script_temp_file(f)]
+    if not video_paths:
+        return
+
+    workers = get_tagging_workers() or get_cpu_threads()
+    if workers <= 1 or len(video_paths) == 1:
+        for video_path in video_paths:
+            tag_audio_track_languages(video_path)
+        return
+
+    max_workers = min(len(video_paths), workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(
+            pool.map(partial(tag_audio_track_languages, stream_workers=1), video_paths)
+        )
+
+
+def _delete_unwanted_directories(root: str, dirs: list[str] | None = None):
+    """Delete unwanted subdirectories under *root* (recursive).
+
+    Entry names are checked against the unwanted set before their type, so
+    ordinary files and folders cost a single set lookup. When the caller's walk
+    already listed *root*, its subfolder names are passed as *dirs* and *root*
+    is not scanned again.
+    """
+    if dirs is not None:
+        prefix = join(root, "")
+        keys = map(normcase, dirs) if NORMCASE_FOLDS else dirs
+        unwanted = [
+            prefix + name
+            for name, key in zip(dirs, keys)
+            if key in UNWANTED_FOLDERS_NORMCASE
+        ]
+    else:
+        try:
+            with scandir(root) as entries:
+                unwanted = [
+                    entry.path
+                    for entry in entries
+                    if normcase(entry.name) in UNWANTED_FOLDERS_NORMCASE
+                    and entry.is_dir()
+                ]
+        except OSError as e:
+            log_error(f"Error finding folders in directory {root}: {e}")
+            return
+
+    for folder in unwanted:
+        try:
+            log_debug(f"Deleting unwanted folder: {folder}")
+            rmtree(folder)
+        except OSError as e:
+            log_error(f"Failed to delete folder {folder}: {e}")
+        forget_paths(folder)
+
+
+def _sample_size_limit() -> int:
+    """Return the ``sample_max_size_mb`` setting in bytes (0 means no limit)."""
+    return max(get_sample_max_size_mb(), 0) * 1024 * 1024
+
+
+def _is_sample(file_path: str, file_name: str, size_limit: int) -> bool:
+    """Return True when *file_name* looks like sample media that can be deleted.
 
-        file_path = join(root, file)
-        tag_audio_track_languages(file_path)
+    Only names containing "sample" qualify, and with a *size_limit* the file
+    must also be smaller than it, so full-size releases with an odd name are
+    kept. The size is only read for sample-named files.
+    """
+    if not _SAMPLE_RE.search(file_name):
+        return False
+    if not size_limit:
+        return True
+    try:
+        return getsize(file_path) < size_limit
+    except OSError:
+        return True
+
+
+def _is_unwanted_file(file_path: str, file_name: str, size_limit: int) -> bool:
+    """Return True when *file_name* should be deleted during cleanup."""
+    if has_allowed_extension(file_name) and not _is_sample(
+        file_path, file_name, size_limit
+    ):
+        return False
+    return not is_script_temp_file(file_name)
+
+
+def _delete_files(root: str, file_names: list[str]):
+    """Delete *file_names* from *root*, logging failures."""
+    if not file_names:
+        return
 
+    prefix = join(root, "")
+    deleted: list[str] = []
+    for file in file_names:
+        file_path = prefix + file
+        try:
+            log_debug(f"Deleting unwanted file: {file_path}")
+            remove(file_path)
+        except OSError as e:
+            log_error(f"Failed to delete file {file_path}: {e}")
+        deleted.append(file_path)
 
-def _delete_unwanted_directories(root: str):
-    """Delete unwanted subdirectories under *root* (recursive)."""
-    for folder in find_folders(root):
-        folder_parts = {normcase(part) for part in folder.split(sep)}
-        if any(normcase(unwanted) in folder_parts for unwanted in UNWANTED_FOLDERS):
-            try:
-                log_debug(f"Deleting unwanted folder: {folder}")
-                rmtree(folder)
-            except OSError as e:
-                log_error(f"Failed to delete folder {folder}: {e}")
+    forget_paths(*deleted)
 
 
 def delete_unwanted_files(root: str, files: list[str]):
     """Delete unwanted files and unwanted subfolders under *root*.
 
-    Files are removed when they do not match the allow-list extension filter or when
-    they look like sample media. Temporary files created by this script are preserved.
+    Files are removed when they do not match the allow-list extension filter
+    (case-insensitive) or when they look like sample media smaller than the
+    ``sample_max_size_mb`` setting. Temporary files created by this script are
+    preserved.
 
     Args:
         root: Current directory being walked.
         files: Filenames present in *root*.
     """
     _delete_unwanted_directories(root)
+    prefix = join(root, "")
+    size_limit = _sample_size_limit()
+    _delete_files(
+        root, [f for f in files if _is_unwanted_file(prefix + f, f, size_limit)]
+    )
+
+
+def delete_empty_subdirectories(root: str, dirs: list[str]):
+    """Delete the empty folders among *dirs*, the immediate subfolders of *root*.
+
+    Meant to be called from a bottom-up walk so nested empty folders are
+    removed before their parents are checked. Folders that are already gone
+    (e.g. removed as unwanted earlier in the walk) are skipped.
 
-    unwanted_files = [
-        f for f in files if not f.endswith(EXT_FILTER) or "sample" in f.lower()
-    ]
+    Args:
+        root: Current directory being walked.
+        dirs: Subfolder names present in *root*.
+    """
+    prefix = join(root, "")
+    for dir_name in dirs:
+        _rmdir_if_empty(prefix + dir_name)
+
+
+def delete_empty_directories(directory: str, already_swept: bool = False):
+    """Delete empty subdirectories under the library root of *directory* (post-order).
+
+    Args:
+        directory: The base directory being processed.
+        already_swept: True when the caller's bottom-up walk over *directory*
+            already ran :func:`delete_empty_subdirectories` for every folder. The
+            library is then not walked again; only *directory* itself and its
+            parents below the library root are removed if they are now empty.
+    """
+    base = find_corrected_directory(directory)
+    if already_swept:
+        _delete_empty_parents(directory, base)
+        return
 
-    for file in unwanted_files:
-        if not is_script_temp_file(file):
-            file_path = join(root, file)
-            try:
-                log_debug(f"Deleting unwanted file: {file_path}")
-                remove(file_path)
-            except OSError as e:
-                log_error(f"Failed to delete file {file_path}: {e}")
+    for root, dirs, _ in scandir_walk(base):
+        delete_empty_subdirectories(root, dirs)
 
 
-def delete_empty_directories(directory: str):
-    """Delete empty subdirectories under *directory* (post-order)."""
-    for root, dirs, _ in walk(find_corrected_directory(directory), topdown=False):
-        for dir_name in dirs:
-            dir_path = join(root, dir_name)
-            if not listdir(dir_path):
-                rmdir(dir_path)
+def _delete_empty_parents(directory: str, base: str):
+    """Remove *directory* and its parents while empty, stopping at *base*."""
+    base_prefix = join(base, "")
+    path = normpath(directory)
+    while path.startswith(base_prefix):
+        if not _rmdir_if_empty(path):
+            return
+        path = dirname(path)
+
+
+def _rmdir_if_empty(path: str) -> bool:
+    """Remove *path* if it is an empty folder; return False if it remains.
+
+    ``rmdir`` is attempted directly instead of listing the folder first, so an
+    empty folder costs a single syscall. A folder that is already gone counts
+    as removed; symlinks to folders are left in place.
+    """
+    try:
+        rmdir(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        if e.errno not in _NOT_EMPTY_ERRNOS:
+            raise
+        return False
+    forget_paths(path)
+    return True
 
 
 def move_directories(directory: str, root: str, video_files: list[str]):
@@ -98,40 +253,110 @@ def move_directories(directory: str, root: str, video_files: list[str]):
         root: Current directory being walked.
         video_files: Filenames present in *root*.
     """
+    if is_plex_folder(root):
+        return
 
-    def _move_one(file_name: str) -> str:
-        if is_tv_dir(root):
-            return tv_move(root, file_name)
-        return movie_move(directory, root, file_name)
+    in_tv_dir = is_tv_dir(root)
+    idx_root = index_root_for_path(directory, root)
+    for file in video_files:
+        if is_script_temp_file(file):
+            continue
 
-    def _try_mark(idx_root: str, final_path: str) -> None:
+        if in_tv_dir:
+            final_path = tv_move(root, file)
+        else:
+            final_path = movie_move(directory, root, file)
         try:
             if should_index_video(idx_root, final_path):
                 mark_indexed(idx_root, final_path)
         except OSError:
             pass
 
-    if is_plex_folder(root):
-        return
 
-    idx_root = index_root_for_path(directory, root)
-    for file in video_files:
-        if is_script_temp_file(file):
-            continue
+def classify_files(
+    root: str,
+    files: list[str],
+    indexed_videos: set[str],
+) -> tuple[list[str], list[str]]:
+    """Split *files* into videos to process and unwanted files in one pass.
 
-        final_path = _move_one(file)
-        _try_mark(idx_root, final_path)
+    Videos are files with a video extension that are not yet indexed and not
+    inside a Plex Versions folder. Unwanted files follow the same rules as
+    :func:`delete_unwanted_files`, so sample videos only land in the unwanted
+    list instead of being tagged and moved before their deletion.
+
+    Args:
+        root: Current directory being walked.
+        files: Filenames present in *root*.
+        indexed_videos: Paths of videos that are already indexed.
+
+    Returns:
+        tuple: ``(videos_to_process, unwanted_files)`` as filenames.
+    """
+    prefix = join(root, "")
+    skip_videos = is_plex_folder(root)
+    size_limit = _sample_size_limit()
+    videos: list[str] = []
+    unwanted: list[str] = []
+    # Callables used for every file are bound once so the loop skips lookups.
+    is_sample, is_temp = _is_sample, is_script_temp_file
+    add_video, add_unwanted = videos.append, unwanted.append
+    for file in files:
+        # One lowercased extension serves both the cleanup and video filters.
+        dot = file.rfind(".")
+        ext = file[dot:].lower() if dot != -1 else ""
+        if ext not in EXT_FILTER_SET or is_sample(prefix + file, file, size_limit):
+            if not is_temp(file):
+                add_unwanted(file)
+        elif (
+            not skip_videos
+            and ext in VIDEO_EXT_SET
+            and not is_temp(file)
+            and prefix + file not in indexed_videos
+        ):
+            add_video(file)
+    return videos, unwanted
 
 
-def get_video_files_to_process(
+def process_root(
+    directory: str,
     root: str,
+    dirs: list[str],
     files: list[str],
-    indexed_videos: dict[str, bool],
-) -> list[str]:
-    """Return video filenames from *files* that have not yet been indexed."""
-    return [
-        f
-        for f in files
-        if f.lower().endswith(VIDEO_EXTENSIONS)
-        and not indexed_videos.get(join(root, f), False)
-    ]
+    indexed_videos: set[str],
+):
+    """Run every per-folder pipeline step for one folder of a bottom-up walk.
+
+    The folder's files are classified once, then audio tagging, cleanup,
+    moving and the empty-subfolder sweep run on the pre-sorted lists. Meant
+    for :func:`walk_library`, which does not descend into the unwanted
+    subfolders this step removes whole.
+
+    Args:
+        directory: The base directory being processed.
+        root: Current directory being walked.
+        dirs: Subfolder names present in *root*.
+        files: Filenames present in *root*.
+        indexed_videos: Paths of videos that are already indexed.
+    """
+    videos, unwanted = classify_files(root, files, indexed_videos)
+    analyze_video_languages(root, videos)
+    _delete_unwanted_directories(root, dirs)
+    _delete_files(root, unwanted)
+    move_directories(directory, root, videos)
+    delete_empty_subdirectories(root, dirs)
+
+
+def walk_library(directory: str):
+    """Walk *directory* bottom-up for :func:`process_root`.
+
+    Unwanted folders (see ``UNWANTED_FOLDERS``) are listed but not descended
+    into, since :func:`process_root` removes them whole with their parent.
+
+    Args:
+        directory: The base directory being processed.
+
+    Returns:
+        Iterator: ``(root, dir_names, file_names)`` tuples like :func:`scandir_walk`.
+    """
+    return scandir_walk(directory, UNWANTED_FOLDERS_NORMCASE)
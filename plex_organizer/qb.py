@@ -3,22 +3,93 @@ This module provides functions to interact with the qBittorrent Web API,
 including removing torrents by hash and logging errors if removal fails.
 """
 
-from requests import Session
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from http.cookies import CookieError, SimpleCookie
+from typing import Iterable, List, Tuple
+from urllib.parse import urlencode, urlparse
 
 from .log import log_debug, log_error
 from .config import get_host, get_qbittorrent_password, get_qbittorrent_username
 
+_connection: HTTPConnection | None = None  # pylint: disable=invalid-name
+_connection_host: str | None = None  # pylint: disable=invalid-name
+_session_cookie: str | None = None  # pylint: disable=invalid-name
 
-def _authenticate_session(session: Session) -> bool:
+
+def _get_connection() -> Tuple[HTTPConnection, str]:
     """
-    Authenticates a session with the qBittorrent Web API.
+    Return the shared keep-alive Web API connection, creating it on first use.
+
+    The connection and the login cookie are kept between calls, so removing
+    several torrents in one run performs a single TCP/TLS handshake and a
+    single login. A new connection (and login) is made if the configured host
+    changes.
+
+    Returns:
+        Tuple[HTTPConnection, str]: The shared connection and the path prefix
+            of the configured host.
+    """
+    global _connection, _connection_host, _session_cookie  # pylint: disable=global-statement
+    host = get_host()
+    parsed = urlparse(host)
+    if _connection is None or host != _connection_host:
+        if _connection is not None:
+            _connection.close()
+        connection_cls = HTTPSConnection if parsed.scheme == "https" else HTTPConnection
+        _connection = connection_cls(parsed.netloc, timeout=10)
+        _connection_host = host
+        _session_cookie = None
+    return _connection, parsed.path.rstrip("/")
+
+
+def _post(endpoint: str, data: dict) -> Tuple[int, str, List[str]]:
+    """
+    POST form *data* to a Web API *endpoint* on the shared connection.
+
+    A kept-alive connection the server has already closed is reopened and the
+    request is sent once more.
 
     Args:
-        session (Session): The requests Session object to authenticate.
+        endpoint (str): API path such as ``/api/v2/auth/login``.
+        data (dict): Form fields to send.
+
+    Returns:
+        Tuple[int, str, List[str]]: The status code, the response body and
+            every ``Set-Cookie`` header of the response.
+
+    Raises:
+        HTTPException, OSError: If the request fails on a fresh connection.
+    """
+    connection, prefix = _get_connection()
+    headers = {"Content-Type": "application/x-www-form-urlencoded"}
+    if _session_cookie:
+        headers["Cookie"] = _session_cookie
+    body = urlencode(data)
+
+    try:
+        connection.request("POST", prefix + endpoint, body, headers)
+        response = connection.getresponse()
+    except (HTTPException, OSError):
+        connection.close()
+        connection.request("POST", prefix + endpoint, body, headers)
+        response = connection.getresponse()
+
+    text = response.read().decode("utf-8", errors="replace")
+    return response.status, text, response.msg.get_all("Set-Cookie") or []
+
+
+def _authenticate_session() -> bool:
+    """
+    Authenticates the shared connection with the qBittorrent Web API.
+
+    Stores the cookies set by a successful login for later requests. Older
+    qBittorrent versions name the session cookie ``SID``; 5.x uses
+    ``QBT_SID_<port>``, so every cookie is kept regardless of its name.
 
     Returns:
         bool: True if authentication was successful, False otherwise.
     """
+    global _session_cookie  # pylint: disable=global-statement
     username = get_qbittorrent_username()
     password = get_qbittorrent_password()
 
@@ -30,48 +101,79 @@ def _authenticate_session(session: Session) -> bool:
         log_error("qBittorrent username or password not set in config.")
         return False
 
-    login_url = f"{get_host()}/api/v2/auth/login"
-    login_data = {"username": username, "password": password}
-    login_response = session.post(login_url, data=login_data, timeout=10)
+    _session_cookie = None
+    status, text, set_cookies = _post(
+        "/api/v2/auth/login", {"username": username, "password": password}
+    )
 
-    log_debug(f"qBittorrent login response: {login_response}")
+    log_debug(f"qBittorrent login response: {status} {text}")
 
-    if login_response.status_code != 200 or login_response.text != "Ok.":
-        log_error(f"qBittorrent login failed: {login_response}")
+    if status != 200 or text != "Ok.":
+        log_error(f"qBittorrent login failed: {status} {text}")
         return False
 
+    _session_cookie = _parse_cookies(set_cookies)
     return True
 
 
-def remove_torrent(torrent_hash: str):
+def _parse_cookies(set_cookies: List[str]) -> str | None:
+    """Return a ``Cookie`` header value carrying every cookie in *set_cookies*."""
+    cookie = SimpleCookie()
+    for header in set_cookies:
+        try:
+            cookie.load(header)
+        except CookieError:
+            continue
+    pairs = [f"{name}={morsel.value}" for name, morsel in cookie.items()]
+    return "; ".join(pairs) or None
+
+
+def remove_torrent(torrent_hash: str | Iterable[str]):
     """
-    Removes a torrent from qBittorrent using its hash.
+    Removes one or more torrents from qBittorrent using their hashes.
 
-    Sends a POST request to the qBittorrent Web API to delete the torrent.
-    If the request fails, logs an error and exits the script.
+    Sends a POST request to the qBittorrent Web API to delete the torrents,
+    reusing the shared connection and logging in only when it has no session
+    cookie yet or the cookie has expired. Several hashes are joined with
+    ``|`` and removed in a single request. If the request fails, logs an error.
 
     Args:
-        torrent_hash (str): The hash of the torrent to remove.
+        torrent_hash (str | Iterable[str]): The hash of the torrent to remove,
+            or several hashes to remove together.
 
     Returns:
         None
     """
+    if not isinstance(torrent_hash, str):
+        torrent_hash = "|".join(torrent_hash)
+    if not torrent_hash:
+        return
+
     log_debug(f"Attempting to remove torrent with hash: {torrent_hash}")
 
-    session = Session()
     try:
-        if not _authenticate_session(session):
+        if _session_cookie is None and not _authenticate_session():
             return
 
-        response = session.post(
-            f"{get_host()}/api/v2/torrents/delete",
-            data={"hashes": torrent_hash, "deleteFiles": "false"},
-            timeout=10,
-        )
+        status, text = _delete_torrent(torrent_hash)
+        if status == 403:
+            log_debug("qBittorrent session expired, logging in again.")
+            if not _authenticate_session():
+                return
+            status, text = _delete_torrent(torrent_hash)
+    except (HTTPException, OSError) as e:
+        log_error(f"Error contacting qBittorrent Web API: {e}")
+        return
 
-        log_debug(f"qBittorrent response: {response}")
+    log_debug(f"qBittorrent response: {status} {text}")
 
-        if response.status_code != 200:
-            log_error(f"Error deleting torrent '{torrent_hash}': {response.text}")
-    finally:
-        session.close()
+    if status != 200:
+        log_error(f"Error deleting torrent '{torrent_hash}': {text}")
+
+
+def _delete_torrent(torrent_hash: str) -> Tuple[int, str]:
+    """Send the delete request for *torrent_hash* (``|``-separated), keeping files."""
+    status, text, _ = _post(
+        "/api/v2/torrents/delete", {"hashes": torrent_hash, "deleteFiles": "false"}
+    )
+    return status, text
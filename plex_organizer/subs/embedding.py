@@ -9,21 +9,52 @@ Plex-managed folders are always skipped.
 
 from __future__ import annotations
 
-from hashlib import sha256
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
 from os import listdir, remove, walk
-from os.path import abspath, dirname, isdir, join, isfile, splitext, basename, exists
-from re import sub as re_sub, MULTILINE, search, findall
+from os.path import (
+    abspath,
+    dirname,
+    isdir,
+    join,
+    isfile,
+    splitext,
+    basename,
+    exists,
+    getsize,
+)
+from re import compile as re_compile, MULTILINE
 from tempfile import NamedTemporaryFile
-from typing import Tuple, Any, Dict, List, Optional, Sequence
-from langdetect import DetectorFactory, detect_langs
+from threading import Lock
+from typing import Tuple, Any, Callable, Dict, Iterator, List, Optional, Sequence
+from langdetect.detector_factory import DetectorFactory, PROFILES_DIRECTORY
 from langdetect.lang_detect_exception import LangDetectException
 
-from ..config import get_analyze_embedded_subtitles, get_enable_subtitle_embedding
+try:
+    from blake3 import blake3 as _new_content_hash
+except ImportError:  # pragma: no cover - blake3 is an optional speed-up
+    from hashlib import sha256 as _new_content_hash
+
+try:
+    from gcld3 import NNetLanguageIdentifier
+except ImportError:  # pragma: no cover - gcld3 is an optional speed-up
+    NNetLanguageIdentifier = None  # pylint: disable=invalid-name
+
+from ..config import (
+    get_analyze_embedded_subtitles,
+    get_cpu_threads,
+    get_detection_languages,
+    get_enable_subtitle_embedding,
+    get_fetch_subtitles,
+    get_parallel_workers,
+)
 from ..const import (
     ISO639_1_TO_2,
-    TEXT_SUBTITLE_EXTENSIONS,
-    VIDEO_EXTENSIONS,
-    SUBTITLE_EXTENSIONS,
+    LANGDETECT_PROFILES,
+    TEXT_SUBTITLE_EXT_SET,
+    SUBTITLE_EXT_SET,
 )
 from ..dataclass import SubtitleMergePlan
 from ..ffmpeg_utils import (
@@ -37,10 +68,56 @@ from ..ffmpeg_utils import (
     run_cmd,
 )
 from ..log import log_error, log_debug
-from ..utils import is_plex_folder
+from ..paths import scratch_dir
+from ..utils import has_video_extension, is_plex_folder, iter_tree
 
 DetectorFactory.seed = 0
 
+_SDH_NAME_RE = re_compile(r"(^|[\W_])(sdh|hearing[\W_]*impaired)([\W_]|$)")
+_BRACKET_CUE_RE = re_compile(r"\[[^\]]{1,40}\]")
+_PAREN_CUE_RE = re_compile(r"\([^\)]{1,40}\)")
+_SPEAKER_RE = re_compile(r"^[A-Z][A-Z ]{2,20}:\s", MULTILINE)
+# Line boundaries recognised by str.splitlines(), so line-scoped parts of
+# _CLEAN_RE behave as if the text were processed one line at a time.
+_LINE_BREAKS = r"\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029"
+_CLEAN_RE = re_compile(
+    "|".join(
+        (
+            r"\AWEBVTT\s*\n",
+            r"\b\d{1,2}:\d{2}:\d{2}[\.,]\d{1,3}\s*-->\s*\d{1,2}:\d{2}:\d{2}[\.,]\d{1,3}.*$",
+            # The nine fields in front of the text of an ASS "Dialogue:" line.
+            rf"(?:^|(?<=[{_LINE_BREAKS}]))[^\S{_LINE_BREAKS}]*(?i:dialogue:)"
+            rf"(?:[^,{_LINE_BREAKS}]*,){{9}}",
+            rf"\{{[^}}{_LINE_BREAKS}]*\}}",
+            rf"<[^>{_LINE_BREAKS}]+>",
+            # Punctuation runs stop at "<" and "{" so the tag branches see them.
+            r"[^\w\s<{]+|[<{]",
+            r"[_\d]+",
+        )
+    ),
+    MULTILINE,
+)
+_WS_RE = re_compile(r"\s+")
+
+# Only the first 20 000 cleaned characters reach langdetect; reading 128 KiB
+# leaves room for the timestamps and markup stripped before that.
+_DETECT_READ_BYTES = 128 * 1024
+_DETECT_MAX_CHARS = 20_000
+# Markup-heavy ASS files shrink to roughly a third when cleaned, so this many
+# raw characters still yield the _DETECT_MAX_CHARS that langdetect looks at.
+_CLEAN_MAX_CHARS = 64_000
+# SDH cues are judged by their density near the start of the file.
+_SDH_SCAN_CHARS = 40_000
+
+# CLD3 answers below this probability are re-checked with langdetect.
+_CLD3_MIN_PROBABILITY = 0.7
+_cld3_lock = Lock()
+
+_HASH_CHUNK_SIZE = 64 * 1024
+
+# Text-based (language, SDH) results keyed by normalized subtitle content digest.
+_detection_cache: Dict[str, Tuple[Optional[str], bool]] = {}
+
 
 def _iso639_1_to_2(code: Optional[str]) -> Optional[str]:
     """Convert ISO 639-1 code (e.g. 'en') to ISO 639-2 (e.g. 'eng')."""
@@ -59,11 +136,17 @@ def _iso639_1_to_2(code: Optional[str]) -> Optional[str]:
     return ISO639_1_TO_2.get(folded)
 
 
-def _read_text_best_effort(sub_path: str) -> str:
-    """Read a text file best-effort, handling BOMs and odd encodings."""
+def _read_text_best_effort(sub_path: str, max_bytes: int = -1) -> str:
+    """Read a text file best-effort, handling BOMs and odd encodings.
+
+    Args:
+        sub_path: Path to the text file.
+        max_bytes: Read at most this many bytes from the start of the file;
+            a negative value reads the whole file.
+    """
     try:
         with open(sub_path, "rb") as f:
-            data = f.read()
+            data = f.read(max_bytes)
     except OSError:
         return ""
 
@@ -79,39 +162,70 @@ def _filename_suggests_sdh(sub_path: str) -> bool:
     Note: We intentionally do not label "cc"; user requested no CC tag.
     """
     stem = splitext(basename(sub_path))[0].casefold()
-    return bool(search(r"(^|[\W_])(sdh|hearing[\W_]*impaired)([\W_]|$)", stem))
+    return bool(_SDH_NAME_RE.search(stem))
+
+
+def _has_at_least(matches: Iterator[Any], count: int) -> bool:
+    """Return True if *matches* yields *count* items, consuming no more than that."""
+    return sum(1 for _ in islice(matches, count)) == count
 
 
 def _text_suggests_sdh(raw_text: str) -> bool:
-    """Heuristic SDH detector based on common non-dialogue cues."""
+    """Heuristic SDH detector based on common non-dialogue cues.
+
+    Only the first 40 000 characters are scanned, and each count stops as
+    soon as its threshold is reached.
+    """
     if not raw_text:
         return False
 
-    bracket_cues = len(findall(r"\[[^\]]{1,40}\]", raw_text))
-    paren_cues = len(findall(r"\([^\)]{1,40}\)", raw_text))
-    speaker_labels = len(findall(r"^[A-Z][A-Z ]{2,20}:\s", raw_text, flags=MULTILINE))
+    text = raw_text[:_SDH_SCAN_CHARS]
+    cues = chain(_BRACKET_CUE_RE.finditer(text), _PAREN_CUE_RE.finditer(text))
+    return _has_at_least(cues, 3) or _has_at_least(_SPEAKER_RE.finditer(text), 2)
 
-    return (bracket_cues + paren_cues) >= 3 or speaker_labels >= 2
 
+def _detect_subtitle_language_and_sdh(
+    sub_path: str, content_hash: Optional[str] = None
+) -> tuple[Optional[str], bool]:
+    """Detect (language, SDH) for a text subtitle file best-effort.
 
-def _detect_subtitle_language_and_sdh(sub_path: str) -> tuple[Optional[str], bool]:
-    """Detect (language, SDH) for a text subtitle file best-effort."""
-    if splitext(sub_path)[1].lower() not in TEXT_SUBTITLE_EXTENSIONS:
+    Args:
+        sub_path: Path to the subtitle file.
+        content_hash: Digest of the normalized subtitle content, as computed
+            by :func:`_dedupe_subtitle_inputs`. When given, the text analysis
+            is cached under it so identical payloads are only read and
+            detected once per run.
+    """
+    if splitext(sub_path)[1].lower() not in TEXT_SUBTITLE_EXT_SET:
         return (None, False)
 
-    raw = _read_text_best_effort(sub_path)
-    is_sdh = _filename_suggests_sdh(sub_path) or _text_suggests_sdh(raw)
+    detected = _detection_cache.get(content_hash) if content_hash else None
+    if detected is None:
+        detected = _detect_text_language_and_sdh(sub_path)
+        if content_hash:
+            _detection_cache[content_hash] = detected
 
-    cleaned = _clean_subtitle_text_for_langdetect(raw)
-    if not cleaned:
-        return (None, is_sdh)
+    language, text_sdh = detected
+    return (language, text_sdh or _filename_suggests_sdh(sub_path))
+
+
+def _detect_text_language_and_sdh(sub_path: str) -> tuple[Optional[str], bool]:
+    """Detect (language, SDH) from the text of a subtitle file, ignoring its name."""
+    raw = _read_text_best_effort(sub_path, _DETECT_READ_BYTES)
+    is_sdh = _text_suggests_sdh(raw)
 
+    cleaned = _clean_subtitle_text_for_langdetect(raw, _CLEAN_MAX_CHARS)
     letter_count = sum(1 for ch in cleaned if ch.isalpha())
     if letter_count < 40:
         return (None, is_sdh)
 
+    text = cleaned[:_DETECT_MAX_CHARS]
+    language = _detect_with_cld3(text)
+    if language:
+        return (language, is_sdh)
+
     try:
-        candidates = detect_langs(cleaned[:20_000])
+        candidates = _detect_langs(text)
     except (LangDetectException, ValueError):
         return (None, is_sdh)
     if not candidates:
@@ -122,40 +236,98 @@ def _detect_subtitle_language_and_sdh(sub_path: str) -> tuple[Optional[str], boo
     return (_iso639_1_to_2(iso639_1), is_sdh)
 
 
-def _clean_subtitle_text_for_langdetect(text: str) -> str:
-    """Strip timestamps/markup to get mostly human language tokens."""
-    if not text:
-        return ""
+@lru_cache(maxsize=None)
+def _get_cld3_identifier() -> Any:
+    """Return the shared CLD3 identifier (requires the optional ``gcld3``)."""
+    return NNetLanguageIdentifier(min_num_bytes=0, max_num_bytes=_DETECT_MAX_CHARS)
 
-    text = re_sub(r"^WEBVTT\s*\n", "", text, flags=0)
 
-    text = re_sub(
-        r"\b\d{1,2}:\d{2}:\d{2}[\.,]\d{1,3}\s*-->\s*\d{1,2}:\d{2}:\d{2}[\.,]\d{1,3}.*$",
-        " ",
-        text,
-        flags=MULTILINE,
-    )
-    text = re_sub(r"^\s*\d+\s*$", " ", text, flags=MULTILINE)
+def _detect_with_cld3(text: str) -> Optional[str]:
+    """Return the ISO 639-2 language CLD3 is confident about, if gcld3 is installed.
+
+    CLD3 is much faster than langdetect; None (not installed, unreliable or
+    unmapped result) makes the caller fall back to langdetect.
+    """
+    if NNetLanguageIdentifier is None:
+        return None
+    with _cld3_lock:
+        result = _get_cld3_identifier().FindLanguage(text)
+    if not result.is_reliable or result.probability < _CLD3_MIN_PROBABILITY:
+        return None
+    return _iso639_1_to_2(result.language)
+
+
+def _detection_profile_names() -> Optional[List[str]]:
+    """Return the langdetect profile names to load, or None to load all of them.
+
+    Uses the ``detection_languages`` setting (or ``LANGDETECT_PROFILES`` when it
+    is empty) and always adds the languages subtitles are fetched in.
+    """
+    configured = get_detection_languages()
+    if "all" in configured:
+        return None
+
+    names = set(configured or LANGDETECT_PROFILES)
+    iso639_2_to_1 = {v: k for k, v in ISO639_1_TO_2.items()}
+    for code in get_fetch_subtitles():
+        iso639_1 = iso639_2_to_1.get(code)
+        if iso639_1 == "zh":
+            names.update(("zh-cn", "zh-tw"))
+        elif iso639_1:
+            names.add(iso639_1)
+    return sorted(names)
+
+
+@lru_cache(maxsize=None)
+def _get_detector_factory() -> DetectorFactory:
+    """Return the shared langdetect factory, loading its profiles on first use.
+
+    Only the profiles from :func:`_detection_profile_names` are loaded. Unknown
+    names are skipped, and every profile is loaded if fewer than two remain.
+    """
+    factory = DetectorFactory()
+    names = _detection_profile_names()
+    profiles: List[str] = []
+    for name in names or ():
+        try:
+            with open(join(PROFILES_DIRECTORY, name), encoding="utf-8") as f:
+                profiles.append(f.read())
+        except OSError:
+            log_debug(f"No langdetect profile for '{name}', skipping.")
+
+    if len(profiles) < 2:
+        factory.load_profile(PROFILES_DIRECTORY)
+    else:
+        factory.load_json_profile(profiles)
+    return factory
+
+
+def _detect_langs(text: str) -> list:
+    """Return langdetect's ranked language candidates for *text*.
+
+    Each call creates a fresh detector from the shared factory, so the loaded
+    profiles are reused while per-text state is never shared between threads.
+    """
+    detector = _get_detector_factory().create()
+    detector.append(text)
+    return detector.get_probabilities()
 
-    lines = []
-    for ln in text.splitlines():
-        ln = _ass_dialogue_to_payload(ln)
-        ln = re_sub(r"\{[^}]*\}", " ", ln)
-        ln = re_sub(r"<[^>]+>", " ", ln)
-        lines.append(ln)
-    text = "\n".join(lines)
 
-    text = re_sub(r"[^\w\s]+", " ", text)
-    text = re_sub(r"[_\d]+", " ", text)
-    text = re_sub(r"\s+", " ", text).strip()
-    return text
+def _clean_subtitle_text_for_langdetect(
+    text: str, max_chars: Optional[int] = None
+) -> str:
+    """Strip timestamps/markup to get mostly human language tokens.
 
+    Headers, cue timings, ASS dialogue fields, markup tags, punctuation, digits
+    and underscores are all replaced in a single regex scan, leaving words
+    separated by single spaces. When *max_chars* is given, only that many
+    characters from the start of *text* are cleaned.
+    """
+    if not text:
+        return ""
 
-def _ass_dialogue_to_payload(line: str) -> str:
-    if not line.lstrip().lower().startswith("dialogue:"):
-        return line
-    parts = line.split(",", 9)
-    return parts[9] if len(parts) == 10 else line
+    text = text[:max_chars]
+    return _WS_RE.sub(" ", _CLEAN_RE.sub(" ", text)).strip()
 
 
 def _subtitle_language_needs_tag(language: Optional[str]) -> bool:
@@ -183,14 +355,30 @@ def _lang2_from_title(title: Optional[str]) -> Optional[str]:
     return None
 
 
+def _new_scratch_srt() -> str:
+    """Create an empty temporary ``.srt`` file in the scratch directory."""
+    with NamedTemporaryFile(
+        mode="wb", delete=False, suffix=".srt", dir=scratch_dir()
+    ) as tmp:
+        return tmp.name
+
+
+def _remove_quietly(paths: Sequence[str]) -> None:
+    """Delete temporary files, ignoring errors."""
+    for path in paths:
+        try:
+            remove(path)
+        except OSError:
+            pass
+
+
 def _extract_embedded_subtitle_to_srt(
     ffmpeg: str,
     video_path: str,
     subtitle_stream_index: int,
 ) -> Optional[str]:
     """Extract a subtitle stream to an SRT file for language detection."""
-    with NamedTemporaryFile(mode="wb", delete=False, suffix=".srt") as tmp:
-        tmp_path = tmp.name
+    tmp_path = _new_scratch_srt()
 
     proc = run_cmd(
         [
@@ -203,14 +391,50 @@ def _extract_embedded_subtitle_to_srt(
         ]
     )
     if proc.returncode != 0:
-        try:
-            remove(tmp_path)
-        except OSError:
-            pass
+        _remove_quietly([tmp_path])
         return None
     return tmp_path
 
 
+def _extract_all_embedded_subs(
+    ffmpeg: str, video_path: str, indices: Sequence[int]
+) -> Dict[int, str]:
+    """Extract several subtitle streams to SRT files in one ffmpeg pass.
+
+    The container is read once, with one ``-map``/``-c:s``/output triple per
+    stream. If that run fails (typically because one stream is a bitmap
+    format that cannot be converted to SRT), each stream is extracted on its
+    own so the convertible ones are still detected.
+
+    Args:
+        ffmpeg: Path to the ffmpeg executable.
+        video_path: The media file to read.
+        indices: Subtitle-relative stream indices to extract.
+
+    Returns:
+        Dict[int, str]: Temporary SRT path per successfully extracted index.
+    """
+    if len(indices) == 1:
+        tmp_srt = _extract_embedded_subtitle_to_srt(ffmpeg, video_path, indices[0])
+        return {indices[0]: tmp_srt} if tmp_srt else {}
+
+    extracted = {index: _new_scratch_srt() for index in indices}
+    cmd = ffmpeg_input_cmd(ffmpeg, video_path)
+    for index, tmp_path in extracted.items():
+        cmd.extend(["-map", f"0:s:{index}", "-c:s", "srt", tmp_path])
+
+    if run_cmd(cmd).returncode == 0:
+        return extracted
+
+    _remove_quietly(list(extracted.values()))
+    results: Dict[int, str] = {}
+    for index in indices:
+        tmp_srt = _extract_embedded_subtitle_to_srt(ffmpeg, video_path, index)
+        if tmp_srt:
+            results[index] = tmp_srt
+    return results
+
+
 def _handle_existing_language_tag(out_s_index, language, title_overrides):
     """Apply an ISO-639-2 title override when the stream already has a language tag.
 
@@ -235,18 +459,12 @@ def _handle_title_lang2(out_s_index, title, lang_overrides):
     return False
 
 
-def _handle_tmp_srt(out_s_index, ffmpeg, video_path, lang_overrides, title_overrides):
-    """Extract stream to a temp SRT, detect language/SDH, and apply overrides."""
-    tmp_srt = _extract_embedded_subtitle_to_srt(ffmpeg, video_path, out_s_index)
-    if not tmp_srt:
-        return
+def _handle_tmp_srt(out_s_index, tmp_srt, lang_overrides, title_overrides):
+    """Detect language/SDH in an extracted temp SRT, apply overrides, and delete it."""
     try:
         detected, is_sdh = _detect_subtitle_language_and_sdh(tmp_srt)
     finally:
-        try:
-            remove(tmp_srt)
-        except OSError:
-            pass
+        _remove_quietly([tmp_srt])
     if detected:
         lang_overrides[out_s_index] = detected
         title_overrides[out_s_index] = f"{detected} SDH" if is_sdh else detected
@@ -257,6 +475,7 @@ def _get_overrides(
 ) -> Tuple[Dict[int, str], Dict[int, str]]:
     lang_overrides: Dict[int, str] = {}
     title_overrides: Dict[int, str] = {}
+    needs_detection: List[int] = []
     for out_s_index, stream in enumerate(streams):
         tags = stream.get("tags") or {}
         language = tags.get("language") if isinstance(tags, dict) else None
@@ -269,37 +488,73 @@ def _get_overrides(
         if _handle_title_lang2(out_s_index, title, lang_overrides):
             continue
 
-        _handle_tmp_srt(
-            out_s_index, ffmpeg, video_path, lang_overrides, title_overrides
-        )
+        needs_detection.append(out_s_index)
+
+    if needs_detection:
+        extracted = _extract_all_embedded_subs(ffmpeg, video_path, needs_detection)
+        for out_s_index, tmp_srt in sorted(extracted.items()):
+            _handle_tmp_srt(out_s_index, tmp_srt, lang_overrides, title_overrides)
 
     return lang_overrides, title_overrides
 
 
-def _tag_embedded_subtitle_languages(video_path: str) -> None:
-    """Detect and tag missing language metadata for already-embedded subtitle streams."""
-    if not isfile(video_path):
-        return
+def _probe_embedded_subtitles(
+    video_path: str,
+) -> Tuple[Optional[int], Dict[int, str], Dict[int, str]]:
+    """Probe *video_path*'s subtitle streams and detect their missing tags.
 
-    ffmpeg = get_ffmpeg()
+    Returns:
+        The number of embedded subtitle streams (None when the file was not
+        probed because it is Plex-managed or missing) and the language and
+        title overrides for those streams.
+    """
+    if is_plex_folder(dirname(video_path)) or not isfile(video_path):
+        return None, {}, {}
 
     streams = probe_streams_json(video_path)
     if not streams:
-        return
+        return 0, {}, {}
+
+    return len(streams), *_get_overrides(streams, video_path, get_ffmpeg())
+
 
-    lang_overrides, title_overrides = _get_overrides(streams, video_path, ffmpeg)
+def _embedded_subtitle_overrides(
+    video_path: str,
+) -> Tuple[Dict[int, str], Dict[int, str]]:
+    """Detect the language/title tags missing from *video_path*'s subtitle streams.
+
+    Returns empty overrides for Plex-managed or missing files and for
+    containers without subtitle streams.
+    """
+    _, lang_overrides, title_overrides = _probe_embedded_subtitles(video_path)
+    return lang_overrides, title_overrides
 
+
+def _append_override_metadata(
+    cmd: List[str],
+    lang_overrides: Dict[int, str],
+    title_overrides: Dict[int, str],
+) -> None:
+    """Append ``-metadata:s:s:N`` arguments for subtitle tag overrides to *cmd*."""
+    for out_s_index, lang2 in sorted(lang_overrides.items()):
+        cmd.extend([f"-metadata:s:s:{out_s_index}", f"language={lang2}"])
+    for out_s_index, title in sorted(title_overrides.items()):
+        cmd.extend([f"-metadata:s:s:{out_s_index}", f"title={title}"])
+
+
+def _apply_subtitle_overrides(
+    video_path: str,
+    lang_overrides: Dict[int, str],
+    title_overrides: Dict[int, str],
+) -> None:
+    """Remux *video_path* once to write subtitle tag overrides."""
     if not lang_overrides and not title_overrides:
         return
 
     tmp_out = create_temp_output(video_path, prefix=".submerge.")
     try:
-        cmd = build_ffmpeg_base_cmd(ffmpeg, video_path, [])
-
-        for out_s_index, lang2 in sorted(lang_overrides.items()):
-            cmd.extend([f"-metadata:s:s:{out_s_index}", f"language={lang2}"])
-        for out_s_index, title in sorted(title_overrides.items()):
-            cmd.extend([f"-metadata:s:s:{out_s_index}", f"title={title}"])
+        cmd = build_ffmpeg_base_cmd(get_ffmpeg(), video_path, [])
+        _append_override_metadata(cmd, lang_overrides, title_overrides)
         cmd.append(tmp_out)
 
         proc = run_cmd(cmd)
@@ -321,6 +576,12 @@ def _tag_embedded_subtitle_languages(video_path: str) -> None:
             pass
 
 
+def _tag_embedded_subtitle_languages(video_path: str) -> None:
+    """Detect and tag missing language metadata for already-embedded subtitle streams."""
+    lang_overrides, title_overrides = _embedded_subtitle_overrides(video_path)
+    _apply_subtitle_overrides(video_path, lang_overrides, title_overrides)
+
+
 def _stem_lower(filename: str) -> str:
     """Return the lowercase filename stem (basename without extension)."""
     return splitext(filename)[0].casefold()
@@ -328,12 +589,13 @@ def _stem_lower(filename: str) -> str:
 
 def _is_video(filename: str) -> bool:
     """Return True if filename has a recognized video extension."""
-    return filename.lower().endswith(VIDEO_EXTENSIONS)
+    return has_video_extension(filename)
 
 
 def _is_subtitle(filename: str) -> bool:
     """Return True if filename has a recognized subtitle extension."""
-    return filename.lower().endswith(SUBTITLE_EXTENSIONS)
+    dot = filename.rfind(".")
+    return dot != -1 and filename[dot:].lower() in SUBTITLE_EXT_SET
 
 
 def _is_subtitles_dir_name(name: str) -> bool:
@@ -361,37 +623,62 @@ def _list_immediate_subtitle_dirs(root: str) -> List[str]:
 def _gather_subtitle_files_under(directory: str) -> List[str]:
     """Recursively collect subtitle files under *directory*, skipping Plex folders."""
     found: List[str] = []
+    is_subtitle = _is_subtitle
     for walk_root, _, files in walk(directory, topdown=True):
         if is_plex_folder(walk_root):
             continue
-        for f in files:
-            if _is_subtitle(f):
-                found.append(join(walk_root, f))
+        prefix = join(walk_root, "")
+        found.extend(prefix + f for f in files if is_subtitle(f))
     return found
 
 
 def _is_text_subtitle_path(sub_path: str) -> bool:
     """Return True if subtitle path points to a text-based subtitle format."""
-    return splitext(sub_path)[1].lower() in TEXT_SUBTITLE_EXTENSIONS
-
+    return splitext(sub_path)[1].lower() in TEXT_SUBTITLE_EXT_SET
 
-def _normalized_subtitle_bytes_for_hash(sub_path: str) -> bytes:
-    """Read subtitle bytes normalized for robust de-duplication."""
-    with open(sub_path, "rb") as f:
-        data = f.read()
-
-    if not _is_text_subtitle_path(sub_path):
-        return data
-
-    if data.startswith(b"\xef\xbb\xbf"):
-        data = data[3:]
 
-    data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
-    return data
+def _normalized_subtitle_digest(sub_path: str) -> str:
+    """Return a hex digest of a subtitle's content, normalized for de-duplication.
 
+    BLAKE3 is used when the ``blake3`` package is installed, SHA-256 otherwise;
+    the digest only has to be consistent within one run.
 
-def _dedupe_subtitle_inputs(subtitle_paths: Sequence[str]) -> List[str]:
-    """De-duplicate subtitle inputs by path + content hash (text normalized)."""
+    Text subtitles are hashed without a UTF-8 BOM and with CRLF/CR line endings
+    folded to LF. The file is streamed in chunks; a ``\\r`` at the end of a
+    chunk is held back so a CRLF split across two chunks is still folded.
+    """
+    digest = _new_content_hash()
+    normalize = _is_text_subtitle_path(sub_path)
+    with open(sub_path, "rb") as f:
+        chunk = f.read(_HASH_CHUNK_SIZE)
+        if normalize and chunk.startswith(b"\xef\xbb\xbf"):
+            chunk = chunk[3:]
+        pending_cr = b""
+        while chunk:
+            if normalize:
+                chunk = pending_cr + chunk
+                pending_cr = b"\r" if chunk.endswith(b"\r") else b""
+                if pending_cr:
+                    chunk = chunk[:-1]
+                chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            digest.update(chunk)
+            chunk = f.read(_HASH_CHUNK_SIZE)
+        if pending_cr:
+            digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _dedupe_subtitle_inputs(subtitle_paths: Sequence[str]) -> List[Tuple[str, str]]:
+    """De-duplicate subtitle inputs by path + content hash (text normalized).
+
+    Binary subtitles are only hashed when another input has the same size;
+    a file with a unique size cannot be a duplicate.
+
+    Returns:
+        ``(path, digest)`` pairs for the kept subtitles, where *digest* comes
+        from :func:`_normalized_subtitle_digest`, or is empty for binary
+        subtitles that were not hashed.
+    """
     unique_paths = sorted({abspath(p) for p in subtitle_paths})
 
     idx_stems = {
@@ -403,19 +690,30 @@ def _dedupe_subtitle_inputs(subtitle_paths: Sequence[str]) -> List[str]:
             continue
         pruned.append(p)
 
+    binary_sizes: Dict[str, int] = {}
+    for p in pruned:
+        if not _is_text_subtitle_path(p):
+            try:
+                binary_sizes[p] = getsize(p)
+            except OSError:
+                continue
+    size_counts = Counter(binary_sizes.values())
+
     seen_hashes: set[str] = set()
-    deduped: List[str] = []
+    deduped: List[Tuple[str, str]] = []
     for p in pruned:
+        if p in binary_sizes and size_counts[binary_sizes[p]] == 1:
+            deduped.append((p, ""))
+            continue
         try:
-            payload = _normalized_subtitle_bytes_for_hash(p)
+            digest = _normalized_subtitle_digest(p)
         except OSError:
             continue
 
-        digest = sha256(payload).hexdigest()
         if digest in seen_hashes:
             continue
         seen_hashes.add(digest)
-        deduped.append(p)
+        deduped.append((p, digest))
 
     return deduped
 
@@ -573,7 +871,9 @@ def _add_single_video_remaining_in_root(
     _extend_plan(plans, video_path, remaining)
 
 
-def _discover_plans(directory: str) -> List[SubtitleMergePlan]:
+def _discover_plans(
+    directory: str, tree: Optional[List[Tuple[str, List[str]]]] = None
+) -> List[SubtitleMergePlan]:
     """Return subtitle-embedding plans discovered under a directory.
 
     The discovery logic looks for:
@@ -582,13 +882,13 @@ def _discover_plans(directory: str) -> List[SubtitleMergePlan]:
 
     It attempts to match subtitles to videos by filename stem, and falls back to
     embedding remaining subtitles when a folder contains only a single video.
+
+    *tree* is an :func:`iter_tree` listing of *directory* taken earlier in the
+    run; when omitted the directory is walked here.
     """
     plans: Dict[str, List[str]] = {}
 
-    for root, files in ((r, f) for r, _, f in walk(directory, topdown=True)):
-        if is_plex_folder(root):
-            continue
-
+    for root, files in iter_tree(directory) if tree is None else tree:
         video_files = [f for f in files if _is_video(f)]
         if not video_files:
             continue
@@ -637,27 +937,24 @@ def _mp4_compatible_subtitle_paths(paths: Sequence[str]) -> List[str]:
 
 def _embeddable_subtitles_for_video(
     video_path: str, subtitle_paths: Sequence[str]
-) -> tuple[bool, List[str]]:
-    """Return (is_mp4, subtitle_paths) after filtering to existing/compatible inputs."""
+) -> tuple[bool, List[Tuple[str, str]]]:
+    """Return (is_mp4, subtitles) after filtering to existing/compatible inputs.
+
+    Subtitles are returned as the ``(path, digest)`` pairs produced by
+    :func:`_dedupe_subtitle_inputs`.
+    """
     is_mp4 = splitext(video_path)[1].lower() == ".mp4"
 
     existing_subs = [p for p in subtitle_paths if isfile(p)]
     if not existing_subs:
         return (is_mp4, [])
 
-    existing_subs = _dedupe_subtitle_inputs(existing_subs)
-    if not existing_subs:
-        return (is_mp4, [])
-
-    if is_mp4:
-        existing_subs = _mp4_compatible_subtitle_paths(existing_subs)
-        if not existing_subs:
-            return (is_mp4, [])
-        existing_subs = _dedupe_subtitle_inputs(existing_subs)
-        if not existing_subs:
-            return (is_mp4, [])
+    subtitles = _dedupe_subtitle_inputs(existing_subs)
+    if is_mp4 and subtitles:
+        compatible = set(_mp4_compatible_subtitle_paths([p for p, _ in subtitles]))
+        subtitles = [(p, digest) for p, digest in subtitles if p in compatible]
 
-    return (is_mp4, existing_subs)
+    return (is_mp4, subtitles)
 
 
 def _build_subtitle_embed_cmd(
@@ -666,19 +963,34 @@ def _build_subtitle_embed_cmd(
     subtitle_paths: Sequence[str],
     tmp_path: str,
     is_mp4: bool,
+    content_hashes: Optional[Sequence[str]] = None,
+    overrides: Optional[Tuple[Dict[int, str], Dict[int, str]]] = None,
+    existing_embedded_sub_count: Optional[int] = None,
 ) -> List[str]:
-    """Build an ffmpeg command to embed subtitle inputs into a container."""
-    existing_embedded_sub_count = probe_subtitle_stream_count(video_path)
+    """Build an ffmpeg command to embed subtitle inputs into a container.
+
+    *content_hashes*, when given, holds the normalized content digest of each
+    entry in *subtitle_paths* and lets language detection reuse cached results.
+    *overrides* holds ``(language, title)`` tags for the already-embedded
+    subtitle streams, written in the same remux. *existing_embedded_sub_count*
+    is probed with ffprobe unless the caller already knows it.
+    """
+    if existing_embedded_sub_count is None:
+        existing_embedded_sub_count = probe_subtitle_stream_count(video_path)
     cmd = build_ffmpeg_base_cmd(ffmpeg, video_path, subtitle_paths)
 
     if is_mp4:
-        end = existing_embedded_sub_count + len(subtitle_paths)
-        for out_s_index in range(existing_embedded_sub_count, end):
-            cmd.extend([f"-c:s:{out_s_index}", "mov_text"])
+        for i in range(len(subtitle_paths)):
+            cmd.extend([f"-c:s:{existing_embedded_sub_count + i}", "mov_text"])
+
+    if overrides:
+        _append_override_metadata(cmd, *overrides)
 
     for i, sub_path in enumerate(subtitle_paths):
         out_s_index = existing_embedded_sub_count + i
-        lang2, is_sdh = _detect_subtitle_language_and_sdh(sub_path)
+        lang2, is_sdh = _detect_subtitle_language_and_sdh(
+            sub_path, content_hashes[i] if content_hashes else None
+        )
         if not lang2:
             continue
         cmd.extend([f"-metadata:s:s:{out_s_index}", f"language={lang2}"])
@@ -698,11 +1010,22 @@ def _delete_paths_best_effort(paths: Sequence[str]) -> None:
             log_error(f"Failed to delete file '{p}': {e}")
 
 
-def _embed_subtitles(plan: SubtitleMergePlan) -> None:
+def _embed_and_tag(
+    plan: SubtitleMergePlan,
+    lang_overrides: Optional[Dict[int, str]] = None,
+    title_overrides: Optional[Dict[int, str]] = None,
+    embedded_sub_count: Optional[int] = None,
+) -> None:
     """Embed subtitles described by *plan* into the target video.
 
+    Tag overrides for the video's already-embedded subtitle streams are
+    written by the same ffmpeg remux, so the container is copied only once.
+    *embedded_sub_count* is the number of those streams, when already probed.
     This is a best-effort operation. Failures are logged and do not raise.
     """
+    lang_overrides = lang_overrides or {}
+    title_overrides = title_overrides or {}
+
     if is_plex_folder(plan.video_path) or is_plex_folder(dirname(plan.video_path)):
         return
 
@@ -710,11 +1033,13 @@ def _embed_subtitles(plan: SubtitleMergePlan) -> None:
         log_error(f"Video file not found: {plan.video_path}")
         return
 
-    is_mp4, existing_subs = _embeddable_subtitles_for_video(
+    is_mp4, subtitles = _embeddable_subtitles_for_video(
         plan.video_path, plan.subtitle_paths
     )
-    if not existing_subs:
+    if not subtitles:
+        _apply_subtitle_overrides(plan.video_path, lang_overrides, title_overrides)
         return
+    existing_subs = [p for p, _ in subtitles]
 
     ffmpeg = get_ffmpeg()
 
@@ -722,7 +1047,14 @@ def _embed_subtitles(plan: SubtitleMergePlan) -> None:
 
     try:
         cmd = _build_subtitle_embed_cmd(
-            ffmpeg, plan.video_path, existing_subs, tmp_path, is_mp4
+            ffmpeg,
+            plan.video_path,
+            existing_subs,
+            tmp_path,
+            is_mp4,
+            [digest for _, digest in subtitles],
+            (lang_overrides, title_overrides),
+            embedded_sub_count,
         )
         proc = run_cmd(cmd)
         if proc.returncode != 0:
@@ -750,21 +1082,65 @@ def _embed_subtitles(plan: SubtitleMergePlan) -> None:
             log_error(f"Failed to clean up temporary file '{tmp_path}': {e}")
 
 
+def _for_each_video(func: Callable[[Any], None], items: Sequence[Any]) -> None:
+    """Call *func* for every item, running several at once when allowed.
+
+    Concurrency is bounded by the ``parallel_workers`` setting (or the CPU
+    thread count when it is 0). The work is dominated by ffmpeg/ffprobe
+    subprocesses, so threads are enough to overlap it. The first exception
+    raised by *func* is re-raised once every started call has finished.
+    """
+    workers = get_parallel_workers() or get_cpu_threads()
+    if workers <= 1 or len(items) <= 1:
+        for item in items:
+            func(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(len(items), workers)) as pool:
+        list(pool.map(func, items))
+
+
+def _tag_video_best_effort(video_path: str) -> None:
+    try:
+        if is_plex_folder(dirname(video_path)):
+            return
+        _tag_embedded_subtitle_languages(video_path)
+    except OSError:
+        return
+
+
 def _tag_embedded_subtitle_languages_for_videos(video_paths: list[str]) -> None:
-    for video_path in video_paths:
-        try:
-            if is_plex_folder(dirname(video_path)):
-                continue
-            _tag_embedded_subtitle_languages(video_path)
-        except OSError:
-            continue
+    _for_each_video(_tag_video_best_effort, video_paths)
+
 
+def _merge_plan(plan: SubtitleMergePlan, analyze: bool) -> None:
+    """Embed *plan*'s subtitles, tagging embedded streams in the same remux."""
+    log_debug(
+        f"Embedding subtitles for video: {plan.video_path} "
+        f"from files: {plan.subtitle_paths}"
+    )
+    probed = _probe_embedded_subtitles(plan.video_path) if analyze else (None, {}, {})
+    embedded_sub_count, lang_overrides, title_overrides = probed
+    _embed_and_tag(plan, lang_overrides, title_overrides, embedded_sub_count)
 
-def merge_subtitles_in_directory(directory: str, video_paths: list[str]):
+
+def merge_subtitles_in_directory(
+    directory: str,
+    video_paths: list[str],
+    tree: Optional[List[Tuple[str, List[str]]]] = None,
+):
     """Discover and embed subtitles for videos under *directory*.
 
+    When `[Subtitles] analyze_embedded_subtitles` is enabled, tags missing from
+    already-embedded subtitle streams are written in the same remux that embeds
+    a video's external subtitles; videos without external subtitles are
+    remuxed for tagging alone. Videos are processed concurrently, bounded by
+    `[Subtitles] parallel_workers`.
+
     This is a best-effort operation: failures are logged and will not raise.
     It is a no-op when `[Subtitles] enable_subtitle_embedding` is disabled.
+    Callers that already listed *directory* with :func:`iter_tree` can pass the
+    listing as *tree* to skip a second walk.
     """
     if not get_enable_subtitle_embedding():
         return
@@ -774,18 +1150,17 @@ def merge_subtitles_in_directory(directory: str, video_paths: list[str]):
 
     log_debug(f"Starting subtitle merging scan under directory: {directory}")
 
-    if get_analyze_embedded_subtitles():
-        _tag_embedded_subtitle_languages_for_videos(video_paths)
-
+    analyze = get_analyze_embedded_subtitles()
     allowed = set(video_paths)
-    plans = [p for p in _discover_plans(directory) if p.video_path in allowed]
+    plans = [p for p in _discover_plans(directory, tree) if p.video_path in allowed]
+    if analyze:
+        planned = {plan.video_path for plan in plans}
+        _tag_embedded_subtitle_languages_for_videos(
+            [video_path for video_path in video_paths if video_path not in planned]
+        )
+
     try:
-        for plan in plans:
-            log_debug(
-                f"Embedding subtitles for video: {plan.video_path} "
-                f"from files: {plan.subtitle_paths}"
-            )
-            _embed_subtitles(plan)
+        _for_each_video(lambda plan: _merge_plan(plan, analyze), plans)
     except (OSError, RuntimeError, ValueError) as e:
         log_error(f"Unexpected error during subtitle merging: {e}")
         return
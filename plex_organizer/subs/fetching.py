@@ -22,7 +22,6 @@ from subliminal import (
 )
 
 from ..config import get_fetch_subtitles, get_subtitle_providers
-from ..const import VIDEO_EXTENSIONS
 from ..ffmpeg_utils import (
     build_ffmpeg_base_cmd,
     cleanup_paths,
@@ -34,7 +33,7 @@ from ..ffmpeg_utils import (
     run_cmd,
 )
 from ..log import log_debug, log_error
-from ..utils import is_plex_folder
+from ..utils import has_video_extension, is_plex_folder
 
 region.configure("dogpile.cache.memory", replace_existing_backend=True)
 
@@ -192,7 +191,7 @@ def fetch_subtitles_in_directory(directory: str, video_paths: List[str]) -> None
     log_debug(f"Starting subtitle fetch scan under '{directory}'")
 
     for video_path in video_paths:
-        if not video_path.lower().endswith(VIDEO_EXTENSIONS):
+        if not has_video_extension(video_path):
             continue
         try:
             _fetch_subtitles_for_video(video_path, lang_codes)
@@ -12,12 +12,10 @@ from __future__ import annotations
 
 from hashlib import sha256
 from os.path import isfile, dirname, splitext
-from shutil import which as shutil_which
 from tempfile import NamedTemporaryFile
 from typing import Dict, List
 
 from ..config import get_sync_subtitles
-from ..const import VIDEO_EXTENSIONS
 from ..ffmpeg_utils import (
     COPY_STREAM_ARGS,
     cleanup_paths,
@@ -27,9 +25,10 @@ from ..ffmpeg_utils import (
     probe_streams_json,
     replace_and_restore_timestamps,
     run_cmd,
+    which_cached,
 )
 from ..log import log_debug, log_error
-from ..utils import is_plex_folder
+from ..utils import has_video_extension, is_plex_folder
 from ..const import TEXT_SUB_CODECS, ASS_CODECS
 
 
@@ -224,7 +223,7 @@ def _sync_video_subtitles(video_path: str) -> None:
         return
 
     ffmpeg = get_ffmpeg()
-    ffsubsync_bin = shutil_which("ffsubsync")
+    ffsubsync_bin = which_cached("ffsubsync")
     if not ffsubsync_bin:
         return
 
@@ -279,7 +278,7 @@ def sync_subtitles_in_directory(directory: str, video_paths: List[str]) -> None:
     log_debug(f"Starting subtitle sync scan under '{directory}'")
 
     for video_path in video_paths:
-        if not video_path.lower().endswith(VIDEO_EXTENSIONS):
+        if not has_video_extension(video_path):
             continue
         try:
             _sync_video_subtitles(video_path)
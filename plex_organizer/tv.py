@@ -5,11 +5,23 @@ and logging errors or duplicates.
 """
 
 from os import makedirs, sep
-from os.path import join, splitext, exists
+from os.path import join
 from re import compile as re_compile, IGNORECASE
 
 from .ffmpeg_utils import probe_video_quality
-from .utils import move_file, create_name, capitalize, find_corrected_directory
+from .utils import (
+    cached_exists,
+    capitalize,
+    create_name,
+    find_corrected_directory,
+    forget_paths,
+    move_file,
+    split_extension,
+)
+
+_SEASON_EPISODE_RE = re_compile(r"[. ]S(\d{2})[ .]?E(\d{2})", IGNORECASE)
+_QUALITY_RE = re_compile(r"[. ](\d{3,4}p)", IGNORECASE)
+_SEASON_RE = re_compile(r"S(\d{2})", IGNORECASE)
 
 
 def _create_name(root: str, file: str) -> str:
@@ -28,10 +40,7 @@ def _create_name(root: str, file: str) -> str:
         str: The standardized file name.
     """
     show_name = capitalize(find_corrected_directory(root).split(sep)[-1])
-    season_episode_pattern = re_compile(r"[. ]S(\d{2})[ .]?E(\d{2})", IGNORECASE)
-    quality_pattern = re_compile(r"[. ](\d{3,4}p)", IGNORECASE)
-
-    season_episode_match = season_episode_pattern.search(file)
+    season_episode_match = _SEASON_EPISODE_RE.search(file)
     if season_episode_match:
         season_episode = (
             f"S{season_episode_match.group(1)}E{season_episode_match.group(2)}"
@@ -39,7 +48,7 @@ def _create_name(root: str, file: str) -> str:
     else:
         season_episode = None
 
-    quality_match = quality_pattern.search(file)
+    quality_match = _QUALITY_RE.search(file)
     quality = quality_match.group(1) if quality_match else None
 
     if not quality:
@@ -47,7 +56,7 @@ def _create_name(root: str, file: str) -> str:
 
     return create_name(
         [show_name, season_episode],
-        splitext(file)[1],
+        split_extension(file)[1],
         quality,
     )
 
@@ -68,7 +77,7 @@ def move(root: str, file: str) -> str:
     """
     new_name = _create_name(root, file)
 
-    season_match = re_compile(r"S(\d{2})", IGNORECASE).search(new_name)
+    season_match = _SEASON_RE.search(new_name)
     season = int(season_match.group(1)) if season_match else 0
 
     correct_path = join(find_corrected_directory(root), f"Season {season}")
@@ -79,8 +88,9 @@ def move(root: str, file: str) -> str:
     if root == correct_path:
         return old_path
 
-    if not exists(correct_path):
+    if not cached_exists(correct_path):
         makedirs(correct_path)
+        forget_paths(correct_path)
 
     move_file(old_path, new_path)
     return new_path
@@ -1,14 +1,71 @@
 """Utility functions for file operations in Plex Organizer."""
 
-from os import sep, listdir, remove
-from os.path import join, exists, isdir
+from functools import lru_cache
+from os import link, remove, scandir, sep, stat, stat_result
+from os.path import join, normcase, splitext
 from shutil import move
-from typing import List
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
 
+from .const import EXT_FILTER_SET, VIDEO_EXT_SET
 from .log import log_error, log_duplicate
 from .config import get_delete_duplicates, get_include_quality, get_capitalize
 
+_stat_cache: Dict[str, Optional[stat_result]] = {}
 
+# os.path.normcase is the identity on POSIX; callers skip the call there.
+NORMCASE_FOLDS = normcase("A") != "A"
+
+
+def _stat(path: str) -> Optional[stat_result]:
+    """Return the (memoized) ``os.stat`` result for *path*, or None if missing."""
+    try:
+        return _stat_cache[path]
+    except KeyError:
+        pass
+    try:
+        result: Optional[stat_result] = stat(path)
+    except OSError:
+        result = None
+    _stat_cache[path] = result
+    return result
+
+
+def cached_exists(path: str) -> bool:
+    """
+    Check if *path* exists, reusing earlier lookups from this run.
+
+    Args:
+        path (str): The path to check.
+
+    Returns:
+        bool: True if the path exists, False otherwise.
+    """
+    return _stat(path) is not None
+
+
+def forget_paths(*paths: str):
+    """
+    Drop cached lookups for *paths* and everything below them.
+
+    Must be called after creating, moving or deleting files or folders so the
+    cached helpers do not report stale results.
+
+    Args:
+        *paths (str): The paths that were changed.
+    """
+    for path in paths:
+        _stat_cache.pop(path, None)
+    prefixes = tuple(path.rstrip(sep) + sep for path in paths)
+    for key in [key for key in _stat_cache if key.startswith(prefixes)]:
+        del _stat_cache[key]
+
+
+def clear_stat_cache():
+    """Forget every cached lookup, e.g. at the start of an organizer run."""
+    _stat_cache.clear()
+
+
+@lru_cache(maxsize=4096)
 def is_plex_folder(path: str):
     """
     Checks if the given path is a Plex Versions folder.
@@ -19,34 +76,150 @@ def is_plex_folder(path: str):
     Returns:
         bool: True if the path is a Plex Versions folder, False otherwise.
     """
-    return "Plex Versions" in path.split(sep)
+    return f"{sep}Plex Versions{sep}" in f"{sep}{path}{sep}"
 
 
-def find_folders(directory: str):
+def iter_tree(directory: str) -> Iterator[Tuple[str, List[str]]]:
     """
-    Finds all subdirectories in the given directory.
+    Walk *directory* top-down, yielding each folder with its file names.
+
+    Built on ``os.scandir`` so file/folder classification comes from the
+    directory listing itself. Plex Versions folders are not descended into and
+    temporary files created by this script are left out. Unreadable folders
+    are skipped, like ``os.walk`` does.
 
     Args:
-        directory (str): The directory to search for subfolders.
+        directory (str): The directory to walk.
 
-    Returns:
-        list: A list of full paths to subdirectories.
+    Yields:
+        tuple: ``(root, file_names)`` for every visited folder.
+    """
+    if is_plex_folder(directory):
+        return
+
+    stack = [directory]
+    while stack:
+        root = stack.pop()
+        files: List[str] = []
+        subdirs: List[str] = []
+        try:
+            with scandir(root) as entries:
+                for entry in entries:
+                    name = entry.name
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if name != "Plex Versions" and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif not is_script_temp_file(name):
+                        files.append(name)
+        except OSError:
+            continue
+
+        yield root, files
+        stack.extend(reversed(subdirs))
+
+
+def scandir_walk(
+    directory: str, prune: FrozenSet[str] = frozenset()
+) -> Iterator[Tuple[str, List[str], List[str]]]:
+    """
+    Walk *directory* bottom-up, like ``os.walk(directory, topdown=False)``.
+
+    Each folder is listed once with ``os.scandir`` and classified from its
+    ``DirEntry`` objects, whose type comes from the listing itself. Symlinked
+    folders are reported in ``dirs`` but not descended into, and unreadable
+    folders are skipped, matching ``os.walk`` defaults. A folder's listing is
+    taken before its subfolders are visited.
+
+    Args:
+        directory (str): The directory to walk.
+        prune (frozenset): Normcased folder names that are reported in ``dirs``
+            but never descended into, e.g. folders the caller deletes whole.
+
+    Yields:
+        tuple: ``(root, dir_names, file_names)`` for every visited folder,
+        children before their parent.
     """
+    stack: List = [directory]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, tuple):
+            yield item
+            continue
+
+        dirs: List[str] = []
+        files: List[str] = []
+        walk_into: List[str] = []
+        try:
+            with scandir(item) as entries:
+                for entry in entries:
+                    name = entry.name
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        files.append(name)
+                        continue
+                    dirs.append(name)
+                    if prune and (normcase(name) if NORMCASE_FOLDS else name) in prune:
+                        continue
+                    try:
+                        is_symlink = entry.is_symlink()
+                    except OSError:
+                        is_symlink = False
+                    if not is_symlink:
+                        walk_into.append(entry.path)
+        except OSError:
+            continue
+
+        stack.append((item, dirs, files))
+        stack.extend(reversed(walk_into))
+
+
+def _skip_duplicate(source_path: str, destination_path: str):
+    """Log a duplicate move and delete the source when configured to."""
+    log_duplicate(
+        f"File already exists: {destination_path}. Skipping move for {source_path}."
+    )
+
+    if get_delete_duplicates():
+        try:
+            remove(source_path)
+        except OSError as e:
+            log_error(f"Failed to delete duplicate {source_path}: {e}")
+        forget_paths(source_path)
+
+
+def _move_across_filesystems(source_path: str, destination_path: str):
+    """Move a file with ``shutil.move`` after checking both ends."""
+    if not cached_exists(source_path):
+        log_error(f"File not found: {source_path}.")
+        return
+
+    if cached_exists(destination_path):
+        _skip_duplicate(source_path, destination_path)
+        return
+
     try:
-        return [
-            join(directory, folder)
-            for folder in listdir(directory)
-            if isdir(join(directory, folder))
-        ]
+        move(source_path, destination_path)
     except OSError as e:
-        log_error(f"Error finding folders in directory {directory}: {e}")
-        return []
+        log_error(f"Failed to move {source_path} to {destination_path}: {e}")
+    forget_paths(source_path, destination_path)
 
 
 def move_file(source_path: str, destination_path: str):
     """
     Move or rename a file, handling duplicates and errors.
 
+    The file is hard-linked to its destination and then unlinked, so an
+    existing destination is reported by the link call itself instead of a
+    separate existence check. When hard links are not possible (other
+    filesystem, missing source, unsupported) it falls back to ``shutil.move``.
+
     Args:
         source_path (str): The path to the source file.
         destination_path (str): The path to move or rename the file to.
@@ -57,27 +230,24 @@ def move_file(source_path: str, destination_path: str):
     if source_path == destination_path:
         return
 
-    if not exists(source_path):
-        log_error(f"File not found: {source_path}.")
+    try:
+        link(source_path, destination_path)
+    except FileExistsError:
+        _skip_duplicate(source_path, destination_path)
         return
-
-    if exists(destination_path):
-        log_duplicate(
-            f"File already exists: {destination_path}. Skipping move for {source_path}."
-        )
-
-        if get_delete_duplicates():
-            try:
-                remove(source_path)
-            except OSError as e:
-                log_error(f"Failed to delete duplicate {source_path}: {e}")
-
+    except OSError:
+        _move_across_filesystems(source_path, destination_path)
         return
 
     try:
-        move(source_path, destination_path)
+        remove(source_path)
     except OSError as e:
         log_error(f"Failed to move {source_path} to {destination_path}: {e}")
+        try:
+            remove(destination_path)
+        except OSError:
+            pass
+    forget_paths(source_path, destination_path)
 
 
 def create_name(parts: list[str | None], extension: str, quality: str | None = None):
@@ -99,6 +269,7 @@ def create_name(parts: list[str | None], extension: str, quality: str | None = N
     return " ".join(part for part in parts if part) + extension
 
 
+@lru_cache(maxsize=4096)
 def is_tv_dir(root: str):
     """
     Check if the directory is in a TV show directory.
@@ -122,10 +293,14 @@ def is_main_folder(start: str):
     Returns:
         bool: True if the directory is the main folder, False otherwise.
     """
-    folders = []
-    for part in find_folders(start):
-        folders.append(part.split(sep)[-1])
-    return "movies" in folders or "tv" in folders
+    try:
+        with scandir(start) as entries:
+            return any(
+                entry.name in ("movies", "tv") and entry.is_dir() for entry in entries
+            )
+    except OSError as e:
+        log_error(f"Error finding folders in directory {start}: {e}")
+        return False
 
 
 def is_media_directory(start: str):
@@ -142,10 +317,65 @@ def is_media_directory(start: str):
     Returns:
         bool: True if the directory is a recognised media directory.
     """
-    if is_main_folder(start):
-        return True
     parts = [p.lower() for p in start.split(sep)]
-    return "tv" in parts or "movies" in parts
+    return "tv" in parts or "movies" in parts or is_main_folder(start)
+
+
+def has_video_extension(file_name: str) -> bool:
+    """
+    Check if the file name ends in one of the supported video extensions.
+
+    The last four characters are tried against the set first, which settles
+    the usual lowercase ``.mkv``/``.mp4`` names without lowercasing the whole
+    name.
+
+    Args:
+        file_name (str): The file name or path to check.
+
+    Returns:
+        bool: True if the extension is a video extension (case-insensitive).
+    """
+    if file_name[-4:] in VIDEO_EXT_SET:
+        return True
+    return splitext(file_name)[1].lower() in VIDEO_EXT_SET
+
+
+def split_extension(file_name: str) -> Tuple[str, str]:
+    """
+    Split a file name into its stem and extension.
+
+    Same result as ``os.path.splitext`` for bare file names (leading dots do
+    not start an extension), using a single ``rpartition``. Not meant for
+    paths whose folders may contain dots.
+
+    Args:
+        file_name (str): The file name to split.
+
+    Returns:
+        tuple: ``(stem, extension)``; the extension keeps its leading dot.
+    """
+    stem, dot, ext = file_name.rpartition(".")
+    if not dot or not stem.strip("."):
+        return file_name, ""
+    return stem, dot + ext
+
+
+def has_allowed_extension(file_name: str) -> bool:
+    """
+    Check if the file name ends in one of the extensions kept during cleanup.
+
+    The extension after the last dot is looked up in ``EXT_FILTER_SET``, which
+    matches ``str.endswith(EXT_FILTER)`` case-insensitively since every filter
+    extension contains a single leading dot.
+
+    Args:
+        file_name (str): The file name to check.
+
+    Returns:
+        bool: True if the extension is in the cleanup allow-list.
+    """
+    dot = file_name.rfind(".")
+    return dot != -1 and file_name[dot:].lower() in EXT_FILTER_SET
 
 
 def is_script_temp_file(file_name: str):
@@ -158,8 +388,7 @@ def is_script_temp_file(file_name: str):
     Returns:
         bool: True if the file is a temporary file, False otherwise.
     """
-    temp_file_indicators = [".langtag", ".submerge"]
-    return any(indicator in file_name for indicator in temp_file_indicators)
+    return ".langtag" in file_name or ".submerge" in file_name
 
 
 def capitalize(title: str):
@@ -207,6 +436,7 @@ def capitalize(title: str):
     return " ".join(result)
 
 
+@lru_cache(maxsize=4096)
 def find_corrected_directory(directory: str):
     """
     Find and return the corrected main folder for movies or TV shows.
@@ -0,0 +1,138 @@
+"""Tests for plex_organizer.audio.lang_cache."""
+
+from os import utime
+from sqlite3 import Error as SqliteError
+from unittest.mock import patch
+
+from pytest import mark
+
+from plex_organizer.audio.lang_cache import (
+    CACHE_FILENAME,
+    get_cached_language,
+    mark_tagged,
+    store_language,
+    was_tagged,
+)
+
+
+@mark.usefixtures("default_config")
+class TestLanguageCache:
+    """Tests for get_cached_language / store_language."""
+
+    def test_miss_returns_none(self, tmp_path):
+        """Unknown streams are a cache miss."""
+        video = tmp_path / "v.mkv"
+        video.write_bytes(b"x")
+        assert get_cached_language(str(video), 0) is None
+
+    def test_round_trip(self, tmp_path, config_dir):
+        """A stored result is returned for the same stream."""
+        video = tmp_path / "v.mkv"
+        video.write_bytes(b"x")
+        store_language(str(video), 1, "eng", 0.9)
+
+        assert get_cached_language(str(video), 1) == ("eng", 0.9)
+        assert get_cached_language(str(video), 0) is None
+        assert (config_dir / CACHE_FILENAME).exists()
+
+    def test_inconclusive_result_is_cached(self, tmp_path):
+        """A None language is cached so Whisper is not re-run."""
+        video = tmp_path / "v.mkv"
+        video.write_bytes(b"x")
+        store_language(str(video), 0, None, 0.3)
+        assert get_cached_language(str(video), 0) == (None, 0.3)
+
+    def test_key_survives_rename(self, tmp_path):
+        """Entries are keyed by stat metadata, not by path."""
+        video = tmp_path / "raw.mkv"
+        video.write_bytes(b"x")
+        store_language(str(video), 0, "spa", 0.8)
+
+        renamed = tmp_path / "Movie (2020).mkv"
+        video.rename(renamed)
+        assert get_cached_language(str(renamed), 0) == ("spa", 0.8)
+
+    def test_modified_file_misses(self, tmp_path):
+        """Changing mtime invalidates the entry."""
+        video = tmp_path / "v.mkv"
+        video.write_bytes(b"x")
+        store_language(str(video), 0, "eng", 0.9)
+
+        utime(video, (1_000_000, 1_000_000))
+        assert get_cached_language(str(video), 0) is None
+
+    def test_prefetched_stat_is_used(self, tmp_path):
+        """A caller-provided stat result replaces the lookup on disk."""
+        video = tmp_path / "v.mkv"
+        video.write_bytes(b"x")
+        st = video.stat()
+        store_language(str(video), 0, "eng", 0.9, st)
+
+        video.unlink()
+        assert get_cached_language(str(video), 0, st) == ("eng", 0.9)
+        assert get_cached_language(str(video), 0) is None
+
+    def test_missing_file_is_noop(self, tmp_path):
+        """Nothing is stored or returned for a missing file."""
+        missing = str(tmp_path / "nope.mkv")
+        store_language(missing, 0, "eng", 0.9)
+        assert get_cached_language(missing, 0) is None
+
+    def test_model_change_misses(self, tmp_path):
+        """A result from one Whisper model is not reused by another."""
+        video = tmp_path / "v.mkv"
+        video.write_bytes(b"x")
+        store_language(str(video), 0, None, 0.3)
+
+        with patch(
+            "plex_organizer.audio.lang_cache.get_whisper_model_size",
+            return_value="small",
+        ):
+            assert get_cached_language(str(video), 0) is None
+        assert get_cached_language(str(video), 0) == (None, 0.3)
+
+    @patch("plex_organizer.audio.lang_cache.log_error")
+    @patch("plex_organizer.audio.lang_cache._connect", side_effect=SqliteError("x"))
+    def test_database_errors_are_logged(self, _conn, mock_err, tmp_path):
+        """SQLite errors are logged and treated as a miss."""
+        video = tmp_path / "v.mkv"
+        video.write_bytes(b"x")
+        store_language(str(video), 0, "eng", 0.9)
+        assert get_cached_language(str(video), 0) is None
+        assert mock_err.call_count == 2
+
+
+@mark.usefixtures("default_config")
+class TestTaggedFiles:
+    """Tests for was_tagged / mark_tagged."""
+
+    def test_round_trip(self, tmp_path):
+        """A marked file is reported as tagged until it changes."""
+        video = tmp_path / "v.mkv"
+        video.write_bytes(b"x")
+        assert not was_tagged(str(video))
+
+        mark_tagged(str(video))
+        assert was_tagged(str(video))
+
+        video.write_bytes(b"longer")
+        assert not was_tagged(str(video))
+
+    def test_model_change_misses(self, tmp_path):
+        """Files tagged with one Whisper model are revisited with another."""
+        video = tmp_path / "v.mkv"
+        video.write_bytes(b"x")
+        mark_tagged(str(video))
+
+        with patch(
+            "plex_organizer.audio.lang_cache.get_whisper_model_size",
+            return_value="small",
+        ):
+            assert not was_tagged(str(video))
+        assert was_tagged(str(video))
+
+    def test_missing_file_is_noop(self, tmp_path):
+        """Missing files are never marked or reported as tagged."""
+        missing = str(tmp_path / "nope.mkv")
+        mark_tagged(missing)
+        assert not was_tagged(missing)
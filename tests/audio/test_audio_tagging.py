@@ -1,15 +1,22 @@
 """Tests for plex_organizer.audio.tagging."""
 
+from concurrent.futures import ThreadPoolExecutor
+from os import utime
+from threading import Event
 from unittest.mock import MagicMock, patch
 
-from pytest import mark, raises
+from numpy import concatenate, float32, full, zeros
+from pytest import approx, mark, raises
 
+from plex_organizer.audio.lang_cache import was_tagged
 from plex_organizer.audio.tagging import (
     _audio_stream_from_ffprobe,
     _choose_language_from_samples,
     _detect_languages_for_streams,
-    _extract_audio_sample,
+    _detectors,
+    _extract_audio_samples_pcm,
     _get_content_aware_offsets,
+    _get_detector,
     _normalize_language_to_iso639_2,
     _pick_offsets,
     _probe_audio_streams,
@@ -17,8 +24,11 @@ from plex_organizer.audio.tagging import (
     _sampling_params_for_duration,
     _should_update_language,
     _apply_language_metadata,
+    _apply_language_metadata_mkvpropedit,
+    SAMPLE_SECONDS,
     tag_audio_track_languages,
 )
+from plex_organizer.ffmpeg_utils import PCM_SAMPLE_RATE
 from plex_organizer.dataclass import AudioStream
 
 
@@ -67,25 +77,38 @@ class TestProbeAudioStreams:
         with raises(FileNotFoundError):
             _probe_audio_streams(str(tmp_path / "nope.mkv"))
 
-    @patch("plex_organizer.audio.tagging.probe_streams_json", return_value=[])
+    @patch("plex_organizer.audio.tagging.probe_streams_and_duration")
+    def test_directory_raises(self, mock_probe, tmp_path):
+        """A pre-fetched stat of a non-regular file is rejected without probing."""
+        with raises(FileNotFoundError):
+            _probe_audio_streams(str(tmp_path), tmp_path.stat())
+        mock_probe.assert_not_called()
+
+    @patch(
+        "plex_organizer.audio.tagging.probe_streams_and_duration",
+        return_value=([], None),
+    )
     @patch("plex_organizer.audio.tagging.get_ffprobe", return_value="/usr/bin/ffprobe")
     def test_returns_empty_on_no_streams(self, _ffp, _probe, tmp_path):
         """Returns empty list when no audio streams found."""
         video = tmp_path / "v.mkv"
         video.write_text("x")
-        assert _probe_audio_streams(str(video)) == []
-
-    @patch("plex_organizer.audio.tagging.probe_streams_json")
-    def test_parses_streams(self, mock_probe, tmp_path):
-        """Returns AudioStream objects for each stream dict."""
-        mock_probe.return_value = [
-            {"index": 1, "codec_name": "aac", "tags": {"language": "eng"}},
-        ]
+        assert _probe_audio_streams(str(video)) == ([], None)
+
+    @patch("plex_organizer.audio.tagging.probe_streams_and_duration")
+    def test_parses_streams_and_duration(self, mock_probe, tmp_path):
+        """Returns AudioStream objects and the duration from one probe."""
+        mock_probe.return_value = (
+            [{"index": 1, "codec_name": "aac", "tags": {"language": "eng"}}],
+            5400.0,
+        )
         video = tmp_path / "v.mkv"
         video.write_text("x")
-        result = _probe_audio_streams(str(video))
+        result, duration = _probe_audio_streams(str(video))
         assert len(result) == 1
         assert result[0].codec_name == "aac"
+        assert duration == 5400.0
+        mock_probe.assert_called_once_with(str(video), "a")
 
 
 class TestSamplingParamsForDuration:
@@ -123,6 +146,18 @@ class TestPickOffsets:
         result = _pick_offsets(100.0, 0, 100, [0.5, 0.5, 0.5])
         assert len(set(result)) == len(result)
 
+    def test_distinct_fractions_unchanged(self):
+        """Distinct in-range offsets are returned as computed."""
+        assert _pick_offsets(3600.0, 120, 3200, [0.25, 0.55, 0.80]) == [900, 1980, 2880]
+
+    def test_backfills_from_grid(self):
+        """Clamped collisions are backfilled and the result is sorted."""
+        assert _pick_offsets(100.0, 0, 100, [0.5, 0.5, 0.5]) == [0, 50, 60]
+
+    def test_narrow_window_returns_fewer(self):
+        """Fewer than three offsets are returned when the window is too small."""
+        assert _pick_offsets(1000.0, 120, 150, [0.9, 0.9, 0.9]) == [120, 150]
+
 
 class TestGetContentAwareOffsets:
     """Tests for _get_content_aware_offsets."""
@@ -193,6 +228,14 @@ class TestNormalizeLanguage:
         """Single character returns None."""
         assert _normalize_language_to_iso639_2("e") is None
 
+    def test_unlisted_three_letter_passes_through(self):
+        """Three-letter codes outside the lookup table are kept."""
+        assert _normalize_language_to_iso639_2("ger") == "ger"
+
+    def test_strips_and_lowercases(self):
+        """Whitespace and case are normalized before lookup."""
+        assert _normalize_language_to_iso639_2(" FR ") == "fra"
+
 
 class TestShouldUpdateLanguage:
     """Tests for _should_update_language."""
@@ -211,23 +254,47 @@ class TestShouldUpdateLanguage:
 
 
 @mark.usefixtures("default_config")
-class TestExtractAudioSample:
-    """Tests for _extract_audio_sample."""
+class TestExtractAudioSamplesPcm:
+    """Tests for _extract_audio_samples_pcm."""
 
-    @patch("plex_organizer.audio.tagging.run_cmd")
+    @patch("plex_organizer.audio.tagging.run_cmd_bytes")
     @patch("plex_organizer.audio.tagging.get_ffmpeg", return_value="/usr/bin/ffmpeg")
-    def test_success(self, _ff, mock_run):
-        """No exception raised on success."""
-        mock_run.return_value = MagicMock(returncode=0)
-        _extract_audio_sample("/v.mkv", 0, "/tmp/a.wav", start_seconds=30)
+    def test_single_process_for_all_offsets(self, _ff, mock_run):
+        """One ffmpeg call returns one in-memory sample per offset, in order."""
+        sample_len = SAMPLE_SECONDS * PCM_SAMPLE_RATE
+        pcm = concatenate(
+            [full(sample_len, k * 1000, dtype="<i2") for k in range(3)]
+        ).tobytes()
+        mock_run.return_value = MagicMock(returncode=0, stdout=pcm)
 
-    @patch("plex_organizer.audio.tagging.run_cmd")
+        result = _extract_audio_samples_pcm("/v.mkv", 1, [30, 150, 270])
+
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args[0][0]
+        assert cmd.count("-i") == 3
+        assert cmd.count("-ss") == 3
+        assert cmd.count("-threads") == 3
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert "[0:a:1]" in graph and "[2:a:1]" in graph
+        assert "concat=n=3:v=0:a=1" in graph
+        assert cmd[-3:] == ["-f", "s16le", "-"]
+        assert [len(a) for a in result] == [sample_len] * 3
+        assert [a.dtype for a in result] == [float32] * 3
+        assert result[2][0] == approx(2000 / 32768.0)
+
+    @patch("plex_organizer.audio.tagging.run_cmd_bytes")
+    def test_no_offsets_is_noop(self, mock_run):
+        """No ffmpeg call is made without offsets."""
+        assert not _extract_audio_samples_pcm("/v.mkv", 0, [])
+        mock_run.assert_not_called()
+
+    @patch("plex_organizer.audio.tagging.run_cmd_bytes")
     @patch("plex_organizer.audio.tagging.get_ffmpeg", return_value="/usr/bin/ffmpeg")
     def test_failure_raises(self, _ff, mock_run):
         """RuntimeError raised on ffmpeg failure."""
-        mock_run.return_value = MagicMock(returncode=1, stderr="fail")
-        with raises(RuntimeError):
-            _extract_audio_sample("/v.mkv", 0, "/tmp/a.wav")
+        mock_run.return_value = MagicMock(returncode=1, stderr=b"fail")
+        with raises(RuntimeError, match="fail"):
+            _extract_audio_samples_pcm("/v.mkv", 0, [30])
 
 
 class TestChooseLanguageFromSamples:
@@ -260,6 +327,25 @@ class TestChooseLanguageFromSamples:
         lang, _ = _choose_language_from_samples([(None, 0.1), (None, 0.2)])
         assert lang is None
 
+    def test_tie_picks_higher_confidence_sum(self):
+        """Equal vote counts are decided by the summed confidence."""
+        samples: list[tuple[str | None, float]] = [
+            ("spa", 0.5),
+            ("eng", 0.45),
+            ("eng", 0.45),
+            ("spa", 0.3),
+        ]
+        assert _choose_language_from_samples(samples) == ("eng", 0.45)
+
+    def test_reports_max_confidence_of_winner(self):
+        """The returned confidence is the winner's best sample."""
+        samples: list[tuple[str | None, float]] = [
+            ("eng", 0.5),
+            (None, 0.99),
+            ("eng", 0.8),
+        ]
+        assert _choose_language_from_samples(samples) == ("eng", 0.8)
+
     def test_tie_break_by_confidence_sum(self):
         """Tie-break resolved by highest sum of confidences."""
         samples: list[tuple[str | None, float]] = [("eng", 0.9), ("spa", 0.5)]
@@ -268,15 +354,72 @@ class TestChooseLanguageFromSamples:
 
 
 @mark.usefixtures("default_config")
-class TestSampleTrackLanguages:  # pylint: disable=too-few-public-methods
+class TestGetDetector:
+    """Tests for _get_detector."""
+
+    def setup_method(self):
+        """Start each test with an empty detector cache."""
+        _detectors.clear()
+
+    def teardown_method(self):
+        """Drop detectors built from mocks."""
+        _detectors.clear()
+
+    @patch("plex_organizer.audio.tagging.WhisperDetector")
+    def test_reuses_detector(self, mock_whisper_cls):
+        """The model is loaded once per thread count."""
+        assert _get_detector(2) is _get_detector(2)
+        mock_whisper_cls.assert_called_once_with(cpu_threads=2)
+
+    @patch("plex_organizer.audio.tagging.WhisperDetector")
+    def test_separate_detector_per_thread_count(self, mock_whisper_cls):
+        """A different thread count builds a new detector."""
+        _get_detector(2)
+        _get_detector(4)
+        assert mock_whisper_cls.call_count == 2
+
+    def test_concurrent_callers_load_model_once(self):
+        """Workers asking for the detector during a slow load share one model."""
+        loading = Event()
+        release = Event()
+
+        def slow_load(**_kwargs):
+            loading.set()
+            release.wait(5)
+            return MagicMock()
+
+        with patch(
+            "plex_organizer.audio.tagging.WhisperDetector", side_effect=slow_load
+        ) as mock_whisper_cls:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = [pool.submit(_get_detector, 2) for _ in range(4)]
+                loading.wait(5)
+                release.set()
+                detectors = {id(f.result()) for f in futures}
+
+        mock_whisper_cls.assert_called_once_with(cpu_threads=2)
+        assert len(detectors) == 1
+
+
+@mark.usefixtures("default_config")
+class TestSampleTrackLanguages:
     """Tests for _sample_track_languages."""
 
+    def setup_method(self):
+        """Start each test with an empty detector cache."""
+        _detectors.clear()
+
+    def teardown_method(self):
+        """Drop detectors built from mocks."""
+        _detectors.clear()
+
     @patch("plex_organizer.audio.tagging.WhisperDetector")
-    @patch("plex_organizer.audio.tagging._extract_audio_sample")
-    def test_returns_samples(self, _mock_extract, mock_whisper_cls, tmp_path):
+    @patch("plex_organizer.audio.tagging._extract_audio_samples_pcm")
+    def test_returns_samples(self, mock_extract, mock_whisper_cls):
         """Returns one detection per offset."""
+        mock_extract.return_value = [zeros(10, dtype=float32) for _ in range(3)]
         mock_detector = MagicMock()
-        mock_detector.detect_language.return_value = ("en", 0.9)
+        mock_detector.detect_language_from_array.return_value = ("en", 0.6)
         mock_whisper_cls.return_value = mock_detector
 
         stream = AudioStream(
@@ -288,43 +431,124 @@ class TestSampleTrackLanguages:  # pylint: disable=too-few-public-methods
             language=None,
             title=None,
         )
-        result = _sample_track_languages(
-            "/v.mkv", stream, [30, 120, 240], str(tmp_path)
-        )
+        result = _sample_track_languages("/v.mkv", stream, [30, 120, 240])
         assert len(result) == 3
         assert result[0][0] == "eng"
 
+    @patch("plex_organizer.audio.tagging.WhisperDetector")
+    @patch("plex_organizer.audio.tagging._extract_audio_samples_pcm")
+    def test_stops_after_high_confidence_sample(self, mock_extract, mock_whisper_cls):
+        """A very confident first sample skips Whisper on the rest."""
+        mock_extract.return_value = [zeros(10, dtype=float32) for _ in range(3)]
+        mock_detector = MagicMock()
+        mock_detector.detect_language_from_array.return_value = ("en", 0.95)
+        mock_whisper_cls.return_value = mock_detector
+
+        stream = AudioStream(0, 1, "aac", 2, 48000, None, None)
+        result = _sample_track_languages("/v.mkv", stream, [30, 120, 240])
+        assert result == [("eng", 0.95)]
+        assert mock_detector.detect_language_from_array.call_count == 1
+        assert _choose_language_from_samples(result) == ("eng", 0.95)
+
 
 @mark.usefixtures("default_config")
 class TestDetectLanguagesForStreams:
     """Tests for _detect_languages_for_streams."""
 
     @patch("plex_organizer.audio.tagging._sample_track_languages")
-    @patch("plex_organizer.audio.tagging.probe_duration_seconds", return_value=7200.0)
-    def test_detects_missing_language(self, _dur, mock_samples):
+    def test_detects_missing_language(self, mock_samples):
         """Streams with missing language are sampled and detected."""
         mock_samples.return_value = [("eng", 0.9), ("eng", 0.85), ("eng", 0.8)]
         stream = AudioStream(0, 1, "aac", 2, 48000, None, None)
-        result = _detect_languages_for_streams("/v.mkv", [stream])
+        result = _detect_languages_for_streams("/v.mkv", [stream], 7200.0)
         assert len(result) == 1
         assert result[0][1] == "eng"
 
     @patch("plex_organizer.audio.tagging._sample_track_languages")
-    @patch("plex_organizer.audio.tagging.probe_duration_seconds", return_value=7200.0)
-    def test_keeps_existing_language(self, _dur, mock_samples):
+    def test_keeps_existing_language(self, mock_samples):
         """Streams with existing valid language are not re-detected."""
         stream = AudioStream(0, 1, "aac", 2, 48000, "spa", None)
-        result = _detect_languages_for_streams("/v.mkv", [stream])
+        result = _detect_languages_for_streams("/v.mkv", [stream], 7200.0)
         assert result[0][1] == "spa"
         mock_samples.assert_not_called()
 
+    @patch("plex_organizer.audio.tagging.store_language")
+    @patch("plex_organizer.audio.tagging.get_cpu_threads", return_value=4)
+    @patch("plex_organizer.audio.tagging._sample_track_languages")
+    def test_parallel_streams_keep_order(self, mock_samples, _cpu, _store):
+        """Concurrent detection returns results in stream order."""
+        langs = {0: "eng", 1: "spa", 2: "fra"}
+        mock_samples.side_effect = lambda _v, s, _o: [(langs[s.audio_index], 0.9)]
+        streams = [AudioStream(i, i + 1, "aac", 2, 48000, None, None) for i in range(3)]
+        result = _detect_languages_for_streams("/v.mkv", streams, 7200.0)
+        assert [(s.audio_index, lang) for s, lang, _c in result] == [
+            (0, "eng"),
+            (1, "spa"),
+            (2, "fra"),
+        ]
+
+    @patch("plex_organizer.audio.tagging.ThreadPoolExecutor")
+    @patch("plex_organizer.audio.tagging.store_language")
+    @patch("plex_organizer.audio.tagging.get_cpu_threads", return_value=4)
+    @patch("plex_organizer.audio.tagging._sample_track_languages")
+    def test_single_stream_worker_runs_inline(
+        self, mock_samples, _cpu, _store, mock_pool
+    ):
+        """stream_workers = 1 samples streams in order without a pool."""
+        mock_samples.return_value = [("eng", 0.9)]
+        streams = [AudioStream(i, i + 1, "aac", 2, 48000, None, None) for i in range(2)]
+        result = _detect_languages_for_streams(
+            "/v.mkv", streams, 7200.0, stream_workers=1
+        )
+        mock_pool.assert_not_called()
+        assert [lang for _s, lang, _c in result] == ["eng", "eng"]
+        assert [c.args[1].audio_index for c in mock_samples.call_args_list] == [0, 1]
+
+    def test_no_streams(self):
+        """An empty stream list needs no work."""
+        assert not _detect_languages_for_streams("/v.mkv", [])
+
+    @patch("plex_organizer.audio.tagging.ThreadPoolExecutor")
+    @patch("plex_organizer.audio.tagging.get_cached_language")
+    def test_all_tagged_skips_workers(self, mock_cached, mock_pool):
+        """Fully tagged files return immediately without a worker pool."""
+        streams = [
+            AudioStream(0, 1, "aac", 2, 48000, "en", None),
+            AudioStream(1, 2, "aac", 2, 48000, "spa", None),
+        ]
+        result = _detect_languages_for_streams("/v.mkv", streams, 7200.0)
+        assert [lang for _s, lang, _c in result] == ["eng", "spa"]
+        mock_pool.assert_not_called()
+        mock_cached.assert_not_called()
+
+    @patch("plex_organizer.audio.tagging.store_language")
+    @patch("plex_organizer.audio.tagging._sample_track_languages")
+    @patch(
+        "plex_organizer.audio.tagging.get_cached_language", return_value=("fra", 0.8)
+    )
+    def test_cache_hit_skips_sampling(self, _cached, mock_samples, mock_store):
+        """A cached result is reused without running Whisper."""
+        stream = AudioStream(0, 1, "aac", 2, 48000, None, None)
+        result = _detect_languages_for_streams("/v.mkv", [stream], 7200.0)
+        assert result == [(stream, "fra", 0.8)]
+        mock_samples.assert_not_called()
+        mock_store.assert_not_called()
+
+    @patch("plex_organizer.audio.tagging.store_language")
     @patch("plex_organizer.audio.tagging._sample_track_languages")
-    @patch("plex_organizer.audio.tagging.probe_duration_seconds", return_value=None)
-    def test_uses_default_offsets_when_duration_unavailable(self, _dur, mock_samples):
+    def test_cache_miss_stores_result(self, mock_samples, mock_store):
+        """A fresh detection is written to the cache."""
+        mock_samples.return_value = [("eng", 0.9), ("eng", 0.85), ("eng", 0.8)]
+        stream = AudioStream(0, 1, "aac", 2, 48000, None, None)
+        _detect_languages_for_streams("/v.mkv", [stream], 7200.0)
+        mock_store.assert_called_once_with("/v.mkv", 0, "eng", 0.9, None)
+
+    @patch("plex_organizer.audio.tagging._sample_track_languages")
+    def test_uses_default_offsets_when_duration_unavailable(self, mock_samples):
         """Falls back to default offsets when duration is None."""
         mock_samples.return_value = [("eng", 0.9), ("eng", 0.85), ("eng", 0.8)]
         stream = AudioStream(0, 1, "aac", 2, 48000, None, None)
-        _detect_languages_for_streams("/v.mkv", [stream])
+        _detect_languages_for_streams("/v.mkv", [stream], None)
         offsets = mock_samples.call_args[0][2]
         assert offsets == [30, 150, 270]
 
@@ -343,7 +567,7 @@ class TestApplyLanguageMetadata:
         """Runs ffmpeg to write language metadata."""
         mock_run.return_value = MagicMock(returncode=0)
         stream = AudioStream(0, 1, "aac", 2, 48000, None, None)
-        _apply_language_metadata("/v.mkv", [(stream, "eng", 0.9)])
+        _apply_language_metadata("/v.mp4", [(stream, "eng", 0.9)])
         mock_run.assert_called_once()
         mock_replace.assert_called_once()
 
@@ -357,12 +581,19 @@ class TestApplyLanguageMetadata:
         mock_run.return_value = MagicMock(returncode=1, stderr="error")
         stream = AudioStream(0, 1, "aac", 2, 48000, None, None)
         with raises(RuntimeError):
-            _apply_language_metadata("/v.mkv", [(stream, "eng", 0.9)])
+            _apply_language_metadata("/v.mp4", [(stream, "eng", 0.9)])
+
+    @patch("plex_organizer.audio.tagging.run_cmd")
+    def test_noop_when_tags_unchanged(self, mock_run):
+        """Streams that already carry the detected tag are not rewritten."""
+        stream = AudioStream(0, 1, "aac", 2, 48000, "eng", None)
+        _apply_language_metadata("/v.mp4", [(stream, "eng", 1.0)])
+        mock_run.assert_not_called()
 
     def test_noop_when_no_languages(self):
         """Does nothing when no language was detected."""
         stream = AudioStream(0, 1, "aac", 2, 48000, None, None)
-        _apply_language_metadata("/v.mkv", [(stream, None, 0.0)])
+        _apply_language_metadata("/v.mp4", [(stream, None, 0.0)])
 
     @patch("plex_organizer.audio.tagging.replace_and_restore_timestamps")
     @patch("plex_organizer.audio.tagging.run_cmd")
@@ -375,7 +606,80 @@ class TestApplyLanguageMetadata:
         mock_run.return_value = MagicMock(returncode=0)
         s1 = AudioStream(0, 1, "aac", 2, 48000, None, None)
         s2 = AudioStream(1, 2, "aac", 2, 48000, None, None)
-        _apply_language_metadata("/v.mkv", [(s1, "eng", 0.9), (s2, None, 0.0)])
+        _apply_language_metadata("/v.mp4", [(s1, "eng", 0.9), (s2, None, 0.0)])
+
+    @patch("plex_organizer.audio.tagging.get_ffmpeg")
+    @patch(
+        "plex_organizer.audio.tagging._apply_language_metadata_mkvpropedit",
+        return_value=True,
+    )
+    def test_mkvpropedit_skips_remux(self, _mkv, mock_ffmpeg):
+        """A successful in-place edit does not remux with ffmpeg."""
+        stream = AudioStream(0, 1, "aac", 2, 48000, None, None)
+        _apply_language_metadata("/v.mkv", [(stream, "eng", 0.9)])
+        mock_ffmpeg.assert_not_called()
+
+
+@mark.usefixtures("default_config")
+class TestApplyLanguageMetadataMkvpropedit:
+    """Tests for _apply_language_metadata_mkvpropedit."""
+
+    @patch("plex_organizer.audio.tagging.which_cached")
+    def test_non_mkv_not_handled(self, mock_which):
+        """Only Matroska files are edited in place."""
+        stream = AudioStream(0, 1, "aac", 2, 48000, None, None)
+        assert not _apply_language_metadata_mkvpropedit("/v.mp4", [(stream, "eng")])
+        mock_which.assert_not_called()
+
+    @patch("plex_organizer.audio.tagging.which_cached", return_value=None)
+    def test_missing_binary_not_handled(self, _which):
+        """Falls back when mkvpropedit is not installed."""
+        stream = AudioStream(0, 1, "aac", 2, 48000, None, None)
+        assert not _apply_language_metadata_mkvpropedit("/v.mkv", [(stream, "eng")])
+
+    @patch("plex_organizer.audio.tagging.run_cmd")
+    @patch(
+        "plex_organizer.audio.tagging.which_cached",
+        return_value="/usr/bin/mkvpropedit",
+    )
+    def test_edits_tracks_and_keeps_mtime(self, _which, mock_run, tmp_path):
+        """Audio tracks are addressed 1-based and timestamps are preserved."""
+        video = tmp_path / "v.mkv"
+        video.write_bytes(b"x")
+        utime(video, (1_000_000, 1_000_000))
+        mock_run.side_effect = lambda _cmd: utime(video) or MagicMock(returncode=0)
+        s0 = AudioStream(0, 1, "aac", 2, 48000, None, None)
+        s1 = AudioStream(1, 2, "aac", 2, 48000, None, None)
+
+        assert _apply_language_metadata_mkvpropedit(
+            str(video), [(s0, "eng"), (s1, "spa")]
+        )
+        cmd = mock_run.call_args[0][0]
+        assert cmd[:3] == ["/usr/bin/mkvpropedit", "--quiet", str(video)]
+        assert cmd[3:] == [
+            "--edit",
+            "track:a1",
+            "--set",
+            "language=eng",
+            "--edit",
+            "track:a2",
+            "--set",
+            "language=spa",
+        ]
+        assert video.stat().st_mtime == 1_000_000
+
+    @patch("plex_organizer.audio.tagging.run_cmd")
+    @patch(
+        "plex_organizer.audio.tagging.which_cached",
+        return_value="/usr/bin/mkvpropedit",
+    )
+    def test_failure_not_handled(self, _which, mock_run, tmp_path):
+        """A failed edit reports False so ffmpeg can take over."""
+        video = tmp_path / "v.mkv"
+        video.write_bytes(b"x")
+        mock_run.return_value = MagicMock(returncode=2, stdout="", stderr="bad")
+        stream = AudioStream(0, 1, "aac", 2, 48000, None, None)
+        assert not _apply_language_metadata_mkvpropedit(str(video), [(stream, "eng")])
 
 
 @mark.usefixtures("default_config")
@@ -386,34 +690,84 @@ class TestTagAudioTrackLanguages:
         """Plex-managed folders are skipped."""
         tag_audio_track_languages("/media/Plex Versions/v.mkv")
 
+    @patch("plex_organizer.audio.tagging.mark_tagged")
+    @patch("plex_organizer.audio.tagging.was_tagged", return_value=False)
     @patch("plex_organizer.audio.tagging._apply_language_metadata")
     @patch("plex_organizer.audio.tagging._detect_languages_for_streams")
-    @patch("plex_organizer.audio.tagging._probe_audio_streams", return_value=[])
+    @patch("plex_organizer.audio.tagging._probe_audio_streams", return_value=([], None))
+    @patch("plex_organizer.audio.tagging.stat")
     @patch("plex_organizer.audio.tagging.log_debug")
-    def test_returns_when_no_streams(self, _log, _probe, _detect, _apply):
-        """Returns early when no audio streams are found."""
+    def test_returns_when_no_streams(
+        self, _log, _stat, _probe, _detect, _apply, _tagged, mock_mark
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """Returns early when no audio streams are found, without recording it."""
         tag_audio_track_languages("/video.mkv")
         _detect.assert_not_called()
+        mock_mark.assert_not_called()
+
+    @patch("plex_organizer.audio.tagging.mark_tagged")
+    @patch("plex_organizer.audio.tagging.get_ffprobe", return_value="/ffprobe")
+    @patch("plex_organizer.ffmpeg_utils.probe_json", return_value={})
+    def test_failed_probe_not_recorded(self, _probe, _ffprobe, mock_mark, tmp_path):
+        """A failed ffprobe run leaves the file to be probed again next time."""
+        video = tmp_path / "v.mkv"
+        video.write_bytes(b"x")
+        tag_audio_track_languages(str(video))
+        mock_mark.assert_not_called()
+        assert not was_tagged(str(video))
 
     @patch("plex_organizer.audio.tagging._apply_language_metadata")
     @patch("plex_organizer.audio.tagging._detect_languages_for_streams")
     @patch("plex_organizer.audio.tagging._probe_audio_streams")
+    @patch("plex_organizer.audio.tagging.stat")
     @patch("plex_organizer.audio.tagging.log_debug")
-    def test_full_pipeline(self, _log, mock_probe, mock_detect, mock_apply):
-        """Full pipeline: probe -> detect -> apply."""
+    def test_full_pipeline(self, _log, mock_stat, mock_probe, mock_detect, mock_apply):
+        """Full pipeline: stat once -> probe -> detect -> apply."""
         stream = AudioStream(0, 1, "aac", 2, 48000, None, None)
-        mock_probe.return_value = [stream]
+        st = mock_stat.return_value
+        mock_probe.return_value = ([stream], 7200.0)
         mock_detect.return_value = [(stream, "eng", 0.9)]
         tag_audio_track_languages("/video.mkv")
-        mock_apply.assert_called_once()
+        mock_stat.assert_called_once_with("/video.mkv")
+        mock_probe.assert_called_once_with("/video.mkv", st)
+        mock_detect.assert_called_once_with("/video.mkv", [stream], 7200.0, st, 0)
+        mock_apply.assert_called_once_with("/video.mkv", [(stream, "eng", 0.9)], st)
 
     @patch("plex_organizer.audio.tagging.log_error")
     @patch(
         "plex_organizer.audio.tagging._probe_audio_streams",
         side_effect=RuntimeError("fail"),
     )
+    @patch("plex_organizer.audio.tagging.stat")
     @patch("plex_organizer.audio.tagging.log_debug")
-    def test_error_logged_not_raised(self, _log, _probe, mock_err):
+    def test_error_logged_not_raised(self, _log, _stat, _probe, mock_err):
         """Errors are caught and logged."""
         tag_audio_track_languages("/video.mkv")
         mock_err.assert_called_once()
+
+    @patch("plex_organizer.audio.tagging._probe_audio_streams")
+    @patch("plex_organizer.audio.tagging.was_tagged", return_value=True)
+    @patch("plex_organizer.audio.tagging.stat")
+    @patch("plex_organizer.audio.tagging.log_debug")
+    def test_skips_unchanged_tagged_file(self, _log, mock_stat, _tagged, mock_probe):
+        """Files recorded as tagged with the same stat are not probed."""
+        tag_audio_track_languages("/video.mkv")
+        _tagged.assert_called_once_with("/video.mkv", mock_stat.return_value)
+        mock_probe.assert_not_called()
+
+    @patch("plex_organizer.audio.tagging.mark_tagged")
+    @patch("plex_organizer.audio.tagging.was_tagged", return_value=False)
+    @patch("plex_organizer.audio.tagging._apply_language_metadata")
+    @patch("plex_organizer.audio.tagging._detect_languages_for_streams")
+    @patch("plex_organizer.audio.tagging._probe_audio_streams")
+    @patch("plex_organizer.audio.tagging.stat")
+    @patch("plex_organizer.audio.tagging.log_debug")
+    def test_marks_file_after_tagging(
+        self, _log, _stat, mock_probe, mock_detect, _apply, _tagged, mock_mark
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """A successfully tagged file is recorded for later runs."""
+        stream = AudioStream(0, 1, "aac", 2, 48000, None, None)
+        mock_probe.return_value = ([stream], 60.0)
+        mock_detect.return_value = [(stream, "eng", 0.9)]
+        tag_audio_track_languages("/video.mkv")
+        mock_mark.assert_called_once_with("/video.mkv")
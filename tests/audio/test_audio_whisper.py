@@ -1,6 +1,7 @@
 """Tests for plex_organizer.audio.whisper."""
 
 from unittest.mock import MagicMock, patch
+from numpy import zeros, float32
 from pytest import approx, mark, raises
 
 from plex_organizer.audio.whisper import WhisperDetector
@@ -60,15 +61,13 @@ class TestWhisperDetectorInit:
 class TestWhisperDetectorDetectLanguage:
     """Tests for WhisperDetector.detect_language."""
 
+    @patch("plex_organizer.audio.whisper.decode_audio")
     @patch("plex_organizer.audio.whisper.WhisperModel")
     @patch("plex_organizer.audio.whisper.get_whisper_model_size", return_value="tiny")
-    def test_detect_language_returns_result(self, _ms, mock_wm):
+    def test_detect_language_returns_result(self, _ms, mock_wm, _decode):
         """Returns language and probability from model."""
         mock_model = MagicMock()
-        info = MagicMock()
-        info.language = "en"
-        info.language_probability = 0.95
-        mock_model.transcribe.return_value = (iter([MagicMock()]), info)
+        mock_model.detect_language.return_value = ("en", 0.95, [])
         mock_wm.return_value = mock_model
 
         detector = WhisperDetector()
@@ -76,21 +75,24 @@ class TestWhisperDetectorDetectLanguage:
         assert lang == "en"
         assert prob == approx(0.95)
 
+    @patch("plex_organizer.audio.whisper.decode_audio")
     @patch("plex_organizer.audio.whisper.WhisperModel")
     @patch("plex_organizer.audio.whisper.get_whisper_model_size", return_value="tiny")
-    def test_detect_handles_empty_segments(self, _ms, mock_wm):
-        """Handles empty segment iterator gracefully."""
+    def test_detect_skips_transcription(self, _ms, mock_wm, mock_decode):
+        """Only language identification runs on the decoded, VAD-filtered audio."""
         mock_model = MagicMock()
-        info = MagicMock()
-        info.language = "es"
-        info.language_probability = 0.8
-        mock_model.transcribe.return_value = (iter([]), info)
+        mock_model.detect_language.return_value = ("es", 0.8, [])
         mock_wm.return_value = mock_model
 
         detector = WhisperDetector()
         lang, prob = detector.detect_language("/audio.wav")
         assert lang == "es"
         assert prob == approx(0.8)
+        mock_decode.assert_called_once_with("/audio.wav", sampling_rate=16000)
+        mock_model.detect_language.assert_called_once_with(
+            mock_decode.return_value, vad_filter=True
+        )
+        mock_model.transcribe.assert_not_called()
 
     def test_detect_raises_when_unavailable(self):
         """Raises RuntimeError when backend is unavailable."""
@@ -108,18 +110,44 @@ class TestWhisperDetectorDetectLanguage:
         with raises(RuntimeError, match="unavailable"):
             detector.detect_language("/audio.wav")
 
+    @patch("plex_organizer.audio.whisper.decode_audio")
     @patch("plex_organizer.audio.whisper.WhisperModel")
     @patch("plex_organizer.audio.whisper.get_whisper_model_size", return_value="tiny")
-    def test_detect_handles_none_probability(self, _ms, mock_wm):
+    def test_detect_handles_none_probability(self, _ms, mock_wm, _decode):
         """Handles None probability gracefully."""
         mock_model = MagicMock()
-        info = MagicMock()
-        info.language = "fr"
-        info.language_probability = None
-        mock_model.transcribe.return_value = (iter([]), info)
+        mock_model.detect_language.return_value = ("fr", None, [])
         mock_wm.return_value = mock_model
 
         detector = WhisperDetector()
         lang, prob = detector.detect_language("/audio.wav")
         assert lang == "fr"
         assert prob == approx(0.0)
+
+
+@mark.usefixtures("default_config")
+class TestWhisperDetectorDetectLanguageFromArray:
+    """Tests for WhisperDetector.detect_language_from_array."""
+
+    @patch("plex_organizer.audio.whisper.WhisperModel")
+    @patch("plex_organizer.audio.whisper.get_whisper_model_size", return_value="tiny")
+    def test_passes_array_to_model(self, _ms, mock_wm):
+        """The sample array is handed to Whisper without touching disk."""
+        mock_model = MagicMock()
+        mock_model.detect_language.return_value = ("de", 0.7, [])
+        mock_wm.return_value = mock_model
+        pcm = zeros(16000, dtype=float32)
+
+        detector = WhisperDetector()
+        lang, prob = detector.detect_language_from_array(pcm)
+        assert lang == "de"
+        assert prob == approx(0.7)
+        assert mock_model.detect_language.call_args[0][0] is pcm
+
+    @patch("plex_organizer.audio.whisper.WhisperModel")
+    @patch("plex_organizer.audio.whisper.get_whisper_model_size", return_value="tiny")
+    def test_rejects_other_sample_rates(self, _ms, _wm):
+        """Only 16 kHz input is accepted."""
+        detector = WhisperDetector()
+        with raises(ValueError):
+            detector.detect_language_from_array(zeros(10, dtype=float32), 44100)
@@ -8,6 +8,7 @@ from pytest import fixture
 
 from plex_organizer.paths import data_dir
 from plex_organizer.config import ensure_config_exists
+from plex_organizer.log import reload_config as reload_log_config
 
 
 def pytest_configure():
@@ -52,10 +53,12 @@ def config_dir(tmp_path, monkeypatch):
     config_ini_path = join(str(config_path), "config.ini")
     monkeypatch.setattr("plex_organizer.config.CONFIG_PATH", config_ini_path)
     monkeypatch.setattr("plex_organizer.log.SCRIPT_DIR", str(config_path))
+    reload_log_config()
 
     yield config_path
 
     data_dir.cache_clear()
+    reload_log_config()
 
 
 @fixture
@@ -1,16 +1,21 @@
 """Tests for plex_organizer.subs.embedding – utility / helper tests."""
 
+from sys import modules
 from unittest.mock import MagicMock, patch
 from pytest import mark
 
+from plex_organizer.const import LANGDETECT_PROFILES
 from plex_organizer.subs.embedding import (
-    _ass_dialogue_to_payload,
     _clean_subtitle_text_for_langdetect,
     _dedupe_subtitle_inputs,
     _detect_subtitle_language_and_sdh,
+    _extract_all_embedded_subs,
     _extract_embedded_subtitle_to_srt,
     _filename_suggests_sdh,
+    _detect_with_cld3,
     _gather_subtitle_files_under,
+    _get_cld3_identifier,
+    _get_detector_factory,
     _get_overrides,
     _handle_existing_language_tag,
     _handle_title_lang2,
@@ -23,9 +28,10 @@ from plex_organizer.subs.embedding import (
     _lang2_from_title,
     _list_immediate_subtitle_dirs,
     _match_same_folder_subtitles,
+    _new_content_hash,
     _mp4_compatible_subtitle_paths,
     _normalize_language_tag_to_iso639_2,
-    _normalized_subtitle_bytes_for_hash,
+    _normalized_subtitle_digest,
     _read_text_best_effort,
     _scan_subtitle_dir,
     _stem_lower,
@@ -91,6 +97,13 @@ class TestReadTextBestEffort:
         """Missing file returns empty string."""
         assert _read_text_best_effort("/nonexistent.srt") == ""
 
+    def test_max_bytes_limits_read(self, tmp_path):
+        """Only the first max_bytes bytes are read when a limit is given."""
+        f = tmp_path / "sub.srt"
+        f.write_text("hello world", encoding="utf-8")
+        assert _read_text_best_effort(str(f), 5) == "hello"
+        assert _read_text_best_effort(str(f)) == "hello world"
+
 
 class TestFilenameSuggestsSDH:
     """Tests for _filename_suggests_sdh."""
@@ -127,6 +140,16 @@ class TestTextSuggestsSDH:
         """Plain dialogue is not SDH."""
         assert not _text_suggests_sdh("Hello there, how are you?")
 
+    def test_mixed_cues_count_together(self):
+        """Bracketed and parenthesized cues add up towards the threshold."""
+        assert _text_suggests_sdh("[music] Hi (sighs) Bye [door closes]")
+        assert not _text_suggests_sdh("[music] Hi (sighs) Bye")
+
+    def test_only_prefix_is_scanned(self):
+        """Cues beyond the first 40 000 characters are ignored."""
+        text = "word " * 8_000 + "[music] [laughing] [door closes]"
+        assert not _text_suggests_sdh(text)
+
 
 class TestCleanSubtitleText:
     """Tests for _clean_subtitle_text_for_langdetect."""
@@ -148,23 +171,32 @@ class TestCleanSubtitleText:
         result = _clean_subtitle_text_for_langdetect(text)
         assert "WEBVTT" not in result
 
+    def test_keeps_only_ass_dialogue_text(self):
+        """The nine leading ASS Dialogue fields and override tags are dropped."""
+        text = (
+            "Dialogue: 0,0:00:01.00,0:00:02.00,Default,Bob,0,0,0,,"
+            "{\\i1}Hello{\\i0} world\n"
+            "  dialogue: 0,1,2,3,4,5,6,7,8,payload here\n"
+            "Dialogue: a,b,c"
+        )
+        assert _clean_subtitle_text_for_langdetect(text) == (
+            "Hello world payload here Dialogue a b c"
+        )
 
-class TestAssDialogueToPayload:
-    """Tests for _ass_dialogue_to_payload."""
-
-    def test_non_dialogue(self):
-        """Non-dialogue lines pass through unchanged."""
-        assert _ass_dialogue_to_payload("some line") == "some line"
+    def test_strips_tags_after_punctuation(self):
+        """HTML tags are removed whole even right after punctuation."""
+        text = "1\r\n00:00:01,000 --> 00:00:02,000\r\n- Hey!<i>you</i>_2\r\n"
+        assert _clean_subtitle_text_for_langdetect(text) == "Hey you"
 
-    def test_dialogue(self):
-        """Dialogue payload is extracted from the 10th comma-separated field."""
-        line = "Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Hello world"
-        assert _ass_dialogue_to_payload(line) == "Hello world"
+    def test_tags_do_not_span_lines(self):
+        """Unclosed tags only lose their bracket, like line-by-line cleaning."""
+        text = "{oops\nnext} <broken\nline>"
+        assert _clean_subtitle_text_for_langdetect(text) == "oops next broken line"
 
-    def test_too_few_parts(self):
-        """Lines with too few fields are returned unchanged."""
-        line = "Dialogue: a,b,c"
-        assert _ass_dialogue_to_payload(line) == line
+    def test_max_chars_limits_input(self):
+        """Only the first max_chars characters are cleaned."""
+        text = "Hello there\n00:00:01,000 --> 00:00:02,000\nGeneral Kenobi"
+        assert _clean_subtitle_text_for_langdetect(text, 11) == "Hello there"
 
 
 class TestSubtitleLanguageNeedsTag:
@@ -246,6 +278,13 @@ class TestSimpleHelpers:
         """Non-subtitle extension is rejected."""
         assert not _is_subtitle("file.mkv")
 
+    def test_is_subtitle_ignores_case_and_extra_dots(self):
+        """Only the last extension counts, matched case-insensitively."""
+        assert _is_subtitle("Movie.en.SRT")
+        assert _is_subtitle("show.sub")
+        assert not _is_subtitle("subs.srt.txt")
+        assert not _is_subtitle("srt")
+
     def test_is_subtitles_dir_true(self):
         """Known subtitle directory names are recognized."""
         assert _is_subtitles_dir_name("Subs")
@@ -280,7 +319,7 @@ class TestDedupeOSError:  # pylint: disable=too-few-public-methods
         f = tmp_path / "a.srt"
         f.write_text("x")
         with patch(
-            "plex_organizer.subs.embedding._normalized_subtitle_bytes_for_hash",
+            "plex_organizer.subs.embedding._normalized_subtitle_digest",
             side_effect=OSError("nope"),
         ):
             result = _dedupe_subtitle_inputs([str(f)])
@@ -316,27 +355,44 @@ class TestMatching:
 
 
 class TestNormalizedSubtitleBytesForHash:
-    """Tests for _normalized_subtitle_bytes_for_hash."""
+    """Tests for _normalized_subtitle_digest."""
 
     def test_text_normalizes_crlf(self, tmp_path):
-        """CRLF line endings are normalized to LF."""
+        """CRLF and CR line endings hash like LF."""
         f = tmp_path / "sub.srt"
-        f.write_bytes(b"\r\nhello\r\n")
-        result = _normalized_subtitle_bytes_for_hash(str(f))
-        assert b"\r" not in result
+        f.write_bytes(b"\r\nhello\rworld\r\n")
+        assert (
+            _normalized_subtitle_digest(str(f))
+            == _new_content_hash(b"\nhello\nworld\n").hexdigest()
+        )
 
     def test_text_strips_bom(self, tmp_path):
         """UTF-8 BOM is stripped from text subtitles."""
         f = tmp_path / "sub.srt"
         f.write_bytes(b"\xef\xbb\xbfhello")
-        result = _normalized_subtitle_bytes_for_hash(str(f))
-        assert not result.startswith(b"\xef\xbb\xbf")
+        assert (
+            _normalized_subtitle_digest(str(f))
+            == _new_content_hash(b"hello").hexdigest()
+        )
 
     def test_binary_unchanged(self, tmp_path):
-        """Binary subtitle bytes are returned unchanged."""
+        """Binary subtitle bytes are hashed unchanged."""
         f = tmp_path / "sub.sup"
-        f.write_bytes(b"\x00\x01\x02")
-        assert _normalized_subtitle_bytes_for_hash(str(f)) == b"\x00\x01\x02"
+        f.write_bytes(b"\xef\xbb\xbf\r\n\x00")
+        assert (
+            _normalized_subtitle_digest(str(f))
+            == _new_content_hash(b"\xef\xbb\xbf\r\n\x00").hexdigest()
+        )
+
+    @mark.parametrize("tail", [b"\r\nend", b"\r", b"\rx"])
+    def test_line_ending_split_across_chunks(self, tail, tmp_path):
+        """A CR at a chunk boundary is folded together with the next chunk."""
+        f = tmp_path / "sub.srt"
+        f.write_bytes(b"a\r" + tail)
+        with patch("plex_organizer.subs.embedding._HASH_CHUNK_SIZE", 2):
+            streamed = _normalized_subtitle_digest(str(f))
+        expected = (b"a\r" + tail).replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        assert streamed == _new_content_hash(expected).hexdigest()
 
 
 class TestDedupeSubtitleInputs:
@@ -360,6 +416,30 @@ class TestDedupeSubtitleInputs:
         result = _dedupe_subtitle_inputs([str(f1), str(f2)])
         assert len(result) == 2
 
+    def test_unique_size_binary_not_hashed(self, tmp_path):
+        """A binary subtitle with a size no other input shares is kept unhashed."""
+        sup = tmp_path / "a.sup"
+        srt = tmp_path / "a.srt"
+        sup.write_bytes(b"\x00\x01")
+        srt.write_text("text")
+        with patch(
+            "plex_organizer.subs.embedding._normalized_subtitle_digest",
+            return_value="d",
+        ) as mock_digest:
+            result = _dedupe_subtitle_inputs([str(sup), str(srt)])
+        mock_digest.assert_called_once_with(str(srt))
+        assert (str(sup), "") in result
+
+    def test_same_size_binaries_are_compared(self, tmp_path):
+        """Equal-size binary subtitles are hashed and duplicates dropped."""
+        (tmp_path / "a.sup").write_bytes(b"\x00\x01")
+        (tmp_path / "b.sup").write_bytes(b"\x00\x01")
+        (tmp_path / "c.sup").write_bytes(b"\x00\x02")
+        result = _dedupe_subtitle_inputs(
+            [str(tmp_path / n) for n in ("a.sup", "b.sup", "c.sup")]
+        )
+        assert [p.rsplit("/", 1)[-1] for p, _ in result] == ["a.sup", "c.sup"]
+
     def test_skips_sub_with_idx(self, tmp_path):
         """.sub file is skipped when matching .idx exists."""
         idx = tmp_path / "movie.idx"
@@ -368,7 +448,7 @@ class TestDedupeSubtitleInputs:
         sub.write_text("subtitle")
         result = _dedupe_subtitle_inputs([str(idx), str(sub)])
         assert len(result) == 1
-        assert result[0].endswith(".idx")
+        assert result[0][0].endswith(".idx")
 
 
 @mark.usefixtures("default_config")
@@ -423,7 +503,7 @@ class TestDetectSubtitleLanguageAndSdh:
         assert lang is None
         assert sdh is False
 
-    @patch("plex_organizer.subs.embedding.detect_langs")
+    @patch("plex_organizer.subs.embedding._detect_langs")
     def test_detects_language(self, mock_detect, tmp_path):
         """Detects language from subtitle text."""
         f = tmp_path / "sub.srt"
@@ -438,6 +518,15 @@ class TestDetectSubtitleLanguageAndSdh:
         assert lang == "eng"
         assert sdh is False
 
+    @patch("plex_organizer.subs.embedding._detect_langs", return_value=[])
+    @patch("plex_organizer.subs.embedding._read_text_best_effort", return_value="")
+    def test_reads_only_file_prefix(self, mock_read, _detect, tmp_path):
+        """Detection reads a bounded prefix instead of the whole file."""
+        f = tmp_path / "sub.srt"
+        f.write_text("Hello")
+        _detect_subtitle_language_and_sdh(str(f))
+        assert mock_read.call_args[0] == (str(f), 128 * 1024)
+
     def test_too_short(self, tmp_path):
         """Too-short text returns None language."""
         f = tmp_path / "sub.srt"
@@ -446,7 +535,7 @@ class TestDetectSubtitleLanguageAndSdh:
         assert lang is None
 
     @patch(
-        "plex_organizer.subs.embedding.detect_langs",
+        "plex_organizer.subs.embedding._detect_langs",
         side_effect=__import__("langdetect").lang_detect_exception.LangDetectException(
             0, ""
         ),
@@ -460,9 +549,9 @@ class TestDetectSubtitleLanguageAndSdh:
         lang, _sdh = _detect_subtitle_language_and_sdh(str(f))
         assert lang is None
 
-    @patch("plex_organizer.subs.embedding.detect_langs", return_value=[])
+    @patch("plex_organizer.subs.embedding._detect_langs", return_value=[])
     def test_empty_candidates(self, _detect, tmp_path):
-        """Empty detect_langs candidates returns (None, sdh)."""
+        """Empty langdetect candidates returns (None, sdh)."""
         f = tmp_path / "sub.srt"
         f.write_text(
             "Hello world this is a sentence with plenty of text for detection. " * 5
@@ -470,6 +559,18 @@ class TestDetectSubtitleLanguageAndSdh:
         lang, _sdh = _detect_subtitle_language_and_sdh(str(f))
         assert lang is None
 
+    def test_real_detection_uses_shared_factory(self, tmp_path):
+        """English text is detected with one factory reused across calls."""
+        f = tmp_path / "sub.srt"
+        f.write_text(
+            "1\n00:00:01,000 --> 00:00:02,000\n"
+            + "Where are you going tonight? I am going home to see my family. " * 5
+        )
+        assert _detect_subtitle_language_and_sdh(str(f))[0] == "eng"
+        factory = _get_detector_factory()
+        assert _detect_subtitle_language_and_sdh(str(f))[0] == "eng"
+        assert _get_detector_factory() is factory
+
     def test_cleaned_empty_returns_none(self, tmp_path):
         """Cleaned text with no alpha chars returns None."""
         f = tmp_path / "sub.srt"
@@ -478,6 +579,135 @@ class TestDetectSubtitleLanguageAndSdh:
         assert lang is None
 
 
+class TestDetectionCache:
+    """Tests for content-hash caching in _detect_subtitle_language_and_sdh."""
+
+    def setup_method(self):
+        """Start each test with an empty detection cache."""
+        getattr(modules["plex_organizer.subs.embedding"], "_detection_cache").clear()
+
+    def teardown_method(self):
+        """Drop results cached from mocks."""
+        getattr(modules["plex_organizer.subs.embedding"], "_detection_cache").clear()
+
+    @patch(
+        "plex_organizer.subs.embedding._detect_text_language_and_sdh",
+        return_value=("eng", False),
+    )
+    def test_hash_hit_skips_text_analysis(self, mock_text):
+        """A second file with the same digest is not read again."""
+        assert _detect_subtitle_language_and_sdh("/a.srt", "h") == ("eng", False)
+        assert _detect_subtitle_language_and_sdh("/b.sdh.srt", "h") == ("eng", True)
+        mock_text.assert_called_once_with("/a.srt")
+
+    @patch(
+        "plex_organizer.subs.embedding._detect_text_language_and_sdh",
+        return_value=("eng", False),
+    )
+    def test_without_hash_nothing_is_cached(self, mock_text):
+        """Calls without a digest always analyze the file."""
+        _detect_subtitle_language_and_sdh("/a.srt")
+        _detect_subtitle_language_and_sdh("/a.srt")
+        assert mock_text.call_count == 2
+
+
+class TestDetectWithCld3:
+    """Tests for the optional CLD3 fast path."""
+
+    def setup_method(self):
+        """Start each test with an empty identifier cache."""
+        _get_cld3_identifier.cache_clear()
+
+    def teardown_method(self):
+        """Drop identifiers built from mocks."""
+        _get_cld3_identifier.cache_clear()
+
+    @staticmethod
+    def _identifier(language, probability, reliable=True):
+        """Patch gcld3 with an identifier returning one fixed result."""
+        cls = MagicMock()
+        cls.return_value.FindLanguage.return_value = MagicMock(
+            language=language, probability=probability, is_reliable=reliable
+        )
+        return patch("plex_organizer.subs.embedding.NNetLanguageIdentifier", cls)
+
+    def test_not_installed_returns_none(self):
+        """Without gcld3 the caller falls back to langdetect."""
+        with patch("plex_organizer.subs.embedding.NNetLanguageIdentifier", None):
+            assert _detect_with_cld3("some text") is None
+
+    def test_confident_result_is_converted(self):
+        """A reliable CLD3 result is returned as ISO 639-2."""
+        with self._identifier("et", 0.98):
+            assert _detect_with_cld3("tere") == "est"
+
+    def test_low_probability_or_unreliable_returns_none(self):
+        """Uncertain CLD3 answers are left to langdetect."""
+        with self._identifier("en", 0.5):
+            assert _detect_with_cld3("hi") is None
+        _get_cld3_identifier.cache_clear()
+        with self._identifier("en", 0.9, reliable=False):
+            assert _detect_with_cld3("hi") is None
+
+    @patch("plex_organizer.subs.embedding._detect_langs")
+    def test_detection_skips_langdetect_on_cld3_hit(self, mock_langdetect, tmp_path):
+        """A confident CLD3 answer is used without running langdetect."""
+        f = tmp_path / "sub.srt"
+        f.write_text("Tere tulemast koju, mu sober. Kuidas sul tana laheb? " * 5)
+        with self._identifier("et", 0.99):
+            assert _detect_subtitle_language_and_sdh(str(f))[0] == "est"
+        mock_langdetect.assert_not_called()
+
+
+@mark.usefixtures("default_config")
+class TestGetDetectorFactory:
+    """Tests for _get_detector_factory profile selection."""
+
+    def setup_method(self):
+        """Start each test with an empty factory cache."""
+        _get_detector_factory.cache_clear()
+
+    def teardown_method(self):
+        """Drop factories built with patched settings."""
+        _get_detector_factory.cache_clear()
+
+    @patch("plex_organizer.subs.embedding.get_fetch_subtitles", return_value=[])
+    def test_default_loads_common_profiles(self, _fetch):
+        """An empty setting loads exactly the built-in common profiles."""
+        factory = _get_detector_factory()
+        assert sorted(factory.langlist) == sorted(LANGDETECT_PROFILES)
+
+    @patch(
+        "plex_organizer.subs.embedding.get_fetch_subtitles",
+        return_value=["est", "zho"],
+    )
+    @patch(
+        "plex_organizer.subs.embedding.get_detection_languages",
+        return_value=["en", "xx"],
+    )
+    def test_configured_and_fetched_languages(self, _langs, _fetch):
+        """Configured and fetched languages are loaded; unknown names skipped."""
+        factory = _get_detector_factory()
+        assert sorted(factory.langlist) == ["en", "et", "zh-cn", "zh-tw"]
+
+    @patch(
+        "plex_organizer.subs.embedding.get_detection_languages",
+        return_value=["all"],
+    )
+    def test_all_loads_every_profile(self, _langs):
+        """The value 'all' loads langdetect's full profile directory."""
+        assert len(_get_detector_factory().langlist) > len(LANGDETECT_PROFILES)
+
+    @patch("plex_organizer.subs.embedding.get_fetch_subtitles", return_value=[])
+    @patch(
+        "plex_organizer.subs.embedding.get_detection_languages",
+        return_value=["en"],
+    )
+    def test_single_profile_falls_back_to_all(self, _langs, _fetch):
+        """langdetect needs two profiles, so one name loads every profile."""
+        assert len(_get_detector_factory().langlist) > len(LANGDETECT_PROFILES)
+
+
 class TestExtractEmbeddedSubtitleToSrt:
     """Tests for _extract_embedded_subtitle_to_srt."""
 
@@ -522,37 +752,96 @@ class TestExtractEmbeddedSubtitleToSrt:
 class TestGetOverrides:
     """Tests for _get_overrides."""
 
-    @patch("plex_organizer.subs.embedding._handle_tmp_srt")
-    def test_valid_language_no_title(self, _tmp_srt):
+    @patch("plex_organizer.subs.embedding._extract_all_embedded_subs")
+    def test_valid_language_no_title(self, mock_extract):
         """Stream with valid language and empty title gets title override."""
         streams = [{"tags": {"language": "eng", "title": ""}}]
         _lang_o, title_o = _get_overrides(streams, "/v.mkv", "/ff")
         assert 0 in title_o
         assert title_o[0] == "eng"
+        mock_extract.assert_not_called()
 
-    @patch("plex_organizer.subs.embedding._handle_tmp_srt")
-    def test_title_with_lang_code(self, _tmp_srt):
+    @patch("plex_organizer.subs.embedding._extract_all_embedded_subs")
+    def test_title_with_lang_code(self, _extract):
         """Stream with title containing lang code is resolved via title."""
         streams = [{"tags": {"language": "und", "title": "spa subtitle"}}]
         lang_o, _title_o = _get_overrides(streams, "/v.mkv", "/ff")
         assert lang_o.get(0) == "spa"
 
     @patch("plex_organizer.subs.embedding._handle_tmp_srt")
-    def test_falls_through_to_tmp_srt(self, mock_tmp):
-        """Stream with und language and no useful title falls through to tmp srt."""
-        streams = [{"tags": {"language": "und", "title": ""}}]
+    @patch(
+        "plex_organizer.subs.embedding._extract_all_embedded_subs",
+        return_value={0: "/tmp/0.srt", 2: "/tmp/2.srt"},
+    )
+    def test_undetected_streams_extracted_together(self, mock_extract, mock_tmp):
+        """Streams needing detection are extracted in one call, then detected."""
+        streams = [
+            {"tags": {"language": "und", "title": ""}},
+            {"tags": {"language": "eng", "title": ""}},
+            {"tags": {}},
+        ]
         _get_overrides(streams, "/v.mkv", "/ff")
-        mock_tmp.assert_called_once()
+        mock_extract.assert_called_once_with("/ff", "/v.mkv", [0, 2])
+        assert [c[0][:2] for c in mock_tmp.call_args_list] == [
+            (0, "/tmp/0.srt"),
+            (2, "/tmp/2.srt"),
+        ]
 
     def test_tags_none(self):
         """Stream with no tags at all is handled without error."""
         streams = [{"tags": None}]
-        with patch("plex_organizer.subs.embedding._handle_tmp_srt"):
+        with patch(
+            "plex_organizer.subs.embedding._extract_all_embedded_subs",
+            return_value={},
+        ):
             lang_o, title_o = _get_overrides(streams, "/v.mkv", "/ff")
         assert isinstance(lang_o, dict)
         assert isinstance(title_o, dict)
 
 
+class TestExtractAllEmbeddedSubs:
+    """Tests for _extract_all_embedded_subs."""
+
+    @patch("plex_organizer.subs.embedding.run_cmd")
+    def test_single_ffmpeg_pass(self, mock_run, tmp_path):
+        """All streams are mapped to their own output in one command."""
+        mock_run.return_value = MagicMock(returncode=0)
+        with patch("plex_organizer.subs.embedding.scratch_dir", return_value=tmp_path):
+            result = _extract_all_embedded_subs("/ff", "/v.mkv", [1, 3])
+
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args[0][0]
+        assert cmd.count("-map") == 2
+        assert "0:s:1" in cmd and "0:s:3" in cmd
+        assert sorted(result) == [1, 3]
+        assert all(path in cmd for path in result.values())
+
+    @patch(
+        "plex_organizer.subs.embedding._extract_embedded_subtitle_to_srt",
+        side_effect=[None, "/tmp/3.srt"],
+    )
+    @patch("plex_organizer.subs.embedding.run_cmd")
+    def test_failure_falls_back_per_stream(self, mock_run, mock_single, tmp_path):
+        """A failed combined run retries each stream and cleans up its outputs."""
+        mock_run.return_value = MagicMock(returncode=1)
+        with patch("plex_organizer.subs.embedding.scratch_dir", return_value=tmp_path):
+            result = _extract_all_embedded_subs("/ff", "/v.mkv", [1, 3])
+
+        assert result == {3: "/tmp/3.srt"}
+        assert mock_single.call_count == 2
+        assert not list(tmp_path.iterdir())
+
+    @patch(
+        "plex_organizer.subs.embedding._extract_embedded_subtitle_to_srt",
+        return_value="/tmp/0.srt",
+    )
+    @patch("plex_organizer.subs.embedding.run_cmd")
+    def test_single_stream_uses_direct_extraction(self, mock_run, _single):
+        """One stream needs no combined command."""
+        assert _extract_all_embedded_subs("/ff", "/v.mkv", [0]) == {0: "/tmp/0.srt"}
+        mock_run.assert_not_called()
+
+
 class TestGatherSubtitleFilesUnder:
     """Tests for _gather_subtitle_files_under."""
 
@@ -611,30 +900,28 @@ class TestOverrideHelpers:
         overrides = {}
         assert not _handle_title_lang2(0, None, overrides)
 
+    @patch("plex_organizer.subs.embedding.remove")
     @patch(
-        "plex_organizer.subs.embedding._extract_embedded_subtitle_to_srt",
-        return_value=None,
+        "plex_organizer.subs.embedding._detect_subtitle_language_and_sdh",
+        return_value=(None, False),
     )
-    def test_handle_tmp_srt_no_extraction(self, _extract):
-        """No overrides when extraction returns None."""
+    def test_handle_tmp_srt_not_detected(self, _detect, mock_rm):
+        """No overrides when detection fails; the temp file is still removed."""
         lang_o = {}
         title_o = {}
-        _handle_tmp_srt(0, "/ff", "/v.mkv", lang_o, title_o)
+        _handle_tmp_srt(0, "/tmp/tmp.srt", lang_o, title_o)
         assert len(lang_o) == 0
+        mock_rm.assert_called_once_with("/tmp/tmp.srt")
 
     @patch("plex_organizer.subs.embedding.remove", side_effect=OSError("locked"))
     @patch(
         "plex_organizer.subs.embedding._detect_subtitle_language_and_sdh",
         return_value=("eng", True),
     )
-    @patch(
-        "plex_organizer.subs.embedding._extract_embedded_subtitle_to_srt",
-        return_value="/tmp/tmp.srt",
-    )
-    def test_handle_tmp_srt_detected(self, _extract, _detect, _rm):
+    def test_handle_tmp_srt_detected(self, _detect, _rm):
         """Detected language and SDH populate both override dicts."""
         lang_o = {}
         title_o = {}
-        _handle_tmp_srt(0, "/ff", "/v.mkv", lang_o, title_o)
+        _handle_tmp_srt(0, "/tmp/tmp.srt", lang_o, title_o)
         assert lang_o[0] == "eng"
         assert title_o[0] == "eng SDH"
@@ -1,14 +1,18 @@
 """Tests for plex_organizer.subs.embedding – operational / integration tests."""
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
-from pytest import mark
+from pytest import mark, raises
 
 from plex_organizer.dataclass import SubtitleMergePlan
 from plex_organizer.subs.embedding import (
     _build_subtitle_embed_cmd,
     _delete_paths_best_effort,
     _discover_plans,
-    _embed_subtitles,
+    _embed_and_tag,
+    _embedded_subtitle_overrides,
+    _for_each_video,
+    _probe_embedded_subtitles,
     _embeddable_subtitles_for_video,
     _tag_embedded_subtitle_languages,
     _tag_embedded_subtitle_languages_for_videos,
@@ -179,6 +183,36 @@ class TestTagEmbeddedSubtitleLanguages:
         _tag_embedded_subtitle_languages(str(vid))
 
 
+class TestEmbeddedSubtitleOverrides:
+    """Tests for _embedded_subtitle_overrides."""
+
+    def test_missing_file(self):
+        """Missing files have no overrides."""
+        assert _embedded_subtitle_overrides("/nonexistent.mkv") == ({}, {})
+
+    @patch("plex_organizer.subs.embedding.probe_streams_json")
+    def test_plex_folder_skipped(self, mock_probe):
+        """Plex-managed folders are not probed."""
+        assert _embedded_subtitle_overrides("/m/Plex Versions/v.mkv") == ({}, {})
+        assert _probe_embedded_subtitles("/m/Plex Versions/v.mkv") == (None, {}, {})
+        mock_probe.assert_not_called()
+
+    @patch(
+        "plex_organizer.subs.embedding._get_overrides",
+        return_value=({1: "eng"}, {1: "eng"}),
+    )
+    @patch("plex_organizer.subs.embedding.get_ffmpeg", return_value="/ff")
+    @patch(
+        "plex_organizer.subs.embedding.probe_streams_json",
+        return_value=[{"tags": {}}, {"tags": {}}],
+    )
+    def test_reports_stream_count(self, _probe, _ff, _overrides, tmp_path):
+        """The probed subtitle stream count is returned with the overrides."""
+        vid = tmp_path / "v.mkv"
+        vid.write_text("x")
+        assert _probe_embedded_subtitles(str(vid)) == (2, {1: "eng"}, {1: "eng"})
+
+
 class TestEmbeddableSubtitlesForVideo:
     """Tests for _embeddable_subtitles_for_video."""
 
@@ -209,6 +243,8 @@ class TestEmbeddableSubtitlesForVideo:
         )
         assert is_mp4 is False
         assert len(subs) == 1
+        assert subs[0][0] == str(sub)
+        assert len(subs[0][1]) == 64
 
     def test_mp4_dedupes_after_filter(self, tmp_path):
         """MP4 deduplicates after filtering to compatible."""
@@ -286,6 +322,60 @@ class TestBuildSubtitleEmbedCmd:
         )
         assert not any("language=" in a for a in cmd)
 
+    @patch(
+        "plex_organizer.subs.embedding._detect_subtitle_language_and_sdh",
+        return_value=("fre", False),
+    )
+    @patch("plex_organizer.subs.embedding.probe_subtitle_stream_count", return_value=1)
+    def test_embedded_overrides_in_same_cmd(self, _count, _detect):
+        """Tags for existing streams and new inputs share one command."""
+        cmd = _build_subtitle_embed_cmd(
+            "/ff",
+            "/v.mkv",
+            ["/a.srt"],
+            "/tmp/out.mkv",
+            False,
+            overrides=({0: "eng"}, {0: "eng SDH"}),
+        )
+        assert cmd.count("-i") == 2
+        assert ["-metadata:s:s:0", "language=eng"] == cmd[
+            cmd.index("language=eng") - 1 : cmd.index("language=eng") + 1
+        ]
+        assert "title=eng SDH" in cmd
+        assert "language=fre" in cmd
+        assert cmd[-1] == "/tmp/out.mkv"
+
+    @patch(
+        "plex_organizer.subs.embedding._detect_subtitle_language_and_sdh",
+        return_value=("eng", False),
+    )
+    @patch("plex_organizer.subs.embedding.probe_subtitle_stream_count")
+    def test_known_stream_count_skips_probe(self, mock_count, _detect):
+        """A stream count from an earlier probe is used as-is."""
+        cmd = _build_subtitle_embed_cmd(
+            "/ff",
+            "/v.mkv",
+            ["/a.srt"],
+            "/tmp/out.mkv",
+            False,
+            existing_embedded_sub_count=3,
+        )
+        mock_count.assert_not_called()
+        assert "-metadata:s:s:3" in cmd
+
+    @patch(
+        "plex_organizer.subs.embedding._detect_subtitle_language_and_sdh",
+        return_value=("eng", False),
+    )
+    @patch("plex_organizer.subs.embedding.probe_subtitle_stream_count", return_value=0)
+    def test_content_hashes_passed_to_detection(self, _count, mock_detect):
+        """Each subtitle's content digest is handed to language detection."""
+        _build_subtitle_embed_cmd(
+            "/ff", "/v.mkv", ["/a.srt", "/b.srt"], "/tmp/out.mkv", False, ["h1", "h2"]
+        )
+        assert mock_detect.call_args_list[0][0] == ("/a.srt", "h1")
+        assert mock_detect.call_args_list[1][0] == ("/b.srt", "h2")
+
 
 @mark.usefixtures("default_config")
 class TestDeletePathsBestEffort:
@@ -307,14 +397,14 @@ class TestDeletePathsBestEffort:
 
 @mark.usefixtures("default_config")
 class TestEmbedSubtitles:
-    """Tests for _embed_subtitles."""
+    """Tests for _embed_and_tag."""
 
     def test_plex_folder_skipped(self):
         """Plex-managed folders are skipped."""
         plan = SubtitleMergePlan(
             video_path="/Plex Versions/v.mkv", subtitle_paths=("/sub.srt",)
         )
-        _embed_subtitles(plan)
+        _embed_and_tag(plan)
 
     @patch("plex_organizer.subs.embedding.log_error")
     def test_missing_video(self, mock_log):
@@ -322,7 +412,7 @@ class TestEmbedSubtitles:
         plan = SubtitleMergePlan(
             video_path="/nonexistent.mkv", subtitle_paths=("/sub.srt",)
         )
-        _embed_subtitles(plan)
+        _embed_and_tag(plan)
         mock_log.assert_called_once()
 
     @patch("plex_organizer.subs.embedding.remove")
@@ -340,7 +430,7 @@ class TestEmbedSubtitles:
     @patch("plex_organizer.subs.embedding.get_ffmpeg", return_value="/ff")
     @patch(
         "plex_organizer.subs.embedding._embeddable_subtitles_for_video",
-        return_value=(False, ["/sub.srt"]),
+        return_value=(False, [("/sub.srt", "abc")]),
     )
     def test_success(
         self, _emb, _ff, _tmp, _build, mock_run, _rep, _del, _exists, _rm, tmp_path
@@ -350,9 +440,12 @@ class TestEmbedSubtitles:
         vid = tmp_path / "v.mkv"
         vid.write_text("x")
         plan = SubtitleMergePlan(video_path=str(vid), subtitle_paths=("/sub.srt",))
-        _embed_subtitles(plan)
+        _embed_and_tag(plan)
         _rep.assert_called_once()
-        _del.assert_called_once()
+        _del.assert_called_once_with(["/sub.srt"])
+        assert _build.call_args[0][2] == ["/sub.srt"]
+        assert _build.call_args[0][5] == ["abc"]
+        assert _build.call_args[0][6] == ({}, {})
 
     @patch("plex_organizer.subs.embedding.remove")
     @patch("plex_organizer.subs.embedding.exists", return_value=False)
@@ -368,7 +461,7 @@ class TestEmbedSubtitles:
     @patch("plex_organizer.subs.embedding.get_ffmpeg", return_value="/ff")
     @patch(
         "plex_organizer.subs.embedding._embeddable_subtitles_for_video",
-        return_value=(False, ["/sub.srt"]),
+        return_value=(False, [("/sub.srt", "abc")]),
     )
     def test_ffmpeg_failure(
         self, _emb, _ff, _tmp, _build, mock_run, mock_log, _exists, _rm, tmp_path
@@ -378,7 +471,7 @@ class TestEmbedSubtitles:
         vid = tmp_path / "v.mkv"
         vid.write_text("x")
         plan = SubtitleMergePlan(video_path=str(vid), subtitle_paths=("/sub.srt",))
-        _embed_subtitles(plan)
+        _embed_and_tag(plan)
         mock_log.assert_called()
 
     @patch(
@@ -390,7 +483,22 @@ class TestEmbedSubtitles:
         vid = tmp_path / "v.mkv"
         vid.write_text("x")
         plan = SubtitleMergePlan(video_path=str(vid), subtitle_paths=("/sub.srt",))
-        _embed_subtitles(plan)
+        with patch("plex_organizer.subs.embedding.run_cmd") as mock_run:
+            _embed_and_tag(plan)
+        mock_run.assert_not_called()
+
+    @patch("plex_organizer.subs.embedding._apply_subtitle_overrides")
+    @patch(
+        "plex_organizer.subs.embedding._embeddable_subtitles_for_video",
+        return_value=(False, []),
+    )
+    def test_no_embeddable_subs_still_tags(self, _emb, mock_apply, tmp_path):
+        """Tag overrides are written even when no subtitle can be embedded."""
+        vid = tmp_path / "v.mkv"
+        vid.write_text("x")
+        plan = SubtitleMergePlan(video_path=str(vid), subtitle_paths=("/sub.srt",))
+        _embed_and_tag(plan, {0: "eng"}, {0: "eng"})
+        mock_apply.assert_called_once_with(str(vid), {0: "eng"}, {0: "eng"})
 
     @patch("plex_organizer.subs.embedding.remove")
     @patch("plex_organizer.subs.embedding.exists", return_value=True)
@@ -405,7 +513,7 @@ class TestEmbedSubtitles:
     @patch("plex_organizer.subs.embedding.get_ffmpeg", return_value="/ff")
     @patch(
         "plex_organizer.subs.embedding._embeddable_subtitles_for_video",
-        return_value=(False, ["/sub.srt"]),
+        return_value=(False, [("/sub.srt", "abc")]),
     )
     def test_runtime_error_logged(
         self, _emb, _ff, _tmp, _build, mock_log, _exists, _rm, tmp_path
@@ -414,7 +522,7 @@ class TestEmbedSubtitles:
         vid = tmp_path / "v.mkv"
         vid.write_text("x")
         plan = SubtitleMergePlan(video_path=str(vid), subtitle_paths=("/sub.srt",))
-        _embed_subtitles(plan)
+        _embed_and_tag(plan)
         mock_log.assert_called()
 
     @patch("plex_organizer.subs.embedding.remove", side_effect=OSError("locked"))
@@ -431,7 +539,7 @@ class TestEmbedSubtitles:
     @patch("plex_organizer.subs.embedding.get_ffmpeg", return_value="/ff")
     @patch(
         "plex_organizer.subs.embedding._embeddable_subtitles_for_video",
-        return_value=(False, ["/sub.srt"]),
+        return_value=(False, [("/sub.srt", "abc")]),
     )
     def test_tmp_cleanup_oserror(
         self, _emb, _ff, _tmp, _build, mock_run, mock_log, _exists, _rm, tmp_path
@@ -441,7 +549,7 @@ class TestEmbedSubtitles:
         vid = tmp_path / "v.mkv"
         vid.write_text("x")
         plan = SubtitleMergePlan(video_path=str(vid), subtitle_paths=("/sub.srt",))
-        _embed_subtitles(plan)
+        _embed_and_tag(plan)
         assert mock_log.call_count >= 1
 
 
@@ -470,6 +578,44 @@ class TestTagEmbeddedSubtitleLanguagesForVideos:
         _tag_embedded_subtitle_languages_for_videos(["/media/v.mkv"])
 
 
+@mark.usefixtures("default_config")
+class TestForEachVideo:
+    """Tests for _for_each_video."""
+
+    @patch("plex_organizer.subs.embedding.ThreadPoolExecutor")
+    @patch("plex_organizer.subs.embedding.get_parallel_workers", return_value=1)
+    def test_single_worker_runs_serially(self, _workers, mock_pool):
+        """One worker processes items in order without a thread pool."""
+        seen = []
+        _for_each_video(seen.append, ["a", "b", "c"])
+        assert seen == ["a", "b", "c"]
+        mock_pool.assert_not_called()
+
+    @patch("plex_organizer.subs.embedding.get_parallel_workers", return_value=0)
+    @patch("plex_organizer.subs.embedding.get_cpu_threads", return_value=3)
+    def test_zero_follows_cpu_threads(self, _threads, _workers):
+        """With the default of 0 the pool is sized by cpu_threads."""
+        with patch(
+            "plex_organizer.subs.embedding.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        ) as mock_pool:
+            seen = []
+            _for_each_video(seen.append, ["a", "b", "c", "d"])
+        mock_pool.assert_called_once_with(max_workers=3)
+        assert sorted(seen) == ["a", "b", "c", "d"]
+
+    @patch("plex_organizer.subs.embedding.get_parallel_workers", return_value=4)
+    def test_exceptions_propagate(self, _workers):
+        """An error from one item is re-raised to the caller."""
+
+        def fail_on_b(item):
+            if item == "b":
+                raise OSError("disk")
+
+        with raises(OSError):
+            _for_each_video(fail_on_b, ["a", "b"])
+
+
 class TestDiscoverPlans:
     """Tests for _discover_plans."""
 
@@ -529,6 +675,17 @@ class TestDiscoverPlans:
         (tmp_path / "video.mkv").write_text("x")
         assert _discover_plans(str(tmp_path)) == []
 
+    def test_uses_given_tree_listing(self, tmp_path):
+        """A pre-built listing is used instead of walking the directory."""
+        (tmp_path / "video.mkv").write_text("x")
+        (tmp_path / "video.srt").write_text("x")
+        with patch("plex_organizer.subs.embedding.iter_tree") as mock_walk:
+            plans = _discover_plans(
+                str(tmp_path), [(str(tmp_path), ["video.mkv", "video.srt"])]
+            )
+        mock_walk.assert_not_called()
+        assert len(plans) == 1
+
 
 @mark.usefixtures("default_config")
 class TestMergeSubtitlesInDirectory:
@@ -550,7 +707,7 @@ class TestMergeSubtitlesInDirectory:
         """Plex-managed directories are skipped."""
         merge_subtitles_in_directory("/media/Plex Versions", [])
 
-    @patch("plex_organizer.subs.embedding._embed_subtitles")
+    @patch("plex_organizer.subs.embedding._embed_and_tag")
     @patch(
         "plex_organizer.subs.embedding._discover_plans",
         return_value=[
@@ -589,9 +746,40 @@ class TestMergeSubtitlesInDirectory:
         merge_subtitles_in_directory("/media", ["/media/v.mkv"])
         mock_tag.assert_called_once()
 
+    @patch("plex_organizer.subs.embedding._embed_and_tag")
+    @patch(
+        "plex_organizer.subs.embedding._probe_embedded_subtitles",
+        return_value=(2, {0: "eng"}, {0: "eng"}),
+    )
+    @patch("plex_organizer.subs.embedding._tag_embedded_subtitle_languages_for_videos")
+    @patch(
+        "plex_organizer.subs.embedding._discover_plans",
+        return_value=[
+            SubtitleMergePlan(
+                video_path="/media/v.mkv", subtitle_paths=("/media/v.srt",)
+            )
+        ],
+    )
+    @patch(
+        "plex_organizer.subs.embedding.get_analyze_embedded_subtitles",
+        return_value=True,
+    )
+    @patch("plex_organizer.subs.embedding.log_debug")
+    @patch(
+        "plex_organizer.subs.embedding.get_enable_subtitle_embedding",
+        return_value=True,
+    )
+    def test_planned_videos_tagged_during_embed(
+        self, _cfg, _log, _analyze, _plans, mock_tag, _overrides, mock_embed
+    ):
+        """Videos with subtitles to embed get their tags in the same remux."""
+        merge_subtitles_in_directory("/media", ["/media/v.mkv", "/media/w.mkv"])
+        mock_tag.assert_called_once_with(["/media/w.mkv"])
+        assert mock_embed.call_args[0][1:] == ({0: "eng"}, {0: "eng"}, 2)
+
     @patch("plex_organizer.subs.embedding.log_error")
     @patch(
-        "plex_organizer.subs.embedding._embed_subtitles",
+        "plex_organizer.subs.embedding._embed_and_tag",
         side_effect=OSError("disk"),
     )
     @patch(
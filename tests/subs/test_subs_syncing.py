@@ -264,7 +264,7 @@ class TestSyncVideoSubtitles:
         vid.write_text("x")
         _sync_video_subtitles(str(vid))
 
-    @patch("plex_organizer.subs.syncing.shutil_which", return_value=None)
+    @patch("plex_organizer.subs.syncing.which_cached", return_value=None)
     @patch("plex_organizer.subs.syncing.get_ffmpeg", return_value="/ff")
     def test_no_ffsubsync(self, _ff, _which, tmp_path):
         """Returns early when ffsubsync is not installed."""
@@ -275,7 +275,7 @@ class TestSyncVideoSubtitles:
     @patch("plex_organizer.subs.syncing.log_debug")
     @patch("plex_organizer.subs.syncing._get_sub_stream_metadata", return_value=[])
     @patch(
-        "plex_organizer.subs.syncing.shutil_which", return_value="/usr/bin/ffsubsync"
+        "plex_organizer.subs.syncing.which_cached", return_value="/usr/bin/ffsubsync"
     )
     @patch("plex_organizer.subs.syncing.get_ffmpeg", return_value="/ff")
     def test_no_text_streams(self, _ff, _which, _meta, mock_log, tmp_path):
@@ -304,7 +304,7 @@ class TestSyncVideoSubtitles:
         ],
     )
     @patch(
-        "plex_organizer.subs.syncing.shutil_which", return_value="/usr/bin/ffsubsync"
+        "plex_organizer.subs.syncing.which_cached", return_value="/usr/bin/ffsubsync"
     )
     @patch("plex_organizer.subs.syncing.get_ffmpeg", return_value="/ff")
     def test_all_already_synced(
@@ -336,7 +336,7 @@ class TestSyncVideoSubtitles:
         ],
     )
     @patch(
-        "plex_organizer.subs.syncing.shutil_which", return_value="/usr/bin/ffsubsync"
+        "plex_organizer.subs.syncing.which_cached", return_value="/usr/bin/ffsubsync"
     )
     @patch("plex_organizer.subs.syncing.get_ffmpeg", return_value="/ff")
     def test_remuxes_synced(
@@ -1,8 +1,11 @@
 """Tests for plex_organizer.config."""
 
+from unittest.mock import patch
+
 from pytest import mark
 
 from plex_organizer.config import (
+    _read_config,
     ensure_config_exists,
     get_analyze_embedded_subtitles,
     get_capitalize,
@@ -12,15 +15,19 @@ from plex_organizer.config import (
     get_enable_audio_tagging,
     get_enable_logging,
     get_enable_subtitle_embedding,
+    get_detection_languages,
     get_fetch_subtitles,
     get_host,
     get_include_quality,
     get_log_file,
     get_logging_level,
+    get_parallel_workers,
     get_qbittorrent_password,
     get_qbittorrent_username,
+    get_sample_max_size_mb,
     get_subtitle_providers,
     get_sync_subtitles,
+    get_tagging_workers,
     get_timestamped_log_files,
     get_whisper_model_size,
 )
@@ -112,6 +119,14 @@ class TestConfigGetters:  # pylint: disable=too-many-public-methods
         """Verify whisper_model_size defaults to tiny."""
         assert get_whisper_model_size() == "tiny"
 
+    def test_get_sample_max_size_mb_default(self):
+        """Verify sample_max_size_mb defaults to 300."""
+        assert get_sample_max_size_mb() == 300
+
+    def test_get_tagging_workers_default(self):
+        """Verify tagging_workers defaults to 0 (follow cpu_threads)."""
+        assert get_tagging_workers() == 0
+
     def test_get_enable_audio_tagging_default(self):
         """Verify enable_audio_tagging defaults to True."""
         assert get_enable_audio_tagging() is True
@@ -134,6 +149,14 @@ class TestConfigGetters:  # pylint: disable=too-many-public-methods
         assert isinstance(langs, list)
         assert "eng" in langs
 
+    def test_get_detection_languages_default(self):
+        """Verify detection_languages defaults to empty (built-in set)."""
+        assert get_detection_languages() == []
+
+    def test_get_parallel_workers_default(self):
+        """Verify parallel_workers defaults to 0 (follow cpu_threads)."""
+        assert get_parallel_workers() == 0
+
     def test_get_sync_subtitles_default(self):
         """Verify sync_subtitles defaults to True."""
         assert get_sync_subtitles() is True
@@ -178,3 +201,35 @@ class TestConfigGetters:  # pylint: disable=too-many-public-methods
         providers = get_subtitle_providers()
         assert isinstance(providers, list)
         assert len(providers) > 0
+
+
+@mark.usefixtures("default_config")
+class TestConfigCache:
+    """Tests for the cached config.ini load."""
+
+    def test_unchanged_file_parsed_once(self):
+        """Repeated getter calls reuse the parsed config."""
+        get_host()
+        with patch(
+            "plex_organizer.config._read_config", side_effect=_read_config
+        ) as mock_read:
+            get_cpu_threads()
+            get_host()
+        mock_read.assert_not_called()
+
+    def test_edits_are_picked_up(self, config_dir):
+        """Rewriting config.ini invalidates the cached parse."""
+        assert get_cpu_threads() == 2
+        config_file = config_dir / "config.ini"
+        content = config_file.read_text()
+        config_file.write_text(content.replace("cpu_threads = 2", "cpu_threads = 16"))
+        assert get_cpu_threads() == 16
+
+    def test_ensure_config_exists_does_not_mutate_cache(self, config_dir):
+        """Upgrading an old config re-reads the repaired file."""
+        config_file = config_dir / "config.ini"
+        config_file.write_text("[Settings]\ncpu_threads = 4\n")
+        assert get_cpu_threads() == 4
+        ensure_config_exists()
+        assert get_cpu_threads() == 4
+        assert get_host() == "http://localhost:8081"
@@ -1,17 +1,21 @@
 """Tests for plex_organizer.const."""
 
+from sys import intern
+
 from plex_organizer.const import (
     ASS_CODECS,
     EXT_FILTER,
+    EXT_FILTER_SET,
     INDEX_FILENAME,
     ISO639_1_TO_2,
-    MOVIE_CORRECT_NAME_RE,
+    NORMALIZE_LANG,
+    SUBTITLE_EXT_SET,
     SUBTITLE_EXTENSIONS,
     TEXT_SUB_CODECS,
+    TEXT_SUBTITLE_EXT_SET,
     TEXT_SUBTITLE_EXTENSIONS,
-    TV_CORRECT_NAME_RE,
-    TV_CORRECT_SEASON_RE,
     UNWANTED_FOLDERS,
+    VIDEO_EXT_SET,
     VIDEO_EXTENSIONS,
 )
 
@@ -27,6 +31,10 @@ class TestVideoExtensions:
         """Verify .mp4 is a recognized video extension."""
         assert ".mp4" in VIDEO_EXTENSIONS
 
+    def test_set_matches_tuple(self):
+        """VIDEO_EXT_SET holds the same extensions as VIDEO_EXTENSIONS."""
+        assert VIDEO_EXT_SET == frozenset(VIDEO_EXTENSIONS)
+
 
 class TestExtFilter:
     """Tests for EXT_FILTER constant."""
@@ -44,6 +52,10 @@ class TestExtFilter:
         """Verify organizer index extension is preserved."""
         assert ".index" in EXT_FILTER
 
+    def test_set_is_lowercase(self):
+        """EXT_FILTER_SET holds every filter extension in lowercase."""
+        assert EXT_FILTER_SET == {".mkv", ".mp4", ".!qb", ".index"}
+
 
 class TestSubtitleExtensions:
     """Tests for subtitle extension constants."""
@@ -59,6 +71,11 @@ class TestSubtitleExtensions:
         assert ".ass" in TEXT_SUBTITLE_EXTENSIONS
         assert ".sub" in SUBTITLE_EXTENSIONS
 
+    def test_sets_match_tuples(self):
+        """The frozensets hold the same extensions as the tuples."""
+        assert SUBTITLE_EXT_SET == frozenset(SUBTITLE_EXTENSIONS)
+        assert TEXT_SUBTITLE_EXT_SET == frozenset(TEXT_SUBTITLE_EXTENSIONS)
+
 
 class TestUnwantedFolders:
     """Tests for UNWANTED_FOLDERS constant."""
@@ -87,6 +104,12 @@ class TestISO639Mapping:
         """Verify Spanish maps to spa."""
         assert ISO639_1_TO_2["es"] == "spa"
 
+    def test_codes_are_interned(self):
+        """Verify keys and values are interned strings."""
+        for short, long in ISO639_1_TO_2.items():
+            assert intern(short) is short
+            assert intern(long) is long
+
     def test_french(self):
         """Verify French maps to fra."""
         assert ISO639_1_TO_2["fr"] == "fra"
@@ -96,62 +119,18 @@ class TestISO639Mapping:
         assert ISO639_1_TO_2["de"] == "deu"
 
 
-class TestMovieCorrectNameRegex:
-    """Tests for MOVIE_CORRECT_NAME_RE pattern."""
-
-    def test_matches_standard_movie(self):
-        """Verify regex matches a correctly formatted movie name."""
-        assert MOVIE_CORRECT_NAME_RE.match("Inception (2010).mkv")
-
-    def test_matches_with_quality(self):
-        """Verify regex matches a movie name with quality tag."""
-        assert MOVIE_CORRECT_NAME_RE.match("Inception (2010) 1080p.mkv")
-
-    def test_rejects_raw_torrent_name(self):
-        """Verify regex rejects an unprocessed torrent filename."""
-        assert not MOVIE_CORRECT_NAME_RE.match(
-            "Inception.2010.1080p.BluRay.x264-GROUP.mkv"
-        )
-
-    def test_rejects_missing_year(self):
-        """Verify regex rejects a filename without a year."""
-        assert not MOVIE_CORRECT_NAME_RE.match("Inception.mkv")
-
-
-class TestTVCorrectNameRegex:
-    """Tests for TV_CORRECT_NAME_RE pattern."""
-
-    def test_matches_standard_episode(self):
-        """Verify regex matches a correctly formatted TV episode name."""
-        m = TV_CORRECT_NAME_RE.match("Breaking Bad S01E01.mkv")
-        assert m
-        assert m.group(1) == "01"
-        assert m.group(2) == "01"
-
-    def test_matches_with_quality(self):
-        """Verify regex matches a TV episode name with quality tag."""
-        assert TV_CORRECT_NAME_RE.match("Breaking Bad S01E01 1080p.mkv")
-
-    def test_rejects_raw_torrent_name(self):
-        """Verify regex rejects an unprocessed TV torrent filename."""
-        assert not TV_CORRECT_NAME_RE.match(
-            "Breaking.Bad.S01E01.1080p.WEBRip.x265-RARBG.mkv"
-        )
-
-
-class TestTVCorrectSeasonRegex:
-    """Tests for TV_CORRECT_SEASON_RE pattern."""
+class TestNormalizeLang:
+    """Tests for the NORMALIZE_LANG lookup table."""
 
-    def test_matches_season_folder(self):
-        """Verify regex matches a correctly formatted season folder."""
-        m = TV_CORRECT_SEASON_RE.match("Season 1")
-        assert m
-        assert m.group(1) == "1"
+    def test_two_and_three_letter_codes(self):
+        """Both ISO 639-1 and ISO 639-2 codes map to ISO 639-2."""
+        assert NORMALIZE_LANG["en"] == "eng"
+        assert NORMALIZE_LANG["eng"] == "eng"
 
-    def test_rejects_wrong_format(self):
-        """Verify regex rejects incorrectly formatted season folders."""
-        assert not TV_CORRECT_SEASON_RE.match("S01")
-        assert not TV_CORRECT_SEASON_RE.match("Season1")
+    def test_undetermined_maps_to_none(self):
+        """Undetermined tags normalize to None."""
+        assert NORMALIZE_LANG["und"] is None
+        assert NORMALIZE_LANG["unknown"] is None
 
 
 class TestTextSubCodecs:
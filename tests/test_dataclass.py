@@ -2,6 +2,8 @@
 
 # pylint: disable=duplicate-code
 
+from dataclasses import asdict
+
 from pytest import raises
 
 from plex_organizer.dataclass import (
@@ -79,9 +81,14 @@ class TestIndexEntry:
     def test_dict_conversion(self):
         """Verify IndexEntry converts to a dict correctly."""
         entry = IndexEntry(processed_at="2025-01-01T00:00:00+00:00")
-        d = entry.__dict__
+        d = asdict(entry)
         assert d == {"processed_at": "2025-01-01T00:00:00+00:00"}
 
+    def test_has_no_instance_dict(self):
+        """Verify IndexEntry uses __slots__ instead of a per-instance dict."""
+        entry = IndexEntry(processed_at="2025-01-01T00:00:00+00:00")
+        assert not hasattr(entry, "__dict__")
+
 
 class TestIndexSummary:  # pylint: disable=too-few-public-methods
     """Tests for the IndexSummary dataclass."""
@@ -15,12 +15,14 @@ from plex_organizer.ffmpeg_utils import (
     get_ffprobe,
     probe_duration_seconds,
     probe_json,
+    probe_streams_and_duration,
     probe_streams_json,
     probe_subtitle_languages,
     probe_subtitle_stream_count,
     probe_video_quality,
     replace_and_restore_timestamps,
     run_cmd,
+    which_cached,
 )
 
 
@@ -45,6 +47,30 @@ class TestBinaryResolution:
         assert get_ffprobe() == "/usr/bin/ffprobe"
 
 
+class TestWhichCached:
+    """Tests for which_cached."""
+
+    def setup_method(self):
+        """Start each test with an empty cache."""
+        which_cached.cache_clear()
+
+    def teardown_method(self):
+        """Do not leak patched results into other tests."""
+        which_cached.cache_clear()
+
+    @patch("plex_organizer.ffmpeg_utils.shutil_which", return_value="/usr/bin/tool")
+    def test_path_searched_once(self, mock_which):
+        """Repeated lookups of the same executable hit the cache."""
+        assert which_cached("tool") == "/usr/bin/tool"
+        assert which_cached("tool") == "/usr/bin/tool"
+        mock_which.assert_called_once_with("tool")
+
+    @patch("plex_organizer.ffmpeg_utils.shutil_which", return_value=None)
+    def test_missing_tool(self, _which):
+        """Missing executables resolve to None."""
+        assert which_cached("nope") is None
+
+
 class TestRunCmd:
     """Tests for run_cmd subprocess wrapper."""
 
@@ -144,6 +170,32 @@ class TestProbeStreamsJson:
         assert probe_streams_json("/video.mkv") == []
 
 
+@mark.usefixtures("default_config")
+class TestProbeStreamsAndDuration:
+    """Tests for probe_streams_and_duration."""
+
+    @patch("plex_organizer.ffmpeg_utils.probe_json")
+    def test_single_probe_returns_both(self, mock_probe):
+        """Streams and duration come from one ffprobe invocation."""
+        mock_probe.return_value = {
+            "streams": [{"index": 1, "codec_name": "aac"}, "bad"],
+            "format": {"duration": "5400.0"},
+        }
+        streams, duration = probe_streams_and_duration("/v.mkv", "a")
+        assert streams == [{"index": 1, "codec_name": "aac"}]
+        assert duration == approx(5400.0)
+        mock_probe.assert_called_once()
+        args = mock_probe.call_args[0][1]
+        assert "-show_streams" in args
+        assert "format=duration" in args
+        assert args[args.index("-probesize") + 1] == "1M"
+
+    @patch("plex_organizer.ffmpeg_utils.probe_json", return_value={})
+    def test_returns_empty_on_failure(self, _mock):
+        """Returns no streams and no duration when ffprobe fails."""
+        assert probe_streams_and_duration("/v.mkv") == ([], None)
+
+
 @mark.usefixtures("default_config")
 class TestProbeSubtitleLanguages:
     """Tests for probe_subtitle_languages."""
@@ -386,7 +438,7 @@ class TestProbeVideoQuality:
         assert probe_video_quality("/v.mkv") is None
 
 
-class TestReplaceAndRestoreTimestamps:  # pylint: disable=too-few-public-methods
+class TestReplaceAndRestoreTimestamps:
     """Tests for replace_and_restore_timestamps."""
 
     def test_replaces_file_and_restores_mtime(self, tmp_path):
@@ -403,3 +455,18 @@ class TestReplaceAndRestoreTimestamps:  # pylint: disable=too-few-public-methods
         assert orig.read_text() == "replaced"
         assert not tmp_file.exists()
         assert orig.stat().st_mtime == 2000000
+
+    def test_uses_prefetched_stat(self, tmp_path):
+        """Timestamps come from the caller's stat result when provided."""
+        orig = tmp_path / "video.mkv"
+        orig.write_text("original")
+        utime(str(orig), (1000000, 2000000))
+        st = orig.stat()
+        utime(str(orig), (5000000, 5000000))
+
+        tmp_file = tmp_path / "tmp.mkv"
+        tmp_file.write_text("replaced")
+
+        replace_and_restore_timestamps(str(tmp_file), str(orig), st)
+
+        assert orig.stat().st_mtime == 2000000
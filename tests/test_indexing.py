@@ -1,16 +1,24 @@
 """Tests for plex_organizer.indexing."""
 
+from json import loads as json_loads
+from re import compile as re_compile
 from unittest.mock import patch
 from pytest import mark
 
 from plex_organizer.const import INDEX_FILENAME
 from plex_organizer.indexing import (
     _is_indexed,
+    _library_root,
+    _match_movie,
+    _match_season,
+    _match_tv,
     _read_index,
+    _rel_key,
     _write_index,
     collect_indexed_videos,
     index_root_for_path,
     mark_indexed,
+    mark_indexed_bulk,
     migrate_show_indexes_to_tv_root,
     prune_index,
     should_index_video,
@@ -34,6 +42,14 @@ class TestReadWriteIndex:
         result = _read_index(str(idx_path))
         assert result == payload
 
+    def test_written_file_is_sorted_indented_json(self, tmp_path):
+        """The on-disk format stays sorted, two-space indented JSON."""
+        idx_path = tmp_path / INDEX_FILENAME
+        _write_index(str(idx_path), {"files": {"b.mkv": {}, "a.mkv": {}}})
+        text = idx_path.read_text(encoding="utf-8")
+        assert text.startswith('{\n  "files": {\n    "a.mkv"')
+        assert json_loads(text) == {"files": {"a.mkv": {}, "b.mkv": {}}}
+
     def test_read_missing_file(self, tmp_path):
         """Reading a non-existent file returns empty index."""
         result = _read_index(str(tmp_path / "nonexistent.index"))
@@ -75,6 +91,36 @@ class TestReadWriteIndex:
         assert result == {"files": {}}
 
 
+class TestIndexCache:
+    """Tests for the memoized index reads."""
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        """Repeated reads of an unchanged index reuse the parsed payload."""
+        idx_path = str(tmp_path / INDEX_FILENAME)
+        _write_index(idx_path, {"files": {"a.mkv": {}}})
+        with patch("plex_organizer.indexing.json_loads", wraps=json_loads) as mock_load:
+            _read_index(idx_path)
+            _read_index(idx_path)
+            _is_indexed(str(tmp_path), str(tmp_path / "a.mkv"))
+        assert mock_load.call_count == 1
+
+    def test_external_change_is_picked_up(self, tmp_path):
+        """A file rewritten outside _write_index is parsed again."""
+        idx_path = tmp_path / INDEX_FILENAME
+        _write_index(str(idx_path), {"files": {"a.mkv": {}}})
+        assert _read_index(str(idx_path)) == {"files": {"a.mkv": {}}}
+
+        idx_path.write_text('{"files": {"bb.mkv": {}}}')
+        assert _read_index(str(idx_path)) == {"files": {"bb.mkv": {}}}
+
+    def test_mutating_result_does_not_touch_cache(self, tmp_path):
+        """Callers may mutate the returned payload freely."""
+        idx_path = str(tmp_path / INDEX_FILENAME)
+        _write_index(idx_path, {"files": {"a.mkv": {}}})
+        _read_index(idx_path)["files"]["b.mkv"] = {}
+        assert _read_index(idx_path) == {"files": {"a.mkv": {}}}
+
+
 class TestMarkIndexed:
     """Tests for mark_indexed persistence."""
 
@@ -96,6 +142,28 @@ class TestMarkIndexed:
         assert _is_indexed(index_root, f2)
 
 
+class TestMarkIndexedBulk:
+    """Tests for mark_indexed_bulk."""
+
+    def test_marks_all_files_with_one_write(self, tmp_path):
+        """Every path is recorded and the index is written once."""
+        index_root = str(tmp_path)
+        paths = [
+            str(tmp_path / "A (2020)" / f"A (2020) {q}.mkv") for q in ("480p", "720p")
+        ]
+        with patch(
+            "plex_organizer.indexing._write_index", wraps=_write_index
+        ) as mock_write:
+            mark_indexed_bulk(index_root, paths)
+        assert mock_write.call_count == 1
+        assert all(_is_indexed(index_root, p) for p in paths)
+
+    def test_empty_batch_does_not_write(self, tmp_path):
+        """No index file is created when there is nothing to record."""
+        mark_indexed_bulk(str(tmp_path), [])
+        assert not (tmp_path / INDEX_FILENAME).exists()
+
+
 class TestIsIndexed:  # pylint: disable=too-few-public-methods
     """Tests for _is_indexed checks."""
 
@@ -104,6 +172,95 @@ class TestIsIndexed:  # pylint: disable=too-few-public-methods
         assert not _is_indexed(str(tmp_path), str(tmp_path / "file.mkv"))
 
 
+LAYOUT_NAMES = [
+    "Inception.2010.1080p.BluRay.x264-GROUP.mkv",
+    "Breaking.Bad.S01E01.1080p.WEBRip.x265-RARBG.mkv",
+    "Inception.mkv",
+    "Inception (2010).mkv",
+    "Inception (2010) 1080p.mkv",
+    "Inception (2010) 720p.mp4",
+    "Inception (2010) 10800p.mkv",
+    "Inception (2010) 80p.mkv",
+    "Inception(2010).mkv",
+    "Inception (201).mkv",
+    "Inception (20100).mkv",
+    " (2010).mkv",
+    "X (2010).mkv",
+    "Inception (2010)",
+    "Inception (2010).",
+    "Inception (2010).m-v",
+    "Inception (2010).my_ext",
+    "Inception (2010) 1080p 720p.mkv",
+    "Show S01E02.mkv",
+    "Show S01E02 2160p.mkv",
+    "Show S1E02.mkv",
+    "Show S01E2.mkv",
+    "Show S01E02E03.mkv",
+    "ShowS01E02.mkv",
+    " S01E02.mkv",
+    "Show S01E02 1080.mkv",
+    "Show (2020) S03E04.mkv",
+    "Show S01E02 (2010).mkv",
+]
+
+
+# Reference patterns the hand-written layout matchers must agree with.
+MOVIE_CORRECT_NAME_RE = re_compile(r"^.+ \(\d{4}\)(?: \d{3,4}p)?\.[\w]+$")
+TV_CORRECT_NAME_RE = re_compile(r"^.+ S(\d{2})E(\d{2})(?: \d{3,4}p)?\.[\w]+$")
+TV_CORRECT_SEASON_RE = re_compile(r"^Season (\d+)$")
+
+
+class TestLayoutMatchers:
+    """Tests for the hand-written layout matchers."""
+
+    @mark.parametrize("name", LAYOUT_NAMES)
+    def test_movie_matches_regex(self, name):
+        """_match_movie agrees with MOVIE_CORRECT_NAME_RE."""
+        matched = _match_movie(name) is not None
+        assert matched == bool(MOVIE_CORRECT_NAME_RE.match(name))
+
+    def test_movie_returns_folder_title(self):
+        """_match_movie returns the stem without extension or quality."""
+        assert _match_movie("Inception (2010) 1080p.mkv") == "Inception (2010)"
+
+    @mark.parametrize("name", LAYOUT_NAMES)
+    def test_tv_matches_regex(self, name):
+        """_match_tv returns the same season as TV_CORRECT_NAME_RE."""
+        match = TV_CORRECT_NAME_RE.match(name)
+        assert _match_tv(name) == (match.group(1) if match else None)
+
+    @mark.parametrize(
+        "name", ["Season 1", "Season 01", "Season ", "Season x", "season 1", "S 1"]
+    )
+    def test_season_matches_regex(self, name):
+        """_match_season returns the same number as TV_CORRECT_SEASON_RE."""
+        match = TV_CORRECT_SEASON_RE.match(name)
+        assert _match_season(name) == (match.group(1) if match else None)
+
+
+class TestRelKey:  # pylint: disable=too-few-public-methods
+    """Tests for _rel_key."""
+
+    def test_key_is_normalized(self):
+        """Redundant separators and dot segments do not leak into keys."""
+        assert _rel_key("/media/tv/", "/media/tv/./Show//Season 1/x.mkv") == (
+            "Show/Season 1/x.mkv"
+        )
+
+
+class TestLibraryRoot:
+    """Tests for _library_root."""
+
+    def test_library_roots_are_normalized(self):
+        """TV and movie roots are returned normalized."""
+        assert _library_root("/media/tv/") == "/media/tv"
+        assert _library_root("/media/movies") == "/media/movies"
+
+    def test_nested_folder_is_not_a_root(self):
+        """A folder below the library root is rejected."""
+        assert _library_root("/media/movies/Film (2020)") is None
+
+
 @mark.usefixtures("default_config")
 class TestShouldIndexVideo:
     """Tests for should_index_video layout validation."""
@@ -266,6 +423,16 @@ class TestCollectIndexedVideos:
         for val in result.values():
             assert val is False
 
+    def test_uses_given_tree_listing(self, tmp_path):
+        """A pre-built listing is used instead of walking the directory."""
+        movies_dir = tmp_path / "movies"
+        with patch("plex_organizer.indexing.iter_tree") as mock_walk:
+            result = collect_indexed_videos(
+                str(movies_dir), [(str(movies_dir), ["a.mkv", "a.srt"])]
+            )
+        mock_walk.assert_not_called()
+        assert result == {str(movies_dir / "a.mkv"): False}
+
 
 class TestIndexRootForPath:
     """Tests for index_root_for_path resolution."""
@@ -461,4 +628,4 @@ class TestPruneIndex:
         assert removed == 2
 
         result = _read_index(str(index_root / INDEX_FILENAME))
-        assert result["files"] == {}
+        assert not result["files"]
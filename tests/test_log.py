@@ -2,7 +2,14 @@
 
 from unittest.mock import patch
 
-from plex_organizer.log import check_clear_log, log_debug, log_duplicate, log_error
+from plex_organizer.log import (
+    check_clear_log,
+    close_log,
+    log_debug,
+    log_duplicate,
+    log_error,
+    reload_config,
+)
 
 
 class TestLogFunctions:
@@ -37,6 +44,7 @@ class TestLogFunctions:
     def test_log_debug_when_debug_enabled(self, default_config):
         """log_debug writes when logging level is DEBUG."""
         with patch("plex_organizer.log.get_logging_level", return_value="DEBUG"):
+            reload_config()
             log_debug("visible debug")
         log_file = default_config / "plex-organizer.log"
         content = log_file.read_text()
@@ -45,6 +53,7 @@ class TestLogFunctions:
     def test_logging_disabled(self, default_config):
         """No log entry is written when logging is disabled."""
         with patch("plex_organizer.log.get_enable_logging", return_value=False):
+            reload_config()
             log_error("should not appear")
         log_file = default_config / "plex-organizer.log"
         if log_file.exists():
@@ -54,6 +63,7 @@ class TestLogFunctions:
     def test_timestamped_log_creates_log_dir(self, default_config):
         """Timestamped logging creates a logs/ subdirectory and writes there."""
         with patch("plex_organizer.log.get_timestamped_log_files", return_value=True):
+            reload_config()
             log_error("timestamped entry")
         logs_dir = default_config / "logs"
         assert logs_dir.exists()
@@ -63,6 +73,54 @@ class TestLogFunctions:
         assert "timestamped entry" in content
 
 
+class TestPersistentHandle:
+    """Tests for the reused log file handle."""
+
+    def test_file_is_opened_once(self, default_config):
+        """Consecutive messages reuse the open log file."""
+        close_log()
+        with patch("plex_organizer.log.open", wraps=open) as mock_open:
+            log_error("first")
+            log_error("second")
+        assert mock_open.call_count == 1
+        content = (default_config / "plex-organizer.log").read_text()
+        assert "first" in content and "second" in content
+
+    def test_timestamped_run_writes_one_file(self, default_config):
+        """All messages of a run go to the same timestamped log file."""
+        close_log()
+        with patch("plex_organizer.log.get_timestamped_log_files", return_value=True):
+            reload_config()
+            log_error("one")
+            log_error("two")
+        log_files = list((default_config / "logs").glob("plex-organizer.*.log"))
+        assert len(log_files) == 1
+        assert "two" in log_files[0].read_text()
+
+    def test_close_log_reopens_on_next_message(self, default_config):
+        """Messages after close_log are still written."""
+        log_error("before close")
+        close_log()
+        log_error("after close")
+        content = (default_config / "plex-organizer.log").read_text()
+        assert "before close" in content and "after close" in content
+
+
+class TestSettingsSnapshot:  # pylint: disable=too-few-public-methods
+    """Tests for the cached logging settings."""
+
+    def test_settings_are_read_once(self, default_config):
+        """Config getters are not consulted again until reload_config."""
+        log_error("warm up")
+        with patch("plex_organizer.log.get_enable_logging", return_value=False):
+            log_error("still logged")
+            reload_config()
+            log_error("not logged")
+        content = (default_config / "plex-organizer.log").read_text()
+        assert "still logged" in content
+        assert "not logged" not in content
+
+
 class TestCheckClearLog:
     """Tests for check_clear_log behaviour."""
 
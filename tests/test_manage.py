@@ -1,6 +1,7 @@
 """Tests for plex_organizer.manage."""
 
 from json import dumps
+from os.path import join
 from time import sleep
 from unittest.mock import patch
 from configparser import ConfigParser
@@ -55,6 +56,7 @@ from plex_organizer.const import INDEX_FILENAME
 from plex_organizer.dataclass import IndexSummary
 from plex_organizer.indexing import _read_index, _write_index
 from plex_organizer import config
+from plex_organizer.config import _load_config
 
 
 @mark.usefixtures("default_config")
@@ -445,6 +447,15 @@ class TestMigrateConfig:
         added = migrate_config(str(old_ini))
         assert added == 3
 
+    @mark.usefixtures("config_dir")
+    def test_drops_config_cache(self, tmp_path):
+        """The parsed config cache is dropped so getters read the new file."""
+        old_ini = tmp_path / "old_config.ini"
+        old_ini.write_text("[qBittorrent]\nhost = http://myhost:9090\n")
+        with patch.object(_load_config, "cache_clear") as mock_clear:
+            migrate_config(str(old_ini))
+        mock_clear.assert_called_once_with()
+
     @mark.usefixtures("config_dir")
     def test_raises_file_not_found(self):
         """FileNotFoundError is raised for a nonexistent config path."""
@@ -852,16 +863,12 @@ class TestRunStepsMainFolder:
     @patch("plex_organizer.manage.merge_subtitles_in_directory")
     @patch("plex_organizer.manage.fetch_subtitles_in_directory")
     @patch("plex_organizer.manage.sync_subtitles_in_directory")
-    @patch("plex_organizer.manage.analyze_video_languages")
-    @patch("plex_organizer.manage.delete_unwanted_files")
-    @patch("plex_organizer.manage.move_directories")
+    @patch("plex_organizer.manage.process_root")
     @patch("plex_organizer.manage.delete_empty_directories")
     def test_full_pipeline_expands_main_folder(
         self,
         _mock_del_empty,
-        _mock_move,
-        _mock_del_unwanted,
-        _mock_analyze,
+        _mock_process_root,
         _mock_sync,
         _mock_fetch,
         mock_embed,
@@ -876,6 +883,29 @@ class TestRunStepsMainFolder:
         assert str(d / "tv") in called_dirs
         assert str(d / "movies") in called_dirs
 
+    @patch("plex_organizer.manage.clear_stat_cache")
+    @patch("plex_organizer.manage.merge_subtitles_in_directory")
+    @patch("plex_organizer.manage.fetch_subtitles_in_directory")
+    @patch("plex_organizer.manage.sync_subtitles_in_directory")
+    @patch("plex_organizer.manage.process_root")
+    @patch("plex_organizer.manage.delete_empty_directories")
+    def test_full_pipeline_clears_stat_cache_per_directory(
+        self,
+        _mock_del_empty,
+        _mock_process_root,
+        _mock_sync,
+        _mock_fetch,
+        _mock_embed,
+        mock_clear,
+        tmp_path,
+    ):
+        """Each expanded directory starts with a fresh stat cache."""
+        d = self._make_main_folder(tmp_path)
+        inputs = iter(["", "", "y", "y", "2", "y", "y", "n"])
+        _run_full_pipeline(str(d), input_fn=lambda _: next(inputs))
+
+        assert mock_clear.call_count == 2
+
     @patch("plex_organizer.manage.merge_subtitles_in_directory")
     def test_embed_subs_expands_main_folder(self, mock_embed, tmp_path):
         """Embed subs processes tv and movies subdirectories separately."""
@@ -953,6 +983,18 @@ class TestRunStepsMainFolder:
             for cd in called_dirs
         )
 
+    @patch("plex_organizer.manage.clear_stat_cache")
+    @patch("plex_organizer.manage.move_directories")
+    def test_rename_move_clears_stat_cache_per_directory(
+        self, _mock_move, mock_clear, tmp_path
+    ):
+        """Each expanded directory starts with a fresh stat cache."""
+        d = self._make_main_folder(tmp_path)
+        inputs = iter(["y", "y", "n"])
+        _run_rename_move(str(d), input_fn=lambda _: next(inputs))
+
+        assert mock_clear.call_count == 2
+
     @patch("plex_organizer.manage.delete_empty_directories")
     def test_delete_empty_expands_main_folder(self, mock_del, tmp_path):
         """Delete empty processes tv and movies subdirectories separately."""
@@ -1142,6 +1184,13 @@ class TestActionEditConfig:
         expected = "false" if old_val.lower() == "true" else "true"
         assert new_val == expected
 
+    def test_save_drops_config_cache(self):
+        """Saving an option drops the parsed config cache for the getters."""
+        inputs = iter(["4", "q"])
+        with patch.object(_load_config, "cache_clear") as mock_clear:
+            _action_edit_config(input_fn=lambda _: next(inputs))
+        mock_clear.assert_called_once_with()
+
     def test_edit_string_value(self, capsys):
         """Editing a string option saves the new value."""
         call_count = 0
@@ -1502,6 +1551,10 @@ class TestIsVideoCandidate:
         """MKV file is a video candidate."""
         assert _is_video_candidate("movie.mkv") is True
 
+    def test_extension_case_ignored(self):
+        """Upper-case video extensions are accepted."""
+        assert _is_video_candidate("movie.MP4") is True
+
     def test_non_video_rejected(self):
         """SRT file is not a video candidate."""
         assert _is_video_candidate("sub.srt") is False
@@ -1530,18 +1583,19 @@ class TestSafeWrappers:
         """Returns False when should_index_video raises OSError."""
         assert _safe_should_index_video("/root", "/root/v.mkv") is False
 
-    @patch("plex_organizer.manage.mark_indexed")
-    def test_safe_mark_returns_true(self, _mock):
-        """Returns True when mark_indexed succeeds."""
-        assert _safe_mark_indexed("/root", "/root/v.mkv") is True
+    @patch("plex_organizer.manage.mark_indexed_bulk")
+    def test_safe_mark_returns_true(self, mock_mark):
+        """Returns True when mark_indexed_bulk succeeds."""
+        assert _safe_mark_indexed("/root", ["/root/v.mkv"]) is True
+        mock_mark.assert_called_once_with("/root", ["/root/v.mkv"], None)
 
     @patch(
-        "plex_organizer.manage.mark_indexed",
+        "plex_organizer.manage.mark_indexed_bulk",
         side_effect=OSError,
     )
     def test_safe_mark_returns_false_on_error(self, _mock):
-        """Returns False when mark_indexed raises OSError."""
-        assert _safe_mark_indexed("/root", "/root/v.mkv") is False
+        """Returns False when mark_indexed_bulk raises OSError."""
+        assert _safe_mark_indexed("/root", ["/root/v.mkv"]) is False
 
 
 class TestGetOrLoadIndexKeys:
@@ -1592,6 +1646,30 @@ class TestScanAndIndexRoot:
         assert result.eligible_videos == 1
         assert result.newly_indexed == 1
 
+    @patch(
+        "plex_organizer.manage._safe_mark_indexed",
+        return_value=True,
+    )
+    @patch(
+        "plex_organizer.manage._safe_should_index_video",
+        return_value=True,
+    )
+    @patch(
+        "plex_organizer.manage.index_root_for_path",
+        return_value="/media/movies",
+    )
+    def test_marks_all_videos_in_one_call(self, _ir, _si, mock_mark):
+        """All new videos in a directory are written with a single index update."""
+        cache = {"/media/movies": set()}
+        result = _scan_and_index_root(
+            "/media/movies", "/media/movies", ["a.mkv", "b.mp4"], cache
+        )
+        assert result.newly_indexed == 2
+        assert cache["/media/movies"] == {"a.mkv", "b.mp4"}
+        mock_mark.assert_called_once_with(
+            "/media/movies", ["/media/movies/a.mkv", "/media/movies/b.mp4"], None
+        )
+
     @patch(
         "plex_organizer.manage.index_root_for_path",
         return_value="/media/movies",
@@ -1666,7 +1744,7 @@ class TestScanAndIndexRoot:
 
 
 @mark.usefixtures("default_config")
-class TestScanAndIndexDirectory:  # pylint: disable=too-few-public-methods
+class TestScanAndIndexDirectory:
     """Tests for _scan_and_index_directory."""
 
     @patch(
@@ -1674,14 +1752,30 @@ class TestScanAndIndexDirectory:  # pylint: disable=too-few-public-methods
         return_value=IndexSummary(2, 1, 1),
     )
     @patch(
-        "plex_organizer.manage.walk",
-        return_value=[("/media/movies", [], ["a.mkv", "b.mkv"])],
+        "plex_organizer.manage.iter_tree",
+        return_value=[("/media/movies", ["a.mkv", "b.mkv"])],
     )
     def test_aggregates_walk_results(self, _walk, _scan):
         """Summary is accumulated from walk iterations."""
         result = _scan_and_index_directory("/media/movies", {})
         assert result.total_videos == 2
 
+    def test_concurrent_folders_share_one_index(self, tmp_path):
+        """Folders scanned in parallel all land in the same index file."""
+        movies = tmp_path / "movies"
+        names = [f"Film {n} (20{n:02d})" for n in range(12)]
+        for name in names:
+            (movies / name).mkdir(parents=True)
+            (movies / name / f"{name}.mkv").write_text("x")
+
+        result = _scan_and_index_directory(str(movies), {})
+
+        assert result.newly_indexed == len(names)
+        index = _read_index(str(movies / INDEX_FILENAME))
+        assert set(index["files"]) == {join(n, f"{n}.mkv") for n in names}
+        stamps = {entry["processed_at"] for entry in index["files"].values()}
+        assert len(stamps) == 1
+
 
 @mark.usefixtures("default_config")
 class TestGenerateIndexes:
@@ -6,7 +6,14 @@ from pathlib import Path
 from unittest.mock import patch
 from pytest import mark, param
 
-from plex_organizer.movie import _create_name, move
+from plex_organizer.movie import (
+    _MOVIE_NAME_RE,
+    _create_name,
+    _parse_final_name,
+    _parse_name,
+    _split_dotted_name,
+    move,
+)
 
 
 @mark.usefixtures("default_config")
@@ -144,6 +151,77 @@ class TestCreateName:
             assert result.endswith(".mkv")
 
 
+class TestParseFinalName:
+    """Tests for the already-renamed fast path."""
+
+    @mark.parametrize(
+        "file",
+        [
+            "Inception (2010).mkv",
+            "Inception (2010) 1080p.mkv",
+            "Mr. Smith (2005) 720p.mp4",
+            "Movie (Director's Cut) (2005).mkv",
+            "the matrix (1999).mkv",
+        ],
+    )
+    def test_agrees_with_pattern(self, file):
+        """Final-layout names parse exactly like the general pattern."""
+        parsed = _parse_final_name(file)
+        assert parsed is not None
+        assert parsed == _parse_name(file)
+
+    @mark.parametrize(
+        "file",
+        [
+            "Inception.2010.1080p.mkv",
+            "Blade Runner 2049 (2017).mkv",
+            "1917 (2019).mkv",
+            "Inception (2010) 10800p.mkv",
+            "Inception (2010)",
+        ],
+    )
+    def test_defers_to_pattern(self, file):
+        """Raw names or names with digits before the year use the pattern."""
+        assert _parse_final_name(file) is None
+
+
+class TestSplitDottedName:
+    """Tests for the hand-written release-name splitter."""
+
+    def test_splits_release_name(self):
+        """Prefix, years and the rest offset are returned."""
+        file = "Blade.Runner.2049.2017.1080p.mkv"
+        assert _split_dotted_name(file) == ("Blade.Runner", ["2049", "2017"], 23)
+
+    @mark.parametrize(
+        "file",
+        ["Inception (2010).mkv", "Some Movie 2010.mkv", "Movie.x2640.2010.mkv"],
+    )
+    def test_defers_to_pattern(self, file):
+        """Names the splitter cannot prove equivalent are left to the pattern."""
+        assert _split_dotted_name(file) is None
+
+    @mark.parametrize(
+        "file",
+        [
+            "Inception.2010.1080p.BluRay.x264-GROUP.mkv",
+            "2010.1080p.BluRay.mkv",
+            "Movie..2010..2011.x2641080p.mkv",
+            "Movie.2010",
+            "Movie.2010.BluRay.mkv",
+        ],
+    )
+    def test_agrees_with_pattern(self, file):
+        """Split names parse exactly like the general pattern would."""
+        match = _MOVIE_NAME_RE.match(file)
+        parsed = _parse_name(file)
+        if match is None:
+            assert parsed is None
+        else:
+            assert parsed is not None
+            assert parsed[2] == match.group(3)
+
+
 @mark.usefixtures("default_config")
 class TestCreateNameIdempotency:
     """Verify raw and already-renamed inputs produce identical output."""
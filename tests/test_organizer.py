@@ -1,7 +1,10 @@
 """Tests for plex_organizer.organizer helper functions."""
 
-from errno import EAGAIN
+from errno import EACCES, EAGAIN, EIO
+from fcntl import LOCK_EX, LOCK_NB
+from os.path import join
 from sys import modules
+from threading import Event
 from unittest.mock import patch
 from pytest import mark, raises
 
@@ -12,11 +15,14 @@ from plex_organizer.organizer import (
 )
 from plex_organizer.pipeline import (
     analyze_video_languages,
+    classify_files,
     _delete_unwanted_directories,
     delete_empty_directories,
+    delete_empty_subdirectories,
     delete_unwanted_files,
-    get_video_files_to_process,
     move_directories,
+    process_root,
+    walk_library,
 )
 
 
@@ -58,6 +64,48 @@ class TestDeleteUnwantedFiles:
         delete_unwanted_files(str(tmp_path), ["file.mkv.!qB"])
         assert (tmp_path / "file.mkv.!qB").exists()
 
+    def test_extension_filter_ignores_case(self, tmp_path):
+        """Upper-case video extensions are kept; upper-case samples are not."""
+        (tmp_path / "Movie.MKV").write_text("video")
+        (tmp_path / "SAMPLE.MP4").write_text("video")
+        delete_unwanted_files(str(tmp_path), ["Movie.MKV", "SAMPLE.MP4"])
+        assert (tmp_path / "Movie.MKV").exists()
+        assert not (tmp_path / "SAMPLE.MP4").exists()
+
+    def test_sample_token_matched_anywhere_in_name(self, tmp_path):
+        """Mixed-case sample tokens inside the name are still deleted."""
+        (tmp_path / "Movie.2020.SaMpLe.mkv").write_text("video")
+        delete_unwanted_files(str(tmp_path), ["Movie.2020.SaMpLe.mkv"])
+        assert not (tmp_path / "Movie.2020.SaMpLe.mkv").exists()
+
+    @patch("plex_organizer.pipeline.get_sample_max_size_mb", return_value=1)
+    def test_large_sample_named_file_is_kept(self, _limit, tmp_path):
+        """Sample-named files at or above sample_max_size_mb are kept."""
+        (tmp_path / "Sampler.mkv").write_bytes(b"x" * 1024 * 1024)
+        (tmp_path / "sample.mkv").write_bytes(b"x")
+        delete_unwanted_files(str(tmp_path), ["Sampler.mkv", "sample.mkv"])
+        assert (tmp_path / "Sampler.mkv").exists()
+        assert not (tmp_path / "sample.mkv").exists()
+
+    @patch("plex_organizer.pipeline.get_sample_max_size_mb", return_value=0)
+    @patch("plex_organizer.pipeline.getsize")
+    def test_zero_size_limit_skips_size_check(self, mock_size, _limit, tmp_path):
+        """A limit of 0 deletes sample-named files without reading their size."""
+        (tmp_path / "sample.mkv").write_text("video")
+        delete_unwanted_files(str(tmp_path), ["sample.mkv"])
+        assert not (tmp_path / "sample.mkv").exists()
+        mock_size.assert_not_called()
+
+    def test_stat_cache_invalidated_once(self, tmp_path):
+        """Deleted files are dropped from the stat cache in one call."""
+        (tmp_path / "a.txt").write_text("x")
+        (tmp_path / "b.nfo").write_text("x")
+        with patch("plex_organizer.pipeline.forget_paths") as mock_forget:
+            delete_unwanted_files(str(tmp_path), ["a.txt", "b.nfo"])
+        mock_forget.assert_called_once_with(
+            str(tmp_path / "a.txt"), str(tmp_path / "b.nfo")
+        )
+
     def test_preserves_script_temp_files(self, tmp_path):
         """Organizer temporary langtag files are preserved."""
         (tmp_path / "video.langtag.mkv").write_text("temp")
@@ -94,6 +142,35 @@ class TestDeleteUnwantedDirectories:
         _delete_unwanted_directories(str(tmp_path))
         assert season.exists()
 
+    def test_preserves_partial_name_matches(self, tmp_path):
+        """Folders that only contain an unwanted name are preserved."""
+        folder = tmp_path / "Subsequent Movie"
+        folder.mkdir()
+
+        _delete_unwanted_directories(str(tmp_path))
+        assert folder.exists()
+
+    def test_ignores_unwanted_names_above_root(self, tmp_path):
+        """Only the subfolder's own name counts, not its parent path."""
+        root = tmp_path / "Sample" / "movies"
+        movie = root / "Movie (2020)"
+        movie.mkdir(parents=True)
+
+        _delete_unwanted_directories(str(root))
+        assert movie.exists()
+
+    def test_preserves_files_with_unwanted_names(self, tmp_path):
+        """Only folders are removed; a file named like one is kept."""
+        (tmp_path / "Sample").write_text("x")
+        _delete_unwanted_directories(str(tmp_path))
+        assert (tmp_path / "Sample").exists()
+
+    @patch("plex_organizer.pipeline.log_error")
+    def test_missing_root_is_logged(self, mock_err, tmp_path):
+        """An unreadable root is logged and skipped."""
+        _delete_unwanted_directories(str(tmp_path / "missing"))
+        mock_err.assert_called_once()
+
 
 @mark.usefixtures("default_config")
 class TestDeleteEmptyDirectories:
@@ -120,30 +197,182 @@ class TestDeleteEmptyDirectories:
         delete_empty_directories(str(movies_dir))
         assert non_empty.exists()
 
+    @patch("plex_organizer.pipeline.scandir_walk")
+    def test_already_swept_skips_walk(self, mock_walk, tmp_path):
+        """A library root that was already swept is not walked again."""
+        movies_dir = tmp_path / "movies"
+        movies_dir.mkdir()
+        delete_empty_directories(str(movies_dir), already_swept=True)
+        mock_walk.assert_not_called()
+
+    def test_already_swept_still_cleans_library_root(self, tmp_path):
+        """A torrent folder below the library root still gets the full sweep."""
+        movies_dir = tmp_path / "movies"
+        torrent = movies_dir / "Movie.2020.1080p"
+        torrent.mkdir(parents=True)
+        delete_empty_directories(str(torrent), already_swept=True)
+        assert not torrent.exists()
+        assert movies_dir.exists()
+
+    @patch("plex_organizer.pipeline.scandir_walk")
+    def test_already_swept_only_removes_processed_branch(self, mock_walk, tmp_path):
+        """Empty parents below the library root go, unrelated folders stay."""
+        show = tmp_path / "tv" / "Show"
+        pack = show / "Pack" / "Disc 1"
+        pack.mkdir(parents=True)
+        other = show / "Season 2"
+        other.mkdir()
+
+        delete_empty_directories(str(pack), already_swept=True)
+
+        mock_walk.assert_not_called()
+        assert not (show / "Pack").exists()
+        assert other.exists()
+        assert show.exists()
+
+    def test_subdirectories_skips_missing(self, tmp_path):
+        """Folders already removed earlier in the walk are ignored."""
+        (tmp_path / "empty").mkdir()
+        delete_empty_subdirectories(str(tmp_path), ["gone", "empty"])
+        assert not (tmp_path / "empty").exists()
+
+    def test_subdirectories_only_call_rmdir(self, tmp_path):
+        """Folders are not listed before removal; non-empty ones survive rmdir."""
+        (tmp_path / "empty").mkdir()
+        (tmp_path / "full").mkdir()
+        (tmp_path / "full" / "v.mkv").write_text("x")
+        with patch("plex_organizer.utils.scandir") as mock_scandir:
+            delete_empty_subdirectories(str(tmp_path), ["empty", "full"])
+        mock_scandir.assert_not_called()
+        assert not (tmp_path / "empty").exists()
+        assert (tmp_path / "full").exists()
+
+    def test_subdirectories_keep_symlinked_folders(self, tmp_path):
+        """A symlink to an empty folder is neither followed nor removed."""
+        (tmp_path / "target").mkdir()
+        (tmp_path / "link").symlink_to(tmp_path / "target")
+        delete_empty_subdirectories(str(tmp_path), ["link"])
+        assert (tmp_path / "link").is_symlink()
+        assert (tmp_path / "target").exists()
+
+    def test_subdirectories_raise_other_errors(self, tmp_path):
+        """Unexpected rmdir errors are not swallowed."""
+        (tmp_path / "locked").mkdir()
+        with (
+            patch(
+                "plex_organizer.pipeline.rmdir",
+                side_effect=PermissionError(EACCES, "denied"),
+            ),
+            raises(PermissionError),
+        ):
+            delete_empty_subdirectories(str(tmp_path), ["locked"])
+
 
 @mark.usefixtures("default_config")
-class TestGetVideoFilesToProcess:
-    """Tests for _get_video_files_to_process filtering."""
-
-    def test_returns_only_video_files(self):
-        """Only files with video extensions are returned."""
-        files = ["video.mkv", "video.mp4", "readme.txt", "sub.srt"]
-        result = get_video_files_to_process("/media/movies", files, {})
-        assert sorted(result) == ["video.mkv", "video.mp4"]
-
-    def test_excludes_indexed_files(self):
-        """Already-indexed files are excluded."""
-        files = ["video1.mkv", "video2.mkv"]
-        indexed = {"/media/movies/video1.mkv": True}
-        result = get_video_files_to_process("/media/movies", files, indexed)
-        assert result == ["video2.mkv"]
-
-    def test_includes_non_indexed_files(self):
-        """Files marked as not indexed are included."""
-        files = ["video.mkv"]
-        indexed = {"/media/movies/video.mkv": False}
-        result = get_video_files_to_process("/media/movies", files, indexed)
-        assert result == ["video.mkv"]
+class TestClassifyFiles:
+    """Tests for classify_files single-pass sorting."""
+
+    def test_splits_videos_and_unwanted(self):
+        """Videos and unwanted files are sorted in one call."""
+        files = ["video.mkv", "readme.txt", "data.index", "sample.mkv"]
+        indexed = {"/media/movies/other.mkv"}
+        videos, unwanted = classify_files("/media/movies", files, indexed)
+        assert videos == ["video.mkv"]
+        assert unwanted == ["readme.txt", "sample.mkv"]
+
+    def test_skips_indexed_and_temp_files(self):
+        """Indexed videos and script temp files land in neither list."""
+        files = ["done.mkv", "v.langtag.mkv", "v.submerge.srt"]
+        indexed = {"/media/movies/done.mkv"}
+        assert classify_files("/media/movies", files, indexed) == ([], [])
+
+    def test_extension_case_and_dots_match_helpers(self):
+        """Mixed case and extra dots follow the extension helpers."""
+        files = ["x..MKV", "noext", "Movie.Mp4", "a.!QB", "b.INDEX"]
+        videos, unwanted = classify_files("/media/movies", files, set())
+        assert videos == ["x..MKV", "Movie.Mp4"]
+        assert unwanted == ["noext"]
+
+    @patch("plex_organizer.pipeline.get_sample_max_size_mb", return_value=1)
+    def test_large_sample_named_video_is_processed(self, _limit, tmp_path):
+        """A sample-named video above the size limit is treated as a real video."""
+        (tmp_path / "Sample.Movie.mkv").write_bytes(b"x" * 1024 * 1024)
+        videos, unwanted = classify_files(str(tmp_path), ["Sample.Movie.mkv"], set())
+        assert videos == ["Sample.Movie.mkv"]
+        assert not unwanted
+
+    def test_plex_folder_only_reports_unwanted(self):
+        """Plex Versions folders still get cleanup but no video processing."""
+        root = "/media/movies/Plex Versions/Optimized"
+        videos, unwanted = classify_files(root, ["v.mkv", "x.nfo"], set())
+        assert not videos
+        assert unwanted == ["x.nfo"]
+
+    def test_matches_separate_helpers(self, tmp_path):
+        """Unwanted files match what delete_unwanted_files removes."""
+        files = ["A.MKV", "b.Sample.mp4", "c.!qB", "d.jpg", "e.mp4"]
+        indexed = {join(str(tmp_path), "e.mp4")}
+        for name in files:
+            (tmp_path / name).write_text("x")
+
+        videos, unwanted = classify_files(str(tmp_path), files, indexed)
+        delete_unwanted_files(str(tmp_path), files)
+
+        assert videos == ["A.MKV"]
+        assert sorted(unwanted) == sorted(
+            f for f in files if not (tmp_path / f).exists()
+        )
+
+
+@mark.usefixtures("default_config")
+class TestWalkLibrary:  # pylint: disable=too-few-public-methods
+    """Tests for walk_library pruning."""
+
+    def test_does_not_descend_into_unwanted_folders(self, tmp_path):
+        """Unwanted folders are listed for removal but their files are not walked."""
+        root = tmp_path / "movies"
+        (root / "Extras").mkdir(parents=True)
+        (root / "Extras" / "Behind the Scenes.mkv").write_text("x")
+        (root / "Movie").mkdir()
+
+        result = list(walk_library(str(root)))
+
+        assert [r for r, _, _ in result] == [str(root / "Movie"), str(root)]
+        assert sorted(result[-1][1]) == ["Extras", "Movie"]
+
+
+@mark.usefixtures("default_config")
+class TestProcessRoot:
+    """Tests for process_root per-folder orchestration."""
+
+    @patch("plex_organizer.pipeline.move_directories")
+    @patch("plex_organizer.pipeline.analyze_video_languages")
+    def test_sample_video_is_deleted_not_moved(self, mock_analyze, mock_move, tmp_path):
+        """Sample videos are removed without being tagged or moved."""
+        (tmp_path / "Movie.mkv").write_text("x")
+        (tmp_path / "Movie.sample.mkv").write_text("x")
+        files = ["Movie.mkv", "Movie.sample.mkv"]
+
+        process_root(str(tmp_path), str(tmp_path), [], files, set())
+
+        mock_analyze.assert_called_once_with(str(tmp_path), ["Movie.mkv"])
+        mock_move.assert_called_once_with(str(tmp_path), str(tmp_path), ["Movie.mkv"])
+        assert not (tmp_path / "Movie.sample.mkv").exists()
+
+    @patch("plex_organizer.pipeline.move_directories")
+    @patch("plex_organizer.pipeline.analyze_video_languages")
+    def test_removes_unwanted_and_empty_folders(self, _analyze, _move, tmp_path):
+        """Unwanted subfolders and empty subfolders are cleaned up."""
+        (tmp_path / "Subs").mkdir()
+        (tmp_path / "empty").mkdir()
+        (tmp_path / "keep").mkdir()
+        (tmp_path / "keep" / "v.mkv").write_text("x")
+
+        process_root(str(tmp_path), str(tmp_path), ["Subs", "empty", "keep"], [], set())
+
+        assert not (tmp_path / "Subs").exists()
+        assert not (tmp_path / "empty").exists()
+        assert (tmp_path / "keep").exists()
 
 
 @mark.usefixtures("default_config")
@@ -166,16 +395,14 @@ class TestGetLock:
             _get_lock()
         assert mock_flock.call_count >= 0
 
-    @patch("plex_organizer.organizer.sleep")
     @patch("plex_organizer.organizer.log_debug")
-    def test_retries_on_lock_contention(self, mock_debug, mock_sleep, tmp_path):
-        """Retries and logs when the lock is held by another process."""
-        call_count = 0
-
-        def flock_side_effect(*_args, **_kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count < 3:
+    def test_blocks_on_lock_contention(self, mock_debug, tmp_path):
+        """A held lock is logged once, then waited for with a blocking flock."""
+        calls = []
+
+        def flock_side_effect(handle, flags):
+            calls.append((handle, flags))
+            if flags & LOCK_NB:
                 err = OSError("Resource temporarily unavailable")
                 err.errno = EAGAIN
                 raise err
@@ -186,8 +413,25 @@ class TestGetLock:
         ):
             _get_lock()
 
-        assert mock_sleep.call_count == 2
-        assert mock_debug.call_count == 2
+        assert [flags for _, flags in calls] == [LOCK_EX | LOCK_NB, LOCK_EX]
+        assert calls[0][0] is calls[1][0]
+        assert mock_debug.call_count == 1
+
+    def test_blocking_error_closes_handle(self, tmp_path):
+        """An error while waiting closes and resets the lock handle."""
+
+        def flock_side_effect(_handle, flags):
+            err = OSError("lock failed")
+            err.errno = EAGAIN if flags & LOCK_NB else EIO
+            raise err
+
+        with (
+            patch("plex_organizer.organizer.data_dir", return_value=str(tmp_path)),
+            patch("plex_organizer.organizer.flock", side_effect=flock_side_effect),
+            raises(OSError, match="lock failed"),
+        ):
+            _get_lock()
+        assert getattr(modules["plex_organizer.organizer"], "_lock_handle") is None
 
     def test_raises_on_non_contention_error(self, tmp_path):
         """Non-contention OSErrors (e.g. permission denied) are re-raised."""
@@ -233,6 +477,44 @@ class TestAnalyzeVideoLanguages:
         analyze_video_languages("/media/movies", ["video.langtag.mkv"])
         mock_tag.assert_not_called()
 
+    @patch("plex_organizer.pipeline.get_cpu_threads", return_value=4)
+    @patch("plex_organizer.pipeline.tag_audio_track_languages")
+    @patch("plex_organizer.pipeline.get_enable_audio_tagging", return_value=True)
+    def test_tags_every_video_concurrently(self, _mock_cfg, mock_tag, _threads):
+        """Every video in the folder is tagged when run through the pool."""
+        analyze_video_languages("/media/movies", ["a.mkv", "b.mkv", "c.mkv"])
+        assert sorted(c.args[0] for c in mock_tag.call_args_list) == [
+            "/media/movies/a.mkv",
+            "/media/movies/b.mkv",
+            "/media/movies/c.mkv",
+        ]
+        assert all(c.kwargs == {"stream_workers": 1} for c in mock_tag.call_args_list)
+
+    @patch("plex_organizer.pipeline.ThreadPoolExecutor")
+    @patch("plex_organizer.pipeline.get_tagging_workers", return_value=1)
+    @patch("plex_organizer.pipeline.tag_audio_track_languages")
+    @patch("plex_organizer.pipeline.get_enable_audio_tagging", return_value=True)
+    def test_single_worker_tags_inline(self, _mock_cfg, mock_tag, _workers, mock_pool):
+        """tagging_workers = 1 tags files in order without a thread pool."""
+        analyze_video_languages("/media/movies", ["a.mkv", "b.mkv"])
+        mock_pool.assert_not_called()
+        assert [c.args[0] for c in mock_tag.call_args_list] == [
+            "/media/movies/a.mkv",
+            "/media/movies/b.mkv",
+        ]
+
+    @patch("plex_organizer.pipeline.ThreadPoolExecutor")
+    @patch("plex_organizer.pipeline.get_cpu_threads", return_value=8)
+    @patch("plex_organizer.pipeline.get_tagging_workers", return_value=3)
+    @patch("plex_organizer.pipeline.tag_audio_track_languages")
+    @patch("plex_organizer.pipeline.get_enable_audio_tagging", return_value=True)
+    def test_tagging_workers_bounds_pool(
+        self, _mock_cfg, _tag, _workers, _threads, mock_pool
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """The pool size follows tagging_workers instead of cpu_threads."""
+        analyze_video_languages("/media/movies", ["a.mkv", "b.mkv", "c.mkv", "d.mkv"])
+        mock_pool.assert_called_once_with(max_workers=3)
+
 
 @mark.usefixtures("default_config")
 class TestDeleteUnwantedFilesErrors:  # pylint: disable=too-few-public-methods
@@ -331,25 +613,40 @@ class TestMoveDirectories:
         move_directories("/media/movies", "/media/movies/raw", ["video.langtag.mkv"])
         mock_move.assert_not_called()
 
+    @patch("plex_organizer.pipeline.mark_indexed")
+    @patch("plex_organizer.pipeline.should_index_video", return_value=True)
+    @patch("plex_organizer.pipeline.index_root_for_path", return_value="/media/tv")
+    @patch("plex_organizer.pipeline.tv_move", return_value="/media/tv/Show/S01E01.mkv")
+    @patch("plex_organizer.pipeline.is_tv_dir", return_value=True)
+    def test_classifies_folder_once(
+        self, mock_is_tv, mock_tv, _ir, _si, _mark
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """The TV/movie decision is made once per folder, not per file."""
+        move_directories("/media/tv", "/media/tv/Show", ["a.mkv", "b.mkv", "c.mkv"])
+        mock_is_tv.assert_called_once_with("/media/tv/Show")
+        assert mock_tv.call_count == 3
+
 
 @mark.usefixtures("default_config")
 class TestProcessDirectory:  # pylint: disable=too-few-public-methods
     """Tests for _process_directory orchestration."""
 
     @patch("plex_organizer.organizer.delete_empty_directories")
-    @patch("plex_organizer.organizer.move_directories")
-    @patch("plex_organizer.organizer.delete_unwanted_files")
-    @patch("plex_organizer.organizer.analyze_video_languages")
-    @patch("plex_organizer.organizer.get_video_files_to_process", return_value=[])
     @patch(
-        "plex_organizer.organizer.walk", return_value=[("/media/movies", [], ["v.mkv"])]
+        "plex_organizer.organizer.iter_tree",
+        return_value=iter([("/media/movies", ["v.mkv"])]),
+    )
+    @patch("plex_organizer.organizer.process_root")
+    @patch(
+        "plex_organizer.organizer.walk_library",
+        return_value=[("/media/movies", [], ["v.mkv"])],
     )
     @patch("plex_organizer.organizer.sync_subtitles_in_directory")
     @patch("plex_organizer.organizer.fetch_subtitles_in_directory")
     @patch("plex_organizer.organizer.merge_subtitles_in_directory")
     @patch(
         "plex_organizer.organizer.collect_indexed_videos",
-        return_value={"/media/movies/v.mkv": False},
+        return_value={"/media/movies/v.mkv": False, "/media/movies/done.mkv": True},
     )
     def test_calls_pipeline_in_order(
         self,
@@ -358,19 +655,27 @@ class TestProcessDirectory:  # pylint: disable=too-few-public-methods
         mock_fetch,
         mock_sync,
         _mock_walk,
-        _mock_vids,
-        _mock_analyze,
-        _mock_del_files,
-        _mock_move,
+        mock_process_root,
+        _mock_tree,
         mock_del_empty,
     ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
         """All pipeline steps are invoked for a directory."""
         _process_directory("/media/movies")
-        mock_collect.assert_called_once()
-        mock_merge.assert_called_once()
+        tree = [("/media/movies", ["v.mkv"])]
+        mock_collect.assert_called_once_with("/media/movies", tree)
+        mock_merge.assert_called_once_with(
+            "/media/movies", video_paths=["/media/movies/v.mkv"], tree=tree
+        )
         mock_fetch.assert_called_once()
         mock_sync.assert_called_once()
-        mock_del_empty.assert_called_once()
+        mock_process_root.assert_called_once_with(
+            "/media/movies",
+            "/media/movies",
+            [],
+            ["v.mkv"],
+            {"/media/movies/done.mkv"},
+        )
+        mock_del_empty.assert_called_once_with("/media/movies", already_swept=True)
 
 
 @mark.usefixtures("default_config")
@@ -389,8 +694,8 @@ class TestMain:
         self,
         _log,
         mock_rm,
-        _mf,
-        _md,
+        mock_mf,
+        mock_md,
         _cfg,
         _clr,
         _lock,
@@ -402,6 +707,8 @@ class TestMain:
         assert mock_proc.call_count == 2
         mock_proc.assert_any_call("/media/tv")
         mock_proc.assert_any_call("/media/movies")
+        mock_mf.assert_called_once_with("/media")
+        mock_md.assert_not_called()
 
     @patch("plex_organizer.organizer._process_directory")
     @patch("plex_organizer.organizer._get_lock")
@@ -429,10 +736,12 @@ class TestMain:
     @patch("plex_organizer.organizer.check_clear_log")
     @patch("plex_organizer.organizer.ensure_config_exists")
     @patch("plex_organizer.organizer.is_media_directory", return_value=False)
+    @patch("plex_organizer.organizer.is_main_folder", return_value=False)
     @patch("plex_organizer.organizer.log_debug")
     def test_non_media_directory_exits(
         self,
         mock_log,
+        _mf,
         _md,
         _cfg,
         _clr,
@@ -449,10 +758,12 @@ class TestMain:
     @patch("plex_organizer.organizer.check_clear_log")
     @patch("plex_organizer.organizer.ensure_config_exists")
     @patch("plex_organizer.organizer.is_media_directory", side_effect=OSError("disk"))
+    @patch("plex_organizer.organizer.is_main_folder", return_value=False)
     @patch("plex_organizer.organizer.log_debug")
     def test_oserror_caught_and_logged(
         self,
         _log,
+        _mf,
         _md,
         _cfg,
         _clr,
@@ -464,6 +775,50 @@ class TestMain:
         mock_err.assert_called_once()
         assert "disk" in mock_err.call_args[0][0]
 
+    @patch("plex_organizer.organizer._process_directory")
+    @patch("plex_organizer.organizer._get_lock")
+    @patch("plex_organizer.organizer.check_clear_log")
+    @patch("plex_organizer.organizer.ensure_config_exists")
+    @patch("plex_organizer.organizer.is_media_directory", return_value=False)
+    @patch("plex_organizer.organizer.is_main_folder", return_value=False)
+    @patch("plex_organizer.organizer.log_debug")
+    def test_torrent_removed_even_when_not_media(
+        self, _log, _mf, _md, _cfg, _clr, _lock, mock_proc
+    ):
+        """The removal finishes before main returns on the early-exit path."""
+        with patch("plex_organizer.organizer.remove_torrent") as mock_rm:
+            main("/tmp/random", "abc123")
+        mock_rm.assert_called_once_with("abc123")
+        mock_proc.assert_not_called()
+
+    @patch("plex_organizer.organizer.log_error")
+    @patch("plex_organizer.organizer._process_directory")
+    @patch("plex_organizer.organizer._get_lock")
+    @patch("plex_organizer.organizer.check_clear_log")
+    @patch("plex_organizer.organizer.ensure_config_exists")
+    @patch("plex_organizer.organizer.is_media_directory", return_value=True)
+    @patch("plex_organizer.organizer.is_main_folder", return_value=False)
+    @patch("plex_organizer.organizer.log_debug")
+    def test_torrent_removal_overlaps_processing(
+        self, _log, _mf, _md, _cfg, _clr, _lock, mock_proc, mock_err
+    ):
+        """Processing starts while removal is in flight; its errors are logged."""
+        started = Event()
+        processed = Event()
+
+        def slow_remove(_hash):
+            started.set()
+            assert processed.wait(5)
+            raise ValueError("bad host")
+
+        mock_proc.side_effect = lambda _dir: processed.set()
+        with patch("plex_organizer.organizer.remove_torrent", side_effect=slow_remove):
+            main("/media/tv/Show", "abc123")
+
+        assert started.is_set()
+        mock_proc.assert_called_once_with("/media/tv/Show")
+        assert "bad host" in mock_err.call_args[0][0]
+
     @patch("plex_organizer.organizer._process_directory")
     @patch("plex_organizer.organizer._get_lock")
     @patch("plex_organizer.organizer.check_clear_log")
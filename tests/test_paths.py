@@ -3,7 +3,7 @@
 from os.path import isdir
 from unittest.mock import patch
 
-from plex_organizer.paths import data_dir
+from plex_organizer.paths import data_dir, scratch_dir
 
 
 class TestDataDir:
@@ -67,3 +67,32 @@ class TestDataDir:
         assert result == "/root/.config/plex-organizer"
         mock_makedirs.assert_called_with("/root/.config/plex-organizer", exist_ok=True)
         data_dir.cache_clear()
+
+
+class TestScratchDir:
+    """Tests for scratch_dir tmpfs detection."""
+
+    def setup_method(self):
+        """Start each test with an empty cache."""
+        scratch_dir.cache_clear()
+
+    def teardown_method(self):
+        """Do not leak patched results into other tests."""
+        scratch_dir.cache_clear()
+
+    @patch("plex_organizer.paths.access", return_value=True)
+    @patch("plex_organizer.paths.isdir", return_value=True)
+    def test_uses_dev_shm_when_writable(self, _isdir, _access):
+        """/dev/shm is used when it exists and is writable."""
+        assert scratch_dir() == "/dev/shm"
+
+    @patch("plex_organizer.paths.isdir", return_value=False)
+    def test_falls_back_to_system_temp(self, _isdir):
+        """None (system temp dir) is returned without tmpfs."""
+        assert scratch_dir() is None
+
+    @patch("plex_organizer.paths.access", return_value=False)
+    @patch("plex_organizer.paths.isdir", return_value=True)
+    def test_read_only_shm_not_used(self, _isdir, _access):
+        """A non-writable /dev/shm is ignored."""
+        assert scratch_dir() is None
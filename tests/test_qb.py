@@ -1,39 +1,108 @@
 """Tests for plex_organizer.qb."""
 
+from http.client import RemoteDisconnected
 from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs
+
 from pytest import mark
 
 from plex_organizer.qb import remove_torrent
 
 
+def _response(status, text="", set_cookie=None):
+    """Build a mock http.client response."""
+    response = MagicMock(status=status)
+    response.read.return_value = text.encode()
+    response.msg.get_all.return_value = [set_cookie] if set_cookie else None
+    return response
+
+
+def _login_ok():
+    """Build a successful login response carrying a session cookie."""
+    return _response(200, "Ok.", "SID=cookie; HttpOnly; path=/")
+
+
+def _requests(connection):
+    """Return ``(path, form, headers)`` for every request sent on *connection*."""
+    return [
+        (c[0][1], parse_qs(c[0][2]), c[0][3]) for c in connection.request.call_args_list
+    ]
+
+
 @mark.usefixtures("default_config")
+@patch("plex_organizer.qb._connection", None)
+@patch("plex_organizer.qb._connection_host", None)
+@patch("plex_organizer.qb._session_cookie", None)
 class TestRemoveTorrent:
     """Tests for qBittorrent torrent removal."""
 
     def test_successful_removal(self):
         """Successful login and delete issues two POST calls."""
-        mock_session = MagicMock()
-        mock_login_response = MagicMock(status_code=200, text="Ok.")
-        mock_delete_response = MagicMock(status_code=200)
-        mock_session.post.side_effect = [mock_login_response, mock_delete_response]
+        connection = MagicMock()
+        connection.getresponse.side_effect = [_login_ok(), _response(200)]
 
-        with patch("plex_organizer.qb.Session", return_value=mock_session):
+        with patch(
+            "plex_organizer.qb.HTTPConnection", return_value=connection
+        ) as mock_cls:
+            remove_torrent("abc123")
+
+        mock_cls.assert_called_once_with("localhost:8081", timeout=10)
+        requests = _requests(connection)
+        assert len(requests) == 2
+        path, form, headers = requests[1]
+        assert path == "/api/v2/torrents/delete"
+        assert form == {"hashes": ["abc123"], "deleteFiles": ["false"]}
+        assert headers["Cookie"] == "SID=cookie"
+
+    def test_any_session_cookie_name_is_sent_back(self):
+        """qBittorrent 5.x cookies such as QBT_SID_<port> are kept and resent."""
+        connection = MagicMock()
+        connection.getresponse.side_effect = [
+            _response(200, "Ok.", "QBT_SID_8081=abc; HttpOnly; path=/"),
+            _response(200),
+        ]
+
+        with (
+            patch("plex_organizer.qb.HTTPConnection", return_value=connection),
+            patch("plex_organizer.qb.log_error") as mock_log,
+        ):
             remove_torrent("abc123")
 
-        assert mock_session.post.call_count == 2
-        delete_call = mock_session.post.call_args_list[1]
-        assert "torrents/delete" in delete_call[0][0]
-        assert delete_call[1]["data"]["hashes"] == "abc123"
-        assert delete_call[1]["data"]["deleteFiles"] == "false"
+        assert _requests(connection)[1][2]["Cookie"] == "QBT_SID_8081=abc"
+        mock_log.assert_not_called()
+
+    def test_every_set_cookie_header_is_kept(self):
+        """Cookies from several Set-Cookie headers are all sent back."""
+        login = _login_ok()
+        login.msg.get_all.return_value = ["SID=one; path=/", "other=two; path=/"]
+        connection = MagicMock()
+        connection.getresponse.side_effect = [login, _response(200)]
+
+        with patch("plex_organizer.qb.HTTPConnection", return_value=connection):
+            remove_torrent("abc123")
+
+        assert _requests(connection)[1][2]["Cookie"] == "SID=one; other=two"
+
+    def test_https_host_uses_tls_connection(self):
+        """An https host is reached through HTTPSConnection."""
+        connection = MagicMock()
+        connection.getresponse.side_effect = [_login_ok(), _response(200)]
+
+        with (
+            patch("plex_organizer.qb.get_host", return_value="https://qb.lan/qbt/"),
+            patch("plex_organizer.qb.HTTPSConnection", return_value=connection),
+        ):
+            remove_torrent("abc123")
+
+        assert _requests(connection)[1][0] == "/qbt/api/v2/torrents/delete"
 
     def test_auth_failure_logs_error(self):
         """Authentication failure is logged as an error."""
-        mock_session = MagicMock()
-        mock_login_response = MagicMock(status_code=403, text="Forbidden")
-        mock_session.post.return_value = mock_login_response
+        connection = MagicMock()
+        connection.getresponse.return_value = _response(403, "Forbidden")
 
         with (
-            patch("plex_organizer.qb.Session", return_value=mock_session),
+            patch("plex_organizer.qb.HTTPConnection", return_value=connection),
             patch("plex_organizer.qb.log_error") as mock_log,
         ):
             remove_torrent("abc123")
@@ -41,13 +110,14 @@ class TestRemoveTorrent:
 
     def test_delete_failure_logs_error(self):
         """Delete API failure is logged as an error."""
-        mock_session = MagicMock()
-        mock_login_response = MagicMock(status_code=200, text="Ok.")
-        mock_delete_response = MagicMock(status_code=500, text="Internal Error")
-        mock_session.post.side_effect = [mock_login_response, mock_delete_response]
+        connection = MagicMock()
+        connection.getresponse.side_effect = [
+            _login_ok(),
+            _response(500, "Internal Error"),
+        ]
 
         with (
-            patch("plex_organizer.qb.Session", return_value=mock_session),
+            patch("plex_organizer.qb.HTTPConnection", return_value=connection),
             patch("plex_organizer.qb.log_error") as mock_log,
         ):
             remove_torrent("abc123")
@@ -62,3 +132,101 @@ class TestRemoveTorrent:
         ):
             remove_torrent("abc123")
             mock_log.assert_called()
+
+    def test_connection_reused_across_calls(self):
+        """A second removal reuses the logged-in connection without a new login."""
+        connection = MagicMock()
+        connection.getresponse.side_effect = [
+            _login_ok(),
+            _response(200),
+            _response(200),
+        ]
+
+        with patch(
+            "plex_organizer.qb.HTTPConnection", return_value=connection
+        ) as mock_cls:
+            remove_torrent("abc123")
+            remove_torrent("def456")
+
+        mock_cls.assert_called_once()
+        paths = [path for path, _, _ in _requests(connection)]
+        assert paths.count("/api/v2/auth/login") == 1
+        assert paths.count("/api/v2/torrents/delete") == 2
+
+    def test_expired_session_logs_in_again(self):
+        """A 403 on delete triggers one re-login and a retry."""
+        connection = MagicMock()
+        connection.getresponse.side_effect = [
+            _login_ok(),
+            _response(403, "Forbidden"),
+            _login_ok(),
+            _response(200),
+        ]
+
+        with (
+            patch("plex_organizer.qb.HTTPConnection", return_value=connection),
+            patch("plex_organizer.qb.log_error") as mock_log,
+        ):
+            remove_torrent("abc123")
+
+        paths = [path for path, _, _ in _requests(connection)]
+        assert paths == [
+            "/api/v2/auth/login",
+            "/api/v2/torrents/delete",
+            "/api/v2/auth/login",
+            "/api/v2/torrents/delete",
+        ]
+        mock_log.assert_not_called()
+
+    def test_dropped_keep_alive_is_retried(self):
+        """A connection closed by the server is reopened and the request resent."""
+        connection = MagicMock()
+        connection.getresponse.side_effect = [
+            RemoteDisconnected("closed"),
+            _login_ok(),
+            _response(200),
+        ]
+
+        with (
+            patch("plex_organizer.qb.HTTPConnection", return_value=connection),
+            patch("plex_organizer.qb.log_error") as mock_log,
+        ):
+            remove_torrent("abc123")
+
+        connection.close.assert_called_once()
+        assert connection.request.call_count == 3
+        mock_log.assert_not_called()
+
+    def test_unreachable_host_logs_error(self):
+        """Connection errors are logged instead of raised."""
+        connection = MagicMock()
+        connection.request.side_effect = ConnectionRefusedError("refused")
+
+        with (
+            patch("plex_organizer.qb.HTTPConnection", return_value=connection),
+            patch("plex_organizer.qb.log_error") as mock_log,
+        ):
+            remove_torrent("abc123")
+
+        assert "Error contacting qBittorrent" in mock_log.call_args[0][0]
+
+    def test_multiple_hashes_sent_in_one_request(self):
+        """An iterable of hashes is removed with a single pipe-joined delete."""
+        connection = MagicMock()
+        connection.getresponse.side_effect = [_login_ok(), _response(200)]
+
+        with patch("plex_organizer.qb.HTTPConnection", return_value=connection):
+            remove_torrent(["abc123", "def456"])
+
+        deletes = [
+            form
+            for path, form, _ in _requests(connection)
+            if path == "/api/v2/torrents/delete"
+        ]
+        assert deletes == [{"hashes": ["abc123|def456"], "deleteFiles": ["false"]}]
+
+    def test_empty_hash_list_is_noop(self):
+        """No request is made when there is nothing to remove."""
+        with patch("plex_organizer.qb.HTTPConnection") as mock_cls:
+            remove_torrent([])
+        mock_cls.assert_not_called()
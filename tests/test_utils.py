@@ -1,20 +1,29 @@
 """Tests for plex_organizer.utils."""
 
-from os.path import basename, join
+from errno import EXDEV
+from os import remove, walk
+from os.path import join, splitext
 from unittest.mock import patch
 from pytest import mark
 
 from plex_organizer.utils import (
+    cached_exists,
     capitalize,
+    clear_stat_cache,
     create_name,
     find_corrected_directory,
-    find_folders,
+    forget_paths,
+    has_allowed_extension,
+    has_video_extension,
     is_main_folder,
     is_media_directory,
     is_plex_folder,
     is_script_temp_file,
     is_tv_dir,
+    iter_tree,
     move_file,
+    scandir_walk,
+    split_extension,
 )
 
 
@@ -33,27 +42,139 @@ class TestIsPlexFolder:
         """Partial match of 'Plex Versions' is not detected."""
         assert not is_plex_folder("/media/tv/Plex Versionsx/file.mkv")
 
-
-class TestFindFolders:
-    """Tests for find_folders directory listing."""
-
-    def test_returns_subdirectories(self, tmp_path):
-        """Only subdirectories are returned, not files."""
-        (tmp_path / "sub1").mkdir()
-        (tmp_path / "sub2").mkdir()
-        (tmp_path / "file.txt").write_text("x")
-        result = find_folders(str(tmp_path))
-        names = sorted(basename(p) for p in result)
-        assert names == ["sub1", "sub2"]
-
-    def test_returns_empty_for_nonexistent(self, tmp_path):
-        """Non-existent directory returns empty list."""
-        result = find_folders(str(tmp_path / "nonexistent"))
-        assert result == []
-
-    def test_returns_empty_for_empty_dir(self, tmp_path):
-        """Empty directory returns empty list."""
-        assert find_folders(str(tmp_path)) == []
+    @mark.parametrize(
+        "path",
+        ["Plex Versions", "/media/Plex Versions", "Plex Versions/Optimized"],
+    )
+    def test_segment_at_either_end(self, path):
+        """The folder is found as the first or last path segment."""
+        assert is_plex_folder(path)
+
+    def test_false_for_prefixed_segment(self):
+        """A segment that only ends in 'Plex Versions' is not detected."""
+        assert not is_plex_folder("/media/My Plex Versions/file.mkv")
+
+
+class TestStatCache:
+    """Tests for the per-run stat cache helpers."""
+
+    def test_results_are_reused(self, tmp_path):
+        """A second lookup does not touch the filesystem."""
+        clear_stat_cache()
+        with patch("plex_organizer.utils.stat", side_effect=OSError) as mock_stat:
+            assert not cached_exists(str(tmp_path / "a"))
+            assert not cached_exists(str(tmp_path / "a"))
+        mock_stat.assert_called_once()
+
+    def test_forget_paths_drops_subtree(self, tmp_path):
+        """Forgetting a folder also forgets the paths below it."""
+        folder = tmp_path / "movie"
+        assert not cached_exists(str(folder))
+        assert not cached_exists(str(folder / "m.mkv"))
+        folder.mkdir()
+        (folder / "m.mkv").write_text("x")
+        forget_paths(str(folder))
+        assert cached_exists(str(folder))
+        assert cached_exists(str(folder / "m.mkv"))
+
+    def test_move_file_invalidates(self, tmp_path):
+        """move_file keeps the cache in step with the moved file."""
+        src = tmp_path / "a.mkv"
+        dst = tmp_path / "b.mkv"
+        src.write_text("x")
+        assert not cached_exists(str(dst))
+        move_file(str(src), str(dst))
+        assert cached_exists(str(dst))
+        assert not cached_exists(str(src))
+
+
+class TestIterTree:
+    """Tests for iter_tree directory traversal."""
+
+    def test_yields_every_folder_with_its_files(self, tmp_path):
+        """Each folder is yielded with the files directly inside it."""
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "top.mkv").write_text("x")
+        (tmp_path / "a" / "b" / "deep.mkv").write_text("x")
+        result = {root: sorted(files) for root, files in iter_tree(str(tmp_path))}
+        assert result == {
+            str(tmp_path): ["top.mkv"],
+            join(str(tmp_path), "a"): [],
+            join(str(tmp_path), "a", "b"): ["deep.mkv"],
+        }
+
+    def test_skips_plex_versions_and_temp_files(self, tmp_path):
+        """Plex Versions folders and script temp files are left out."""
+        (tmp_path / "Plex Versions").mkdir()
+        (tmp_path / "Plex Versions" / "v.mkv").write_text("x")
+        (tmp_path / "v.langtag.mkv").write_text("x")
+        (tmp_path / "v.mkv").write_text("x")
+        assert list(iter_tree(str(tmp_path))) == [(str(tmp_path), ["v.mkv"])]
+
+    def test_plex_versions_root_yields_nothing(self, tmp_path):
+        """Starting inside a Plex Versions folder yields nothing."""
+        root = tmp_path / "Plex Versions"
+        root.mkdir()
+        assert not list(iter_tree(str(root)))
+
+    def test_missing_directory_yields_nothing(self, tmp_path):
+        """A missing directory is skipped like os.walk does."""
+        assert not list(iter_tree(str(tmp_path / "missing")))
+
+
+class TestScandirWalk:
+    """Tests for scandir_walk bottom-up traversal."""
+
+    def test_matches_os_walk_bottom_up(self, tmp_path):
+        """Folders, subfolder names and file names match os.walk(topdown=False)."""
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "c").mkdir()
+        (tmp_path / "top.mkv").write_text("x")
+        (tmp_path / "a" / "b" / "deep.srt").write_text("x")
+
+        def normalize(rows):
+            return {root: (sorted(dirs), sorted(files)) for root, dirs, files in rows}
+
+        result = list(scandir_walk(str(tmp_path)))
+        assert normalize(result) == normalize(walk(str(tmp_path), topdown=False))
+        assert result[-1][0] == str(tmp_path)
+
+    def test_children_before_parent(self, tmp_path):
+        """Every folder is yielded after all of its subfolders."""
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        roots = [root for root, _, _ in scandir_walk(str(tmp_path))]
+        assert roots == [
+            join(str(tmp_path), "a", "b"),
+            join(str(tmp_path), "a"),
+            str(tmp_path),
+        ]
+
+    def test_symlinked_folder_listed_not_followed(self, tmp_path):
+        """Symlinked folders show up in dirs but are not descended into."""
+        target = tmp_path / "target"
+        target.mkdir()
+        (target / "v.mkv").write_text("x")
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "link").symlink_to(target)
+
+        result = list(scandir_walk(str(root)))
+        assert result == [(str(root), ["link"], [])]
+
+    def test_missing_directory_yields_nothing(self, tmp_path):
+        """A missing directory is skipped like os.walk does."""
+        assert not list(scandir_walk(str(tmp_path / "missing")))
+
+    def test_pruned_folder_listed_not_descended(self, tmp_path):
+        """Pruned folder names are reported in dirs but never visited."""
+        (tmp_path / "Extras" / "deep").mkdir(parents=True)
+        (tmp_path / "keep").mkdir()
+
+        result = list(scandir_walk(str(tmp_path), frozenset({"Extras"})))
+
+        roots = [root for root, _, _ in result]
+        assert roots == [join(str(tmp_path), "keep"), str(tmp_path)]
+        assert sorted(result[-1][1]) == ["Extras", "keep"]
 
 
 @mark.usefixtures("default_config")
@@ -125,6 +246,7 @@ class TestMoveFile:
         dst = tmp_path / "renamed.mkv"
         src.write_text("data")
         with (
+            patch("plex_organizer.utils.link", side_effect=OSError(EXDEV, "xdev")),
             patch("plex_organizer.utils.move", side_effect=OSError("disk full")),
             patch("plex_organizer.utils.log_error") as mock_log,
         ):
@@ -132,6 +254,47 @@ class TestMoveFile:
             mock_log.assert_called_once()
             assert "failed to move" in mock_log.call_args[0][0].lower()
 
+    def test_move_keeps_inode(self, tmp_path):
+        """Same-filesystem moves keep the file itself rather than copying it."""
+        src = tmp_path / "file.mkv"
+        dst = tmp_path / "renamed.mkv"
+        src.write_text("data")
+        inode = src.stat().st_ino
+        move_file(str(src), str(dst))
+        assert dst.stat().st_ino == inode
+        assert dst.stat().st_nlink == 1
+
+    def test_falls_back_without_hard_links(self, tmp_path):
+        """Moves across filesystems go through shutil.move."""
+        src = tmp_path / "file.mkv"
+        dst = tmp_path / "renamed.mkv"
+        src.write_text("data")
+        with patch("plex_organizer.utils.link", side_effect=OSError(EXDEV, "xdev")):
+            move_file(str(src), str(dst))
+        assert dst.read_text() == "data"
+        assert not src.exists()
+
+    def test_failed_unlink_rolls_back(self, tmp_path):
+        """The new link is removed again when the source cannot be unlinked."""
+        src = tmp_path / "file.mkv"
+        dst = tmp_path / "renamed.mkv"
+        src.write_text("data")
+        real_remove = remove
+
+        def _remove(path):
+            if path == str(src):
+                raise OSError("busy")
+            real_remove(path)
+
+        with (
+            patch("plex_organizer.utils.remove", side_effect=_remove),
+            patch("plex_organizer.utils.log_error") as mock_log,
+        ):
+            move_file(str(src), str(dst))
+        mock_log.assert_called_once()
+        assert src.exists()
+        assert not dst.exists()
+
 
 @mark.usefixtures("default_config")
 class TestCreateName:
@@ -199,6 +362,17 @@ class TestIsMainFolder:
         """Empty folder is not a main folder."""
         assert not is_main_folder(str(tmp_path))
 
+    def test_false_when_tv_is_a_file(self, tmp_path):
+        """A plain file named tv does not make a main folder."""
+        (tmp_path / "tv").write_text("x")
+        assert not is_main_folder(str(tmp_path))
+
+    @patch("plex_organizer.utils.log_error")
+    def test_missing_directory_logs_error(self, mock_err, tmp_path):
+        """Unreadable folders are logged and treated as not main."""
+        assert not is_main_folder(str(tmp_path / "missing"))
+        mock_err.assert_called_once()
+
 
 class TestIsMediaDirectory:
     """Tests for is_media_directory detection."""
@@ -226,6 +400,49 @@ class TestIsMediaDirectory:
         assert not is_media_directory(str(d))
 
 
+class TestHasVideoExtension:
+    """Tests for has_video_extension."""
+
+    @mark.parametrize("name", ["a.mkv", "a.mp4", "a.MKV", "a.Mp4", "/x/y (2020).mkv"])
+    def test_video_names_accepted(self, name):
+        """Video extensions are recognised in any case."""
+        assert has_video_extension(name)
+
+    @mark.parametrize("name", ["a.srt", "a.mkv.part", "mkv", "a.avi", ""])
+    def test_other_names_rejected(self, name):
+        """Non-video names are rejected."""
+        assert not has_video_extension(name)
+
+
+class TestHasAllowedExtension:
+    """Tests for has_allowed_extension."""
+
+    @mark.parametrize(
+        "name",
+        ["movie.mkv", "MOVIE.MP4", "file.mkv.!qB", ".plex_organizer.index"],
+    )
+    def test_allowed_names_accepted(self, name):
+        """Filter extensions are accepted in any case."""
+        assert has_allowed_extension(name)
+
+    @mark.parametrize("name", ["readme.txt", "mkv", "movie.mkv.part", "sub.srt"])
+    def test_other_names_rejected(self, name):
+        """Other extensions and names without a dot are rejected."""
+        assert not has_allowed_extension(name)
+
+
+class TestSplitExtension:  # pylint: disable=too-few-public-methods
+    """Tests for split_extension."""
+
+    @mark.parametrize(
+        "name",
+        ["Movie (2020).mkv", "a.b.mp4", "noext", ".hidden", "..mkv", "trailing."],
+    )
+    def test_matches_splitext(self, name):
+        """Bare file names split exactly like os.path.splitext."""
+        assert split_extension(name) == splitext(name)
+
+
 class TestIsScriptTempFile:
     """Tests for is_script_temp_file detection."""
 